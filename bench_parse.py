@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Offline parse benchmark for Gen1Scraper
+
+Parses the saved Serebii pages in fixtures/serebii, checks the output against
+fixtures/expected, reports the parse time of every page section, pages/sec and
+peak memory, and fails when a result is worse than the stored baseline.
+"""
+
+import argparse
+import functools
+import http.server
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+
+from gen1_scraper import Gen1Scraper
+from page_index import PageIndex
+from parse_pool import ParsePool
+from parser_backend import PARSER_BACKENDS, make_soup
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+PAGES_DIR = os.path.join(FIXTURE_DIR, "serebii")
+EXPECTED_DIR = os.path.join(FIXTURE_DIR, "expected")
+BASELINE_FILE = os.path.join(FIXTURE_DIR, "bench_baseline.json")
+
+
+def load_pages():
+    """Read every saved page, keyed by its file name (e.g. 001.shtml)"""
+    pages = {}
+    for filename in sorted(os.listdir(PAGES_DIR)):
+        if filename.endswith('.shtml'):
+            with open(os.path.join(PAGES_DIR, filename), 'rb') as f:
+                pages[filename] = f.read()
+    return pages
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    """Keep-alive file handler that does not log every request"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FixtureServer:
+    """Stand-in for www.serebii.net serving the saved pages on localhost"""
+
+    def __init__(self, directory=PAGES_DIR):
+        handler = functools.partial(QuietHandler, directory=directory)
+        self.server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def check_output(scraper, pages):
+    """Parse every page and return the names of those that differ from fixtures/expected"""
+    mismatches = []
+    for filename, content in pages.items():
+        expected_file = os.path.join(EXPECTED_DIR, filename.replace('.shtml', '.json'))
+        with open(expected_file, 'r', encoding='utf-8') as f:
+            expected = f.read()
+        pokemon_data = scraper.parse_pokemon_page(content)
+        if json.dumps(pokemon_data, indent=2, ensure_ascii=False) != expected:
+            mismatches.append(filename)
+    return mismatches
+
+
+def time_sections(scraper, pages, repeat):
+    """
+    Milliseconds per page spent building the soup, indexing it and in each
+    section extractor (best of repeat runs per page)
+    """
+    names = ['soup', 'index'] + list(scraper.SECTIONS)
+    totals = dict.fromkeys(names, 0.0)
+    for content in pages.values():
+        best = dict.fromkeys(names, float('inf'))
+        for _ in range(repeat):
+            start = time.perf_counter()
+            soup = make_soup(content, scraper.parser)
+            parsed = time.perf_counter()
+            index = PageIndex(soup)
+            best['soup'] = min(best['soup'], parsed - start)
+            best['index'] = min(best['index'], time.perf_counter() - parsed)
+
+            pokemon_data = {}
+            for section in scraper.SECTIONS:
+                extractor = scraper.section_extractor(section)
+                start = time.perf_counter()
+                extractor(index, pokemon_data)
+                best[section] = min(best[section], time.perf_counter() - start)
+        for name in names:
+            totals[name] += best[name]
+    return {name: totals[name] * 1000 / len(pages) for name in names}
+
+
+def measure_throughput(scraper, pages, repeat, base_url=None):
+    """
+    Pages parsed per second (best of repeat runs); with base_url the pages
+    are also fetched from the stand-in server
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for filename, content in pages.items():
+            if base_url:
+                content = scraper.fetch(f"{base_url}/{filename}")
+            scraper.parse_pokemon_page(content)
+        best = min(best, time.perf_counter() - start)
+    return len(pages) / best
+
+
+def measure_scaling(scraper, pages, max_processes, repeat):
+    """
+    Pages parsed per second by a ParsePool of 1, 2, 4, ... max_processes
+    worker processes (best of repeat runs over several copies of the pages)
+    """
+    contents = list(pages.values()) * max(4, 2 * max_processes)
+    rates = {}
+    counts = sorted({min(2 ** power, max_processes) for power in range(max_processes.bit_length() + 1)})
+    for processes in counts:
+        pool = ParsePool(scraper, processes)
+        try:
+            # Start every worker before timing
+            list(pool.map(contents[:processes]))
+            best = float('inf')
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for _ in pool.map(contents):
+                    pass
+                best = min(best, time.perf_counter() - start)
+        finally:
+            pool.shutdown()
+        rates[processes] = len(contents) / best
+    return rates
+
+
+def measure_memory(scraper, pages):
+    """Peak memory in KB allocated by Python while parsing one page"""
+    peak = 0
+    for content in pages.values():
+        tracemalloc.start()
+        scraper.parse_pokemon_page(content)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return peak / 1024
+
+
+def find_regressions(results, baseline, tolerance):
+    """Compare results with the baseline and describe everything that got worse"""
+    regressions = []
+    for section, ms in results['sections_ms'].items():
+        base_ms = baseline.get('sections_ms', {}).get(section)
+        if base_ms and ms > base_ms * (1 + tolerance):
+            regressions.append(f"{section}: {ms:.2f} ms/page (baseline {base_ms:.2f})")
+    base_rate = baseline.get('pages_per_sec')
+    if base_rate and results['pages_per_sec'] < base_rate / (1 + tolerance):
+        regressions.append(f"pages/sec: {results['pages_per_sec']:.1f} (baseline {base_rate:.1f})")
+    base_memory = baseline.get('peak_memory_kb')
+    if base_memory and results['peak_memory_kb'] > base_memory * (1 + tolerance):
+        regressions.append(f"peak memory: {results['peak_memory_kb']:.0f} KB (baseline {base_memory:.0f})")
+    return regressions
+
+
+def main():
+    """Run the benchmark and compare it with the stored baseline"""
+    parser = argparse.ArgumentParser(description="Benchmark Gen1Scraper parsing on saved Serebii pages")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs per measurement; the best one counts (default: 5)")
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=None,
+                        help="HTML parser backend (default: fastest installed)")
+    parser.add_argument('--serve', action='store_true',
+                        help="fetch the pages over HTTP from a local stand-in server")
+    parser.add_argument('--processes', type=int, default=0,
+                        help="also measure how parsing scales over up to this many processes")
+    parser.add_argument('--tolerance', type=float, default=0.3,
+                        help="allowed slowdown against the baseline, as a fraction (default: 0.3)")
+    parser.add_argument('--baseline', default=BASELINE_FILE,
+                        help="baseline file to compare against")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="store this run as the new baseline instead of comparing")
+    args = parser.parse_args()
+
+    pages = load_pages()
+    scraper = Gen1Scraper(delay=0, parser=args.parser)
+    print(f"Benchmarking {len(pages)} pages with the {scraper.parser} parser")
+
+    mismatches = check_output(scraper, pages)
+    if mismatches:
+        print(f"✗ Output differs from fixtures/expected for: {', '.join(mismatches)}")
+
+    sections_ms = time_sections(scraper, pages, args.repeat)
+    if args.serve:
+        with FixtureServer() as server:
+            pages_per_sec = measure_throughput(scraper, pages, args.repeat, server.base_url)
+    else:
+        pages_per_sec = measure_throughput(scraper, pages, args.repeat)
+    results = {
+        'parser': scraper.parser,
+        'served': args.serve,
+        'sections_ms': sections_ms,
+        'pages_per_sec': pages_per_sec,
+        'peak_memory_kb': measure_memory(scraper, pages)
+    }
+
+    print("\nParse time per page:")
+    for section, ms in sections_ms.items():
+        print(f"  {section:<10} {ms:8.3f} ms")
+    print(f"  {'total':<10} {sum(sections_ms.values()):8.3f} ms")
+    print(f"\nPages/sec:   {pages_per_sec:.1f}{' (fetched over HTTP)' if args.serve else ''}")
+    print(f"Peak memory: {results['peak_memory_kb']:.0f} KB per page")
+
+    if args.processes:
+        print(f"\nParse processes ({os.cpu_count()} cores):")
+        for processes, rate in measure_scaling(scraper, pages, args.processes, args.repeat).items():
+            print(f"  {processes:3d}  {rate:8.1f} pages/sec  {rate / pages_per_sec:5.2f}x")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 1 if mismatches else 0
+
+    try:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    except OSError:
+        print("\nNo baseline found; run with --save-baseline to create one")
+        return 1 if mismatches else 0
+
+    if baseline.get('parser') != results['parser'] or baseline.get('served') != results['served']:
+        print(f"\nWarning: baseline was recorded with the {baseline.get('parser')} parser"
+              f"{' over HTTP' if baseline.get('served') else ''}; comparison may not be meaningful")
+
+    regressions = find_regressions(results, baseline, args.tolerance)
+    if regressions:
+        print("\n✗ Slower than baseline:")
+        for regression in regressions:
+            print(f"  {regression}")
+    else:
+        print("\n✓ No regressions against baseline")
+    return 1 if regressions or mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
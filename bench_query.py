@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Query benchmark: PokedexQuery indexes against linear scans
+
+Uses data/gen1/gen1_pokedex.json when a scrape has produced one; otherwise
+a 151-Pokémon Pokédex is assembled from the records in fixtures/expected.
+Every query is checked to return the same Pokémon both ways.
+"""
+
+import argparse
+import os
+import sys
+
+from bench_records import best_ms, fixture_pokedex
+from move_table import move_id
+from pokedex_query import PokedexQuery, dex_key, load_pokedex, name_key, places, tm_key
+
+
+def scan_name(pokedex, name):
+    return next((pokemon for pokemon in pokedex if name_key(pokemon['name']) == name_key(name)), None)
+
+
+def scan_type(pokedex, pokemon_type):
+    return [pokemon for pokemon in pokedex if pokemon_type in pokemon.get('types', [])]
+
+
+def scan_tm_move(pokedex, move):
+    return [pokemon for pokemon in pokedex
+            if any(PokedexQuery.entry_move_id(entry) == move_id(move)
+                   for entry in pokemon.get('moves', {}).get('tm_moves', []))]
+
+
+def scan_tm(pokedex, tm_number):
+    return [pokemon for pokemon in pokedex
+            if any(tm_key(entry.get('tm_number', '')) == tm_key(tm_number)
+                   for entry in pokemon.get('moves', {}).get('tm_moves', []))]
+
+
+def scan_place(pokedex, place):
+    return [pokemon for pokemon in pokedex
+            if any(name_key(place) in map(name_key, places(location.get('place')))
+                   for location in pokemon.get('locations', []))]
+
+
+def scan_family(pokedex, name):
+    """Every Pokémon linked to one by pevos/evos, rescanning until nothing is added"""
+    start = scan_name(pokedex, name)
+    family = {dex_key(start['number'])} if start else set()
+    grown = bool(family)
+    while grown:
+        grown = False
+        for pokemon in pokedex:
+            linked = {dex_key(pokemon['number'])}
+            linked.update(dex_key(evo['mon']) for evo in pokemon.get('pevos', []) + pokemon.get('evos', []))
+            if linked & family and not linked <= family:
+                family |= linked
+                grown = True
+    return [pokemon for pokemon in sorted(pokedex, key=lambda pokemon: dex_key(pokemon['number']))
+            if dex_key(pokemon['number']) in family]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare indexed Pokédex queries with linear scans")
+    parser.add_argument('--input', default="data/gen1/gen1_pokedex.json",
+                        help="Pokédex to query (default: data/gen1/gen1_pokedex.json, else the fixtures)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs per timing; the best one counts (default: 5)")
+    args = parser.parse_args()
+
+    if os.path.exists(args.input):
+        pokedex = load_pokedex(args.input)
+        source = args.input
+    else:
+        pokedex = fixture_pokedex()
+        source = "fixtures/expected (151 records)"
+
+    build_ms = best_ms(lambda: PokedexQuery(pokedex), args.repeat)
+    query = PokedexQuery(pokedex)
+    print(f"Pokédex: {source}, {len(pokedex)} Pokémon; indexes built in {build_ms:.1f} ms")
+
+    queries = [
+        ("name 'pikachu'", lambda: scan_name(pokedex, 'pikachu'), lambda: query.by_name('pikachu')),
+        ("type Water", lambda: scan_type(pokedex, 'Water'), lambda: query.of_type('Water')),
+        ("TM move Thunderbolt", lambda: scan_tm_move(pokedex, 'Thunderbolt'), lambda: query.learns_by_tm('Thunderbolt')),
+        ("TM06", lambda: scan_tm(pokedex, 'TM06'), lambda: query.tm('TM06')),
+        ("place Route 24", lambda: scan_place(pokedex, 'Route 24'), lambda: query.at('Route 24')),
+        ("family of Eevee", lambda: scan_family(pokedex, 'Eevee'), lambda: query.family('Eevee')),
+    ]
+    mismatches = []
+    print(f"\n{'Query':<22} {'scan ms':>10} {'index ms':>10} {'speedup':>9}")
+    for label, scan, lookup in queries:
+        if scan() != lookup():
+            mismatches.append(label)
+        scan_ms = best_ms(scan, args.repeat)
+        index_ms = best_ms(lookup, args.repeat)
+        print(f"{label:<22} {scan_ms:10.4f} {index_ms:10.4f} {scan_ms / max(index_ms, 1e-9):8.0f}x")
+
+    if mismatches:
+        print(f"\n✗ Index and scan disagree for: {', '.join(mismatches)}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
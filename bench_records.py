@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Memory and load-time comparison of plain JSON dicts and records.Pokemon
+
+Uses data/gen1/gen1_pokedex.json when a scrape has produced one; otherwise
+a 151-Pokémon Pokédex is assembled from the records in fixtures/expected.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from records import load_records
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def fixture_pokedex(size=151):
+    """size records built from the saved fixtures, renumbered 001..size"""
+    expected_dir = os.path.join(FIXTURE_DIR, "expected")
+    records = []
+    for filename in sorted(os.listdir(expected_dir)):
+        with open(os.path.join(expected_dir, filename), 'r', encoding='utf-8') as f:
+            records.append(json.load(f))
+    pokedex = []
+    for i in range(size):
+        pokemon = dict(records[i % len(records)])
+        pokemon['number'] = f"{i + 1:03d}"
+        pokedex.append(pokemon)
+    return pokedex
+
+
+def retained_kb(build):
+    """KB still allocated by the object build() returns"""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size / 1024
+
+
+def best_ms(function, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory and load time of dicts and typed records")
+    parser.add_argument('--input', default="data/gen1/gen1_pokedex.json",
+                        help="Pokédex to load (default: data/gen1/gen1_pokedex.json, else the fixtures)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs per timing; the best one counts (default: 5)")
+    args = parser.parse_args()
+
+    if os.path.exists(args.input):
+        with open(args.input, 'r', encoding='utf-8') as f:
+            text = f.read()
+        source = args.input
+    else:
+        text = json.dumps(fixture_pokedex(), indent=2, ensure_ascii=False)
+        source = "fixtures/expected (151 records)"
+    pokedex = json.loads(text)
+    records = load_records(pokedex)
+
+    mismatches = [pokemon['number'] for pokemon, record in zip(pokedex, records) if record.to_json() != pokemon]
+    if mismatches:
+        print(f"✗ to_json() differs from the input for: {', '.join(mismatches)}")
+
+    print(f"Pokédex: {source}, {len(pokedex)} Pokémon")
+    print(f"\nMemory held:    dicts {retained_kb(lambda: json.loads(text)):8.0f} KB   "
+          f"records {retained_kb(lambda: load_records(json.loads(text))):8.0f} KB")
+    load_ms = best_ms(lambda: json.loads(text), args.repeat)
+    records_ms = best_ms(lambda: load_records(json.loads(text)), args.repeat)
+    print(f"Load time:      dicts {load_ms:8.1f} ms   records {records_ms:8.1f} ms "
+          f"(from_json {records_ms - load_ms:.1f} ms)")
+    print(f"to_json:        {best_ms(lambda: [record.to_json() for record in records], args.repeat):8.1f} ms")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
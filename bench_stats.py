@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Stat benchmark: StatEngine against a Python loop over the same grid
+
+Uses data/gen1/gen1_pokedex.json when a scrape has produced one; otherwise
+a 151-Pokémon Pokédex is assembled from the records in fixtures/expected.
+Needs NumPy (pip install numpy).
+"""
+
+import argparse
+import math
+import os
+import sys
+
+import numpy as np
+
+from bench_records import best_ms, fixture_pokedex
+from pokedex_query import load_pokedex
+from stat_engine import STATS, StatEngine, dv_spread
+
+
+def loop_stat(base, dv, stat_exp, level, hp):
+    bonus = min(math.ceil(math.sqrt(stat_exp)), 255) // 4
+    stat = ((base + dv) * 2 + bonus) * level // 100
+    return stat + level + 10 if hp else stat + 5
+
+
+def loop_grid(pokedex, levels, dvs, stat_exps):
+    """Every Pokémon at every level, DV and Stat Exp, one stat at a time"""
+    results = []
+    for pokemon in pokedex:
+        base = [int(pokemon['stats']['base_stats'][stat]) for stat in STATS]
+        for level in levels:
+            for dv in dvs:
+                # Same DV for Attack, Defense, Special and Speed
+                hp_dv = 15 if dv & 1 else 0
+                for stat_exp in stat_exps:
+                    results.append([loop_stat(base[0], hp_dv, stat_exp, level, True)] +
+                                   [loop_stat(value, dv, stat_exp, level, False) for value in base[1:]])
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the vectorized stat engine with a Python loop")
+    parser.add_argument('--input', default="data/gen1/gen1_pokedex.json",
+                        help="Pokédex to use (default: data/gen1/gen1_pokedex.json, else the fixtures)")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="runs per timing; the best one counts (default: 3)")
+    args = parser.parse_args()
+
+    if os.path.exists(args.input):
+        pokedex = load_pokedex(args.input)
+        source = args.input
+    else:
+        pokedex = fixture_pokedex()
+        source = "fixtures/expected (151 records)"
+    pokedex.sort(key=lambda pokemon: int(pokemon['number']))
+
+    engine = StatEngine(pokedex)
+    levels = list(range(1, 101))
+    dvs = list(range(16))
+    stat_exps = [0, 65535]
+
+    def vectorized():
+        dv = np.array(dvs)[None, :, None]
+        return engine.calculate(level=np.array(levels)[:, None, None],
+                                dvs=dv_spread(dv, dv, dv, dv),
+                                stat_exp=np.array(stat_exps)[None, None, :, None])
+
+    same = vectorized().reshape(-1, len(STATS)).tolist() == loop_grid(pokedex, levels, dvs, stat_exps)
+    configurations = len(pokedex) * len(levels) * len(dvs) * len(stat_exps)
+
+    print(f"Pokédex: {source}, {len(pokedex)} Pokémon")
+    print(f"\nGrid of {configurations:,} configurations (levels 1-100 x 16 DVs x 2 Stat Exp)")
+    print(f"  loop    {best_ms(lambda: loop_grid(pokedex, levels, dvs, stat_exps), args.repeat):9.1f} ms")
+    print(f"  engine  {best_ms(vectorized, args.repeat):9.1f} ms")
+
+    mismatches = engine.check()
+    print(f"\nScraped max_stats cells that disagree with the formula: {len(mismatches)}")
+    for name, level_key, stat, scraped, calculated in mismatches:
+        print(f"  {name} {level_key} {stat}: page says {scraped}, formula gives {calculated}")
+    if not same:
+        print("\n✗ Engine and loop disagree")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
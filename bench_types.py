@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Matchup benchmark: TypeMatrix against Python loops over damage_taken
+
+Uses data/gen1/gen1_pokedex.json when a scrape has produced one; otherwise
+a 151-Pokémon Pokédex is assembled from the records in fixtures/expected.
+Needs NumPy (pip install numpy).
+"""
+
+import argparse
+import math
+import os
+import sys
+
+from bench_records import best_ms, fixture_pokedex
+from pokedex_query import load_pokedex
+from type_matrix import TypeMatrix, to_multiplier
+
+
+def loop_stab_matchups(pokedex):
+    """The 151 x 151 STAB scores, parsing the multiplier strings as it goes"""
+    scores = []
+    for attacker in pokedex:
+        row = []
+        for defender in pokedex:
+            multipliers = [to_multiplier(defender['damage_taken'][own_type])
+                           for own_type in attacker.get('types', []) if own_type in defender['damage_taken']]
+            row.append(max(multipliers) if multipliers else float('nan'))
+        scores.append(row)
+    return scores
+
+
+def loop_best_attacking_type(pokedex, defenders):
+    chosen = [pokemon for pokemon in pokedex if pokemon['name'] in defenders]
+    totals = {}
+    for pokemon in chosen:
+        for attacking_type, multiplier in pokemon['damage_taken'].items():
+            totals[attacking_type] = totals.get(attacking_type, 0) + to_multiplier(multiplier)
+    return max(totals, key=lambda attacking_type: totals[attacking_type])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare vectorized matchups with Python loops")
+    parser.add_argument('--input', default="data/gen1/gen1_pokedex.json",
+                        help="Pokédex to use (default: data/gen1/gen1_pokedex.json, else the fixtures)")
+    parser.add_argument('--repeat', type=int, default=5,
+                        help="runs per timing; the best one counts (default: 5)")
+    args = parser.parse_args()
+
+    if os.path.exists(args.input):
+        pokedex = load_pokedex(args.input)
+        source = args.input
+    else:
+        pokedex = fixture_pokedex()
+        source = "fixtures/expected (151 records)"
+    pokedex.sort(key=lambda pokemon: int(pokemon['number']))
+    defenders = sorted({pokemon['name'] for pokemon in pokedex})[:6]
+
+    matrix = TypeMatrix(pokedex)
+    loop_scores = loop_stab_matchups(pokedex)
+    same = all(math.isclose(a, b) or (math.isnan(a) and math.isnan(b))
+               for loop_row, row in zip(loop_scores, matrix.stab_matchups().tolist())
+               for a, b in zip(loop_row, row))
+    same = same and loop_best_attacking_type(pokedex, defenders) == matrix.best_attacking_types(defenders, 1)[0][0]
+
+    print(f"Pokédex: {source}, {len(pokedex)} Pokémon, {len(matrix.types)} attacking types")
+    print(f"\nBuild matrix:          {best_ms(lambda: TypeMatrix(pokedex), args.repeat):8.2f} ms")
+    print(f"STAB matchups  loops   {best_ms(lambda: loop_stab_matchups(pokedex), args.repeat):8.2f} ms   "
+          f"matrix {best_ms(matrix.stab_matchups, args.repeat):8.2f} ms")
+    print(f"Best type      loops   {best_ms(lambda: loop_best_attacking_type(pokedex, defenders), args.repeat):8.3f} ms   "
+          f"matrix {best_ms(lambda: matrix.best_attacking_types(defenders), args.repeat):8.3f} ms")
+    if not same:
+        print("\n✗ Matrix and loops disagree")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
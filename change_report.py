@@ -0,0 +1,76 @@
+import threading
+
+from output_sink import OutputSink
+
+
+def changed_fields(old, new, prefix=''):
+    """
+    Dotted paths of the values that differ between two records, e.g.
+    "stats.base_stats.Speed"; lists are compared as a whole
+    """
+    paths = []
+    for key in list(old) + [key for key in new if key not in old]:
+        path = prefix + key
+        if key not in old or key not in new:
+            paths.append(path)
+        elif isinstance(old[key], dict) and isinstance(new[key], dict):
+            paths.extend(changed_fields(old[key], new[key], path + '.'))
+        elif old[key] != new[key]:
+            paths.append(path)
+    return paths
+
+
+class ChangeReport:
+    """
+    What an incremental run found changed since the records saved last time
+
+    Every scraped Pokémon is compared with its saved record and the report
+    lists the new ones and, for changed ones, the fields that differ. stats
+    counts the pages that were not parsed at all because they were
+    unchanged, and the sections copied from saved records or extracted.
+    """
+
+    def __init__(self):
+        self.new = []
+        self.changed = {}
+        self.unchanged = 0
+        self.stats = {'pages_unchanged': 0, 'sections_reused': 0, 'sections_extracted': 0}
+        self._lock = threading.Lock()
+
+    def count(self, stat):
+        with self._lock:
+            self.stats[stat] += 1
+
+    def merge_stats(self, counts):
+        """Add the counts of another report, e.g. from a parse process"""
+        with self._lock:
+            for name, count in counts.items():
+                self.stats[name] += count
+
+    def add(self, number, pokemon_data, previous):
+        """Compare a Pokémon with its previously saved record (None if it had none)"""
+        with self._lock:
+            if previous is None:
+                self.new.append(number)
+                return
+            fields = changed_fields(previous, pokemon_data)
+            if fields:
+                self.changed[number] = {'name': pokemon_data.get('name'), 'fields': fields}
+            else:
+                self.unchanged += 1
+
+    def summary(self):
+        return (f"Changes: {len(self.changed)} changed, {len(self.new)} new, {self.unchanged} unchanged; "
+                f"pages not reparsed: {self.stats['pages_unchanged']}, sections reused: "
+                f"{self.stats['sections_reused']}, extracted: {self.stats['sections_extracted']}")
+
+    def save(self, path, sink=None):
+        """Write the report as JSON through an OutputSink"""
+        report = {
+            'changed': dict(sorted(self.changed.items())),
+            'new': sorted(self.new),
+            'unchanged': self.unchanged,
+            'stats': dict(self.stats)
+        }
+        (sink or OutputSink()).write_json(path, report)
+        print(f"Change report saved to {path}")
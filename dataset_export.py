@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Export the scraped Pokédex as a typed, indexed SQLite database
+
+Nested fields are flattened into one table each (pokemon, stats,
+type_effectiveness, moves, learnsets, tms, locations and evolutions) and
+numbers are stored as numbers, so queries need neither a JSON parse nor
+string conversions.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+
+from evolution_chain import EvolutionGraph
+from move_table import MOVE_FIELDS, move_id
+from pokedex_writer import read_pokedex
+from records import to_inches
+
+NUMBER_PATTERN = re.compile(r'-?\d+(?:\.\d+)?')
+
+SCHEMA = """
+CREATE TABLE pokemon (
+    number INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    type1 TEXT,
+    type2 TEXT,
+    classification TEXT,
+    height_m REAL,
+    height_in INTEGER,
+    weight_kg REAL,
+    weight_lbs REAL,
+    capture_rate INTEGER,
+    base_total INTEGER,
+    exp_points INTEGER,
+    growth_rate TEXT,
+    name_japanese TEXT,
+    name_japanese_kana TEXT,
+    name_french TEXT,
+    name_german TEXT,
+    name_korean TEXT
+);
+CREATE TABLE stats (
+    number INTEGER NOT NULL,
+    stat TEXT NOT NULL,
+    base INTEGER,
+    effort_value INTEGER,
+    lv50_min INTEGER,
+    lv50_max INTEGER,
+    lv100_min INTEGER,
+    lv100_max INTEGER,
+    PRIMARY KEY (number, stat)
+);
+CREATE TABLE type_effectiveness (
+    number INTEGER NOT NULL,
+    attacking_type TEXT NOT NULL,
+    multiplier REAL,
+    PRIMARY KEY (number, attacking_type)
+);
+CREATE TABLE moves (
+    move_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    type TEXT,
+    power INTEGER,
+    accuracy INTEGER,
+    pp INTEGER,
+    effect INTEGER,
+    description TEXT
+);
+CREATE TABLE learnsets (
+    number INTEGER NOT NULL,
+    level INTEGER,
+    move_id TEXT NOT NULL
+);
+CREATE TABLE tms (
+    number INTEGER NOT NULL,
+    machine TEXT NOT NULL,
+    move_id TEXT NOT NULL
+);
+CREATE TABLE locations (
+    number INTEGER NOT NULL,
+    game TEXT NOT NULL,
+    place TEXT
+);
+CREATE TABLE evolutions (
+    from_number INTEGER NOT NULL,
+    to_number INTEGER NOT NULL,
+    method TEXT,
+    level INTEGER,
+    PRIMARY KEY (from_number, to_number)
+);
+CREATE INDEX pokemon_type1 ON pokemon (type1);
+CREATE INDEX pokemon_type2 ON pokemon (type2);
+CREATE INDEX type_effectiveness_type ON type_effectiveness (attacking_type, multiplier);
+CREATE INDEX learnsets_number ON learnsets (number);
+CREATE INDEX learnsets_move ON learnsets (move_id);
+CREATE INDEX tms_number ON tms (number);
+CREATE INDEX tms_move ON tms (move_id);
+CREATE INDEX locations_number ON locations (number);
+CREATE INDEX locations_game ON locations (game);
+CREATE INDEX evolutions_to ON evolutions (to_number);
+"""
+
+
+def to_int(text):
+    """The integer in text such as "45" or "1,059,860", or None for "--" and blanks"""
+    match = NUMBER_PATTERN.search((text or '').replace(',', ''))
+    return int(float(match.group())) if match else None
+
+
+def to_float(text):
+    """The number in text such as "0.7m" or "0.25", or None"""
+    match = NUMBER_PATTERN.search((text or '').replace(',', ''))
+    return float(match.group()) if match else None
+
+
+def to_height_inches(text):
+    """An imperial height such as 2'04" in inches, or None"""
+    inches = to_inches(text)
+    return inches if isinstance(inches, int) else None
+
+
+def stat_range(text):
+    """The (min, max) of a range such as "105 - 151" """
+    values = [int(value) for value in re.findall(r'\d+', text or '')]
+    if not values:
+        return None, None
+    return values[0], values[-1]
+
+
+class SQLiteExporter:
+    """Collects the rows of every table and writes them in one transaction"""
+
+    def __init__(self, moves=None):
+        # Move details by move ID; normalized learnsets are resolved against it
+        self.moves = dict(moves or {})
+        self.rows = {table: [] for table in ('pokemon', 'stats', 'type_effectiveness', 'learnsets',
+                                             'tms', 'locations')}
+
+    def add(self, pokemon):
+        number = int(pokemon['number'])
+        types = pokemon.get('types', [])
+        stats = pokemon.get('stats', {})
+        base_stats = stats.get('base_stats', {})
+        other_names = pokemon.get('other_names', {})
+        japan = other_names.get('Japan', {})
+        experience = pokemon.get('experience_growth', {})
+        self.rows['pokemon'].append((
+            number, pokemon.get('name', ''),
+            types[0] if types else None, types[1] if len(types) > 1 else None,
+            pokemon.get('classification'),
+            to_float(pokemon.get('height', {}).get('metric')), to_height_inches(pokemon.get('height', {}).get('imperial')),
+            to_float(pokemon.get('weight', {}).get('metric')), to_float(pokemon.get('weight', {}).get('imperial')),
+            to_int(pokemon.get('capture_rate')), to_int(base_stats.get('bst')),
+            to_int(experience.get('points')), experience.get('rate'),
+            japan.get('0'), japan.get('1'),
+            other_names.get('French'), other_names.get('German'), other_names.get('Korean')
+        ))
+
+        max_stats = stats.get('max_stats', {})
+        effort_values = pokemon.get('effort_values', {})
+        for stat, base in base_stats.items():
+            if stat == 'bst':
+                continue
+            self.rows['stats'].append((
+                number, stat, to_int(base), to_int(effort_values.get(stat)),
+                *stat_range(max_stats.get('lv_50', {}).get(stat)),
+                *stat_range(max_stats.get('lv_100', {}).get(stat))
+            ))
+
+        for attacking_type, multiplier in pokemon.get('damage_taken', {}).items():
+            self.rows['type_effectiveness'].append((number, attacking_type, to_float(multiplier)))
+
+        moves = pokemon.get('moves', {})
+        for entry in moves.get('learnset', []):
+            self.rows['learnsets'].append((number, to_int(entry.get('level')), self.add_move(entry)))
+        for entry in moves.get('tm_moves', []):
+            self.rows['tms'].append((number, entry.get('tm_number'), self.add_move(entry)))
+
+        for location in pokemon.get('locations', []):
+            self.rows['locations'].append((number, location.get('game'), location.get('place')))
+
+    def add_move(self, entry):
+        """The move ID of a learnset or TM entry, remembering its details"""
+        if 'move' in entry:
+            return entry['move']
+        reference = move_id(entry.get('name', ''))
+        self.moves.setdefault(reference, {field: entry.get(field, '') for field in MOVE_FIELDS})
+        return reference
+
+    def write(self, path, evolutions):
+        """Write every table to a new database at path"""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        temp_path = f"{path}.tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                connection.executescript(SCHEMA)
+                for table, rows in self.rows.items():
+                    if rows:
+                        placeholders = ', '.join('?' * len(rows[0]))
+                        connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", rows)
+                connection.executemany("INSERT INTO moves VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [
+                    (reference, details.get('name', ''), details.get('type'), to_int(details.get('power')),
+                     to_int(details.get('accuracy')), to_int(details.get('pp')), to_int(details.get('effect')),
+                     details.get('description'))
+                    for reference, details in sorted(self.moves.items())
+                ])
+                connection.executemany("INSERT OR IGNORE INTO evolutions VALUES (?, ?, ?, ?)", evolutions)
+        finally:
+            connection.close()
+        # Swap the finished database in so readers never see a half-written one
+        os.replace(temp_path, path)
+
+
+def export_sqlite(pokedex, path, moves=None):
+    """
+    Export a Pokédex (any iterable of Pokémon, e.g. read_pokedex()) to an
+    SQLite database at path; moves is the move table of a normalized Pokédex
+    """
+    exporter = SQLiteExporter(moves)
+    graph = {}
+    for pokemon in pokedex:
+        exporter.add(pokemon)
+        graph[pokemon['number']] = {'number': pokemon['number'], 'pevos': pokemon.get('pevos', []),
+                                    'evos': pokemon.get('evos', [])}
+
+    evolutions = []
+    for number, node in EvolutionGraph.build(graph.values()).items():
+        for evo in node['evolves_into']:
+            evolutions.append((int(number), int(evo['mon']), evo['method'], to_int(evo['level'])))
+
+    exporter.write(path, evolutions)
+    print(f"Exported {len(exporter.rows['pokemon'])} Pokémon to {path}")
+    return path
+
+
+def main():
+    """Export an existing gen1_pokedex.ndjson (or .json) without scraping"""
+    parser = argparse.ArgumentParser(description="Export the scraped Pokédex to SQLite")
+    parser.add_argument('--input', default="data/gen1/gen1_pokedex.ndjson",
+                        help="Pokédex to export, NDJSON or a JSON array (default: data/gen1/gen1_pokedex.ndjson)")
+    parser.add_argument('--moves', default="data/gen1/moves.json",
+                        help="move table of a normalized Pokédex, if there is one")
+    parser.add_argument('--output', default="data/gen1/gen1_pokedex.sqlite",
+                        help="database to write (default: data/gen1/gen1_pokedex.sqlite)")
+    args = parser.parse_args()
+
+    if args.input.endswith('.ndjson'):
+        pokedex = read_pokedex(args.input)
+    else:
+        with open(args.input, 'r', encoding='utf-8') as f:
+            pokedex = json.load(f)
+    moves = None
+    if os.path.exists(args.moves):
+        with open(args.moves, 'r', encoding='utf-8') as f:
+            moves = json.load(f)
+    export_sqlite(pokedex, args.output, moves)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
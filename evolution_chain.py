@@ -0,0 +1,290 @@
+import re
+import threading
+from bs4 import Tag
+
+from output_sink import OutputSink
+
+# Number of the Pokémon a /pokearth/sprites/ image shows
+SPRITE_NUMBER_PATTERN = re.compile(r'/(\d+)\.png$')
+# Level of a level-up evolution icon such as evoicon/l16.png
+LEVEL_ICON_PATTERN = re.compile(r'/l(\d+)\.png$')
+
+STONES = ('thunderstone', 'waterstone', 'firestone', 'leafstone', 'moonstone')
+EEVEE_FAMILY = ('133', '134', '135', '136')
+DEFAULT_METHOD = ('level', '--')
+
+
+def icon_method(src, levels=True):
+    """
+    The (method, level) an evolution icon stands for, or None if the icon
+    is not recognised (level icons are only read when levels is True)
+    """
+    for stone in STONES:
+        if stone in src:
+            return stone, '--'
+    if 'trade' in src:
+        return 'trade', '--'
+    if levels:
+        level_match = LEVEL_ICON_PATTERN.search(src)
+        if level_match:
+            return 'level', level_match.group(1)
+    return None
+
+
+class ChainCell:
+    """Sprite numbers and evolution icons found inside one td of an evochain table"""
+    __slots__ = ('sprites', 'icons')
+
+    def __init__(self):
+        self.sprites = []
+        self.icons = []
+
+
+class EvolutionChain:
+    """
+    Evolution links read from one evochain table
+
+    Every img in the table is classified once, as a Pokémon sprite or an
+    evolution icon, and credited to each td that contains it. The first row
+    holds the main chain; further rows hold Eevee's branches, whose targets
+    are the table's pkmn cells.
+    """
+
+    def __init__(self, table):
+        self.rows = []        # td cells under every tr, like tr.find_all('td')
+        self.pkmn_cells = []  # every td with class pkmn, in page order
+        self._relatives = {}
+        self._build(table)
+        self.chain = self._link()
+
+    def _build(self, table):
+        row_cells = {}
+        cells = {}
+        for tag in table.descendants:
+            if tag.__class__ is not Tag:
+                continue
+            if tag.name == 'tr':
+                row_cells[id(tag)] = []
+                self.rows.append(row_cells[id(tag)])
+            elif tag.name == 'td':
+                cell = cells[id(tag)] = ChainCell()
+                if 'pkmn' in (tag.get('class') or ()):
+                    self.pkmn_cells.append(cell)
+                for parent in tag.parents:
+                    if parent is table:
+                        break
+                    if id(parent) in row_cells:
+                        row_cells[id(parent)].append(cell)
+            elif tag.name == 'img':
+                src = tag.get('src')
+                if not src or not src.endswith('.png'):
+                    continue
+                sprite_match = SPRITE_NUMBER_PATTERN.search(src) if '/pokearth/sprites/' in src else None
+                is_icon = 'evoicon/' in src
+                if not sprite_match and not is_icon:
+                    continue
+                for parent in tag.parents:
+                    if parent is table:
+                        break
+                    cell = cells.get(id(parent))
+                    if cell is None:
+                        continue
+                    if sprite_match:
+                        cell.sprites.append(sprite_match.group(1))
+                    if is_icon:
+                        cell.icons.append(src)
+
+    @property
+    def main_cells(self):
+        return self.rows[0] if self.rows else []
+
+    def _link(self):
+        """
+        The chain as (number, method, level) entries: every main row and pkmn
+        cell Pokémon with the icon that leads to it, then the pkmn cells again
+        with the icons inside them
+        """
+        if not self.rows:
+            return []
+        main_cells = self.main_cells
+        methods = {}
+        for cell in main_cells:
+            for number in cell.sprites:
+                methods[number] = DEFAULT_METHOD
+        for cell in self.pkmn_cells:
+            for number in cell.sprites:
+                methods.setdefault(number, DEFAULT_METHOD)
+
+        # An icon in main cell i is the evolution from cell i-1 to cell i+1
+        for i in range(1, len(main_cells) - 1):
+            if main_cells[i].icons and main_cells[i - 1].sprites:
+                method = icon_method(main_cells[i].icons[-1]) or DEFAULT_METHOD
+                for number in main_cells[i + 1].sprites:
+                    if number in methods:
+                        methods[number] = method
+
+        # Eevee's branch icons sit in the later rows; cell i leads to pkmn cell i+1
+        is_eevee_family = any(number in EEVEE_FAMILY for cell in main_cells for number in cell.sprites)
+        if len(self.rows) > 1 and is_eevee_family:
+            for row in self.rows[1:]:
+                for i, cell in enumerate(row):
+                    if cell.icons and i + 1 < len(self.pkmn_cells):
+                        method = icon_method(cell.icons[-1], levels=False) or DEFAULT_METHOD
+                        for number in self.pkmn_cells[i + 1].sprites:
+                            if number in methods:
+                                methods[number] = method
+
+        chain = [(number, method, level) for number, (method, level) in methods.items()]
+        for cell in self.pkmn_cells:
+            method = self.apply_icons(DEFAULT_METHOD, cell.icons)
+            for number in cell.sprites:
+                chain.append((number,) + method)
+        return chain
+
+    @staticmethod
+    def apply_icons(method, icons):
+        """Let each recognised icon in turn override method"""
+        for src in icons:
+            method = icon_method(src) or method
+        return method
+
+    def relatives(self, number):
+        """
+        The previous and next evolutions of Pokémon number, as the pevos and
+        evos lists of its JSON (empty if it is not in this chain)
+        """
+        if number not in self._relatives:
+            self._relatives[number] = self._find_relatives(number)
+        return self._relatives[number]
+
+    def _find_relatives(self, number):
+        pevos = []
+        evos = []
+        current_index = next((i for i, entry in enumerate(self.chain) if entry[0] == number), None)
+        if current_index is None:
+            return pevos, evos
+
+        main_cells = self.main_cells
+        positions = {}
+        for j, cell in enumerate(main_cells):
+            for sprite in set(cell.sprites):
+                positions.setdefault(sprite, []).append(j)
+
+        seen = set()
+        for mon, method, level in self.chain[:current_index]:
+            if mon == number or int(mon) >= int(number) or mon in seen:
+                continue
+            seen.add(mon)
+            pevo_method = (method, level)
+            # Prefer the icon between this Pokémon and the current one; otherwise
+            # every icon that follows it in the main row (e.g. Bulbasaur for Venusaur)
+            direct = next((j for j in positions.get(mon, ())
+                           if j + 2 < len(main_cells) and main_cells[j + 1].icons
+                           and number in main_cells[j + 2].sprites), None)
+            if direct is not None:
+                pevo_method = self.apply_icons(pevo_method, main_cells[direct + 1].icons)
+            else:
+                for j in positions.get(mon, ()):
+                    if j + 2 < len(main_cells):
+                        pevo_method = self.apply_icons(pevo_method, main_cells[j + 1].icons)
+            pevos.append({"level": pevo_method[1], "mon": mon, "method": pevo_method[0]})
+
+        seen = set()
+        for mon, method, level in self.chain[current_index + 1:]:
+            if mon == number or int(mon) <= int(number) or mon in seen:
+                continue
+            seen.add(mon)
+            evos.append({"level": level, "mon": mon, "method": method})
+        return pevos, evos
+
+
+class EvolutionGraph:
+    """
+    Run-level store of evolution chains
+
+    Every member of a family shows the same evochain table, so a chain is
+    parsed once and reused for the other members' pages. Tables are keyed by
+    their sprite set: the src of every img in them, in page order, together
+    with the table, row and cell tags around them so that two layouts of the
+    same images never share a chain.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.chains = {}
+        self.stats = {'parsed': 0, 'reused': 0}
+
+    @staticmethod
+    def family_key(table):
+        key = []
+        for tag in table.descendants:
+            if tag.__class__ is not Tag:
+                continue
+            if tag.name == 'img':
+                key.append(tag.get('src', ''))
+            elif tag.name == 'td':
+                key.append('td.pkmn' if 'pkmn' in (tag.get('class') or ()) else 'td')
+            elif tag.name in ('tr', 'table'):
+                key.append(tag.name)
+        return tuple(key)
+
+    def chain(self, table):
+        """The EvolutionChain of an evochain table, parsed on first sight"""
+        key = self.family_key(table)
+        with self._lock:
+            chain = self.chains.get(key)
+            if chain is not None:
+                self.stats['reused'] += 1
+                return chain
+        chain = EvolutionChain(table)
+        with self._lock:
+            # Another worker may have parsed the same family meanwhile
+            if key in self.chains:
+                self.stats['reused'] += 1
+                return self.chains[key]
+            self.chains[key] = chain
+            self.stats['parsed'] += 1
+        return chain
+
+    def relatives(self, table, number):
+        """The pevos and evos of Pokémon number in an evochain table"""
+        pevos, evos = self.chain(table).relatives(number)
+        # Copies, so no two pages share the same dicts
+        return [dict(pevo) for pevo in pevos], [dict(evo) for evo in evos]
+
+    def merge_stats(self, counts):
+        """Add the parsed and reused counts of another graph"""
+        with self._lock:
+            for name, count in counts.items():
+                self.stats[name] += count
+
+    @staticmethod
+    def build(pokedex):
+        """
+        Both directions of every evolution in a list of Pokémon, keyed by
+        number: evolves_from (its pevos) and evolves_into (its evos). An edge
+        recorded on only one end is added to the other end as well.
+        """
+        graph = {}
+        for pokemon in pokedex:
+            graph[pokemon['number']] = {
+                'name': pokemon.get('name', ''),
+                'evolves_from': [dict(pevo) for pevo in pokemon.get('pevos', [])],
+                'evolves_into': [dict(evo) for evo in pokemon.get('evos', [])]
+            }
+        
+        for number, node in list(graph.items()):
+            for pevo in node['evolves_from']:
+                other = graph.get(pevo['mon'])
+                if other and not any(edge['mon'] == number for edge in other['evolves_into']):
+                    other['evolves_into'].append(dict(pevo, mon=number))
+            for evo in node['evolves_into']:
+                other = graph.get(evo['mon'])
+                if other and not any(edge['mon'] == number for edge in other['evolves_from']):
+                    other['evolves_from'].append(dict(evo, mon=number))
+        return graph
+
+    def save(self, path, pokedex, sink=None):
+        """Write the evolution graph of pokedex as JSON through an OutputSink"""
+        (sink or OutputSink()).write_json(path, self.build(pokedex))
+        print(f"Evolution graph saved to {path}")
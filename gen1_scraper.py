@@ -1,1009 +1,567 @@
-import requests
-from bs4 import BeautifulSoup
 import time
 import json
 import re
 import os
 from urllib.parse import urljoin
+from move_table import move_id
+from pokedex_scraper import PokedexScraper
 
-class Gen1Scraper:
+# Effort value stats in the order Serebii lists them
+EV_STATS = ('HP', 'Attack', 'Defense', 'Special', 'Speed')
+
+# Stripped text of the experience growth and effort value cells
+EXP_CELL_PATTERN = re.compile(r'([\d,]+)\s+Points\s*([A-Za-z\s]+)')
+EV_CELL_PATTERN = re.compile(r'(\d+)\s*Hit Points(\d+)\s*Attack(\d+)\s*Defense\s*(\d+)\s*Special(\d+)\s*Speed')
+
+# Fallback searches over a page's text, tried in this order; the first
+# match of each wins
+EXP_TEXT_PATTERNS = (
+    re.compile(r'([\d,]+)\s+Points\s+([A-Za-z\s]+)'),  # "1,059,860 Points Medium Slow"
+    re.compile(r'([\d,]+)\s+Points([A-Za-z\s]+)'),     # "1,059,860 PointsMedium Slow"
+)
+EXP_BROAD_PATTERN = re.compile(r'([\d,]+)\s*Points.*?(Medium Slow|Medium Fast|Fast|Slow)')
+EV_TEXT_PATTERNS = tuple((stat, re.compile(rf'(\d+)\s+{label}'))
+                         for stat, label in zip(EV_STATS, ('Hit Points', 'Attack', 'Defense', 'Special', 'Speed')))
+# "45 Hit Points49 Attack49 Defense 65 Special45 Speed"; overrides the single-stat matches
+EV_TEXT_PATTERN = re.compile(r'(\d+)\s+Hit Points(\d+)\s+Attack(\d+)\s+Defense\s+(\d+)\s+Special(\d+)\s+Speed')
+
+class Gen1Scraper(PokedexScraper):
     """Generation 1 Pokémon scraper"""
 
-    def __init__(self):
-        self.generation = "1"
-        self.start_number = 1
-        self.end_number = 151
-        self.base_url = "https://www.serebii.net/pokedex"
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        self.pokemon_data = []
+    GENERATION = 1
+    DEX_PATH = "pokedex"
+    FIRST_NUMBER = 1
+    LAST_NUMBER = 151
 
-    def download_image(self, url, local_path):
+    # Page sections in the order their fields appear in the output
+    SECTIONS = ('name', 'types', 'evos', 'profile', 'stats', 'training', 'damage', 'locations', 'moves')
+    FIELDS = {
+        'name': 'name', 'number': 'name', 'types': 'types', 'pevos': 'evos', 'evos': 'evos',
+        'other_names': 'profile', 'classification': 'profile', 'height': 'profile', 'weight': 'profile',
+        'stats': 'stats', 'capture_rate': 'training', 'experience_growth': 'training',
+        'effort_values': 'training', 'damage_taken': 'damage', 'locations': 'locations', 'moves': 'moves'
+    }
+    # The evolution chain and file names need the Pokédex number
+    REQUIRED_SECTIONS = ('name',)
+
+    # Stats in the order the Stats table lists them
+    STATS = ('HP', 'Attack', 'Defense', 'Special', 'Speed')
+    # Header of the level-up learnset table
+    LEVEL_UP_HEADING = 'Generation I Level Up'
+    # Sections that only read their own tables; name, types, profile and
+    # training read cells from all over the page
+    SECTION_TABLES = {
+        'evos': ('Evolutionary Chain',),
+        'stats': ('Stats',),
+        'damage': ('Damage Taken',),
+        'locations': ('Locations',),
+        'moves': (LEVEL_UP_HEADING, 'TM & HM Attacks')
+    }
+
+    def sprite_jobs(self, pokemon_number):
         """
-        Download an image from URL to local path
+        List the (url, local path) pairs of the six sprites of a Pokémon
         """
-        try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            
-            # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
-            
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
-            return True
-        except Exception as e:
-            print(f"Error downloading {url}: {e}")
-        return False
+        base_url = "https://www.serebii.net"
+        
+        # The proper folder structure: data/gen1/[pokemon_number]/sprites/
+        sprites_folder = os.path.join(self.data_dir, pokemon_number, "sprites")
+        
+        # The 6 sprite images with proper naming
+        sprite_urls = [
+            ("/pokearth/sprites/green/" + pokemon_number + ".png", f"g{pokemon_number}.png"),
+            ("/pokearth/sprites/rb/" + pokemon_number + ".png", f"rb{pokemon_number}.png"),
+            ("/pokearth/sprites/yellow/" + pokemon_number + ".png", f"y{pokemon_number}.png"),
+            ("/pokearth/sprites/green/" + pokemon_number + "-g.png", f"g{pokemon_number}-g.png"),
+            ("/pokearth/sprites/rb/" + pokemon_number + "-g.png", f"rb{pokemon_number}-g.png"),
+            ("/pokearth/sprites/yellow/" + pokemon_number + "-g.png", f"y{pokemon_number}-g.png")
+        ]
+        
+        return [(urljoin(base_url, sprite_url), os.path.join(sprites_folder, filename))
+                for sprite_url, filename in sprite_urls]
 
-    def scrape_all(self):
-        """Scrape all Generation 1 Pokémon"""
-        print("Pokémon Gen 1 Pokédex Scraper")
-        print("=" * 40)
-        print("Starting to scrape Gen 1 Pokédex...")
+    def extract_name(self, index, pokemon_data):
+        """Name and Pokédex number from the page title"""
+        soup = index.soup
         
-        for pokemon_number in range(self.start_number, self.end_number + 1):
-            print(f"Scraping #{pokemon_number:03d}...")
-            
-            try:
-                pokemon_data = self.scrape_pokemon(pokemon_number)
-                if pokemon_data:
-                    self.pokemon_data.append(pokemon_data)
-                    self.save_individual_pokemon(pokemon_data)
-                    print(f"✓ {pokemon_data['name']}")
-                else:
-                    print(f"✗ Failed to scrape #{pokemon_number:03d}")
-                    
-            except Exception as e:
-                print(f"✗ Error scraping #{pokemon_number:03d}: {e}")
-            
-            time.sleep(1)  # Be nice to the server
+        # Get Pokémon name - look for the name in the main info table
+        pokemon_name = None
+        
+        # First, try to find the name in the title
+        title = index.title
+        if title:
+            title_text = title.get_text()
+            if '#' in title_text and '-' in title_text:
+                # Extract name from title like "Serebii.net Pokédex - #025 - Pikachu"
+                # The name is after the last dash
+                parts = title_text.split('-')
+                if len(parts) >= 3:
+                    # Last part should be the Pokémon name
+                    pokemon_name = parts[-1].strip()
+                    # Clean up any extra text like "Pokémon" if present
+                    if 'Pokémon' in pokemon_name:
+                        pokemon_name = pokemon_name.replace('Pokémon', '').strip()
         
-        self.save_pokedex()
-        print(f"\nSuccessfully scraped {len(self.pokemon_data)} Pokémon!")
-        return self.pokemon_data
+        # If we didn't get the name from title, try to find it in the page content
+        if not pokemon_name:
+            # Look for the main Pokémon name in the page - it's usually in a large heading
+            name_heading = soup.find('h1') or soup.find('h2') or soup.find('h3')
+            if name_heading:
+                heading_text = name_heading.get_text(strip=True)
+                # Clean up the heading text
+                if heading_text and '#' not in heading_text and 'Pokédex' not in heading_text:
+                    pokemon_name = heading_text
+        
+        # If still no name, try to find it in the main content area
+        if not pokemon_name:
+            # Look for text that looks like a Pokémon name in the main content
+            main_content = soup.find('div', id='content') or soup.find('body')
+            if main_content:
+                # Find all text nodes and look for Pokémon-like names
+                for text_node in main_content.find_all(text=True):
+                    text = text_node.strip()
+                    if (text and 
+                        len(text) > 2 and 
+                        len(text) < 20 and  # Pokémon names are typically short
+                        not text.isdigit() and 
+                        not any(char in text for char in ['#', 'Pokémon', 'lbs', "'", 'm', 'kg', 'Points', 'Hit Points', 'Attack', 'Defense', 'Special', 'Speed', 'Gift', 'Route', 'Scratch']) and
+                        not text.startswith(('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')) and
+                        not any(word in text.lower() for word in ['gift', 'route', 'scratch', 'attack', 'defense', 'special', 'speed', 'points', 'serebii', 'pokédex', 'net']) and
+                        any(char.isalpha() for char in text) and
+                        text[0].isalpha() and  # Must start with a letter
+                        not text.endswith('-')):  # Must not end with dash
+                        pokemon_name = text
+                        break
+        
+        pokemon_data['name'] = pokemon_name
+        
+        # Get Pokémon number from the title or header
+        title = index.title
+        if title:
+            title_text = title.get_text()
+            if '#' in title_text:
+                number_start = title_text.find('#') + 1
+                number_end = title_text.find(' ', number_start)
+                if number_end == -1:
+                    number_end = title_text.find('-', number_start)
+                if number_end != -1:
+                    pokemon_data['number'] = title_text[number_start:number_end]
 
-    def scrape_pokemon(self, pokemon_number):
-        """Scrape individual Pokémon data"""
-        url = f"{self.base_url}/{pokemon_number:03d}.shtml"
-        return self.scrape_pokemon_page(url)
+    def extract_types(self, index, pokemon_data):
+        """Types from the type column of the main info table"""
+        # Get types - specifically target Table 2, Row 1, Cell 12 (the actual type column)
+        types = []
+        tables = index.dextables
+        if len(tables) >= 2:  # Make sure we have at least 2 tables
+            main_table = tables[1]  # Table 2 (index 1)
+            rows = main_table.find_all('tr')
+            if len(rows) >= 2:  # Make sure we have at least 2 rows (header + data)
+                data_row = rows[1]  # Row 1 (index 1) - the data row
+                cells = data_row.find_all('td')
+                if len(cells) >= 12:  # Make sure we have at least 12 cells
+                    type_cell = cells[11]  # 12th column (index 11) - the actual Type column
+                    type_images = type_cell.find_all('img', src=lambda x: x and '/pokedex-bw/type/' in x and x.endswith('.gif'))
+                    for type_img in type_images:
+                        src = type_img.get('src', '')
+                        type_name = src.split('/')[-1].replace('.gif', '').title()
+                        if type_name not in types:
+                            types.append(type_name)
+        pokemon_data['types'] = types
 
-    def save_individual_pokemon(self, pokemon_data):
-        """Save individual Pokémon data to file"""
-        pokemon_number = pokemon_data['number']
-        directory = f"data/gen1/{pokemon_number}"
-        os.makedirs(directory, exist_ok=True)
+    def extract_evos(self, index, pokemon_data):
+        """Previous and next evolutions from the Evolutionary Chain table"""
+        pevos = []  # Previous evolutions (what evolves into this Pokémon)
+        evos = []   # Next evolutions (what this Pokémon evolves into)
+        seen_pevos = set()
+        seen_evos = set()
+        
+        # Get the current Pokémon number for comparison
+        current_pokemon_number = pokemon_data.get('number', '001')
         
-        # Save JSON data
-        json_file = os.path.join(directory, f"{pokemon_number}.json")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(pokemon_data, f, indent=2, ensure_ascii=False)
+        table = index.table_with_header('Evolutionary Chain')
+        if table is not None:
+            for evochain_table in table.find_all('table', class_='evochain'):
+                chain_pevos, chain_evos = self.evolution_graph.relatives(evochain_table, current_pokemon_number)
+                for pevo in chain_pevos:
+                    if pevo['mon'] not in seen_pevos:
+                        seen_pevos.add(pevo['mon'])
+                        pevos.append(pevo)
+                for evo in chain_evos:
+                    if evo['mon'] not in seen_evos:
+                        seen_evos.add(evo['mon'])
+                        evos.append(evo)
         
-        print(f"Data saved to {json_file}")
+        pokemon_data['pevos'] = pevos
+        pokemon_data['evos'] = evos
 
-    def save_pokedex(self):
-        """Save complete Pokédex to file"""
-        # Create gen1 directory if it doesn't exist
-        os.makedirs("data/gen1", exist_ok=True)
+    def extract_profile(self, index, pokemon_data):
+        """Other names, classification, height and weight"""
+        # Get other names in different languages
+        other_names = {}
+        for text in index.fooinfo_texts():
+            if 'Japan:' in text and 'French:' in text and 'German:' in text and 'Korean:' in text:
+                # This cell contains all language names
+                # Parse Japan first (split into romanized and Japanese)
+                if 'Japan:' in text:
+                    japan_start = text.find('Japan:') + 6
+                    japan_end = text.find('French:')
+                    japan_text = text[japan_start:japan_end].strip()
+                    
+                    # Create nested Japan structure
+                    other_names["Japan"] = {}
+                    
+                    # Find the transition from romanized to Japanese characters
+                    for i, char in enumerate(japan_text):
+                        if ord(char) > 127:  # Non-ASCII character (likely Japanese)
+                            romanized = japan_text[:i].strip()
+                            japanese = japan_text[i:].strip()
+                            other_names["Japan"]["0"] = romanized
+                            other_names["Japan"]["1"] = japanese
+                            break
+                    else:
+                        # If no Japanese characters found, just use the whole text
+                        other_names["Japan"]["0"] = japan_text
+                        other_names["Japan"]["1"] = ""
+                
+                # Parse French
+                if 'French:' in text:
+                    french_start = text.find('French:') + 7
+                    french_end = text.find('German:')
+                    french_text = text[french_start:french_end].strip()
+                    other_names['French'] = french_text
+                
+                # Parse German
+                if 'German:' in text:
+                    german_start = text.find('German:') + 7
+                    german_end = text.find('Korean:')
+                    german_text = text[german_start:german_end].strip()
+                    other_names['German'] = german_text
+                
+                # Parse Korean
+                if 'Korean:' in text:
+                    korean_start = text.find('Korean:') + 7
+                    korean_text = text[korean_start:].strip()
+                    other_names['Korean'] = korean_text
+                
+                break  # Found the cell with all other names, stop looking
+        pokemon_data['other_names'] = other_names
+        
+        # Get classification
+        classification_cell = next((cell for cell in index.fooinfo
+                                    if cell.string and 'Pokémon' in cell.string), None)
+        if classification_cell:
+            pokemon_data['classification'] = classification_cell.get_text(strip=True)
         
-        pokedex_file = f"data/gen1/gen1_pokedex.json"
-        with open(pokedex_file, 'w', encoding='utf-8') as f:
-            json.dump(self.pokemon_data, f, indent=2, ensure_ascii=False)
+        # Get height and weight - use regex to properly split the text
+        height_imperial = ""
+        height_metric = ""
+        weight_imperial = ""
+        weight_metric = ""
         
-        print(f"Data saved to {pokedex_file}")
+        for text in index.fooinfo_texts():
+            if "'" in text and '"' in text and 'm' in text:  # Combined height like "2'04"0.7m"
+                # Use regex to find the imperial part (ends with ")
+                imperial_match = re.search(r"(\d+'?\d*\"?)", text)
+                if imperial_match:
+                    height_imperial = imperial_match.group(1)
+                    # Get the metric part (everything after the imperial part)
+                    metric_start = text.find(height_imperial) + len(height_imperial)
+                    height_metric = text[metric_start:].strip()
+            elif 'lbs' in text and 'kg' in text:  # Combined weight like "15.2lbs6.9kg"
+                # Use regex to find the imperial part (ends with lbs)
+                imperial_match = re.search(r"(\d+\.?\d*lbs)", text)
+                if imperial_match:
+                    weight_imperial = imperial_match.group(1)
+                    # Get the metric part (everything after the imperial part)
+                    metric_start = text.find(weight_imperial) + len(weight_imperial)
+                    weight_metric = text[metric_start:].strip()
         
-        # Show sample data
-        if self.pokemon_data:
-            print(f"\nSample data for first Pokémon:")
-            print(json.dumps(self.pokemon_data[0], indent=2)[:1000] + "...")
+        pokemon_data['height'] = {
+            'imperial': height_imperial,
+            'metric': height_metric
+        }
+        pokemon_data['weight'] = {
+            'imperial': weight_imperial,
+            'metric': weight_metric
+        }
 
-    def scrape_pokemon_page(self, url):
-        """
-        Scrape a single Pokémon page from Serebii.net
-        """
-        try:
-            # Make the request
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()  # Raise an exception for bad status codes
-            
-            # Parse the HTML
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract Pokémon information
-            pokemon_data = {}
-            
-            # Get Pokémon name - look for the name in the main info table
-            pokemon_name = None
-            
-            # First, try to find the name in the title
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
-                if '#' in title_text and '-' in title_text:
-                    # Extract name from title like "Serebii.net Pokédex - #025 - Pikachu"
-                    # The name is after the last dash
-                    parts = title_text.split('-')
-                    if len(parts) >= 3:
-                        # Last part should be the Pokémon name
-                        pokemon_name = parts[-1].strip()
-                        # Clean up any extra text like "Pokémon" if present
-                        if 'Pokémon' in pokemon_name:
-                            pokemon_name = pokemon_name.replace('Pokémon', '').strip()
-            
-            # If we didn't get the name from title, try to find it in the page content
-            if not pokemon_name:
-                # Look for the main Pokémon name in the page - it's usually in a large heading
-                name_heading = soup.find('h1') or soup.find('h2') or soup.find('h3')
-                if name_heading:
-                    heading_text = name_heading.get_text(strip=True)
-                    # Clean up the heading text
-                    if heading_text and '#' not in heading_text and 'Pokédex' not in heading_text:
-                        pokemon_name = heading_text
-            
-            # If still no name, try to find it in the main content area
-            if not pokemon_name:
-                # Look for text that looks like a Pokémon name in the main content
-                main_content = soup.find('div', id='content') or soup.find('body')
-                if main_content:
-                    # Find all text nodes and look for Pokémon-like names
-                    for text_node in main_content.find_all(text=True):
-                        text = text_node.strip()
-                        if (text and 
-                            len(text) > 2 and 
-                            len(text) < 20 and  # Pokémon names are typically short
-                            not text.isdigit() and 
-                            not any(char in text for char in ['#', 'Pokémon', 'lbs', "'", 'm', 'kg', 'Points', 'Hit Points', 'Attack', 'Defense', 'Special', 'Speed', 'Gift', 'Route', 'Scratch']) and
-                            not text.startswith(('0', '1', '2', '3', '4', '5', '6', '7', '8', '9')) and
-                            not any(word in text.lower() for word in ['gift', 'route', 'scratch', 'attack', 'defense', 'special', 'speed', 'points', 'serebii', 'pokédex', 'net']) and
-                            any(char.isalpha() for char in text) and
-                            text[0].isalpha() and  # Must start with a letter
-                            not text.endswith('-')):  # Must not end with dash
-                            pokemon_name = text
-                            break
-            
-            pokemon_data['name'] = pokemon_name
-            
-            # Get Pokémon number from the title or header
-            title = soup.find('title')
-            if title:
-                title_text = title.get_text()
-                if '#' in title_text:
-                    number_start = title_text.find('#') + 1
-                    number_end = title_text.find(' ', number_start)
-                    if number_end == -1:
-                        number_end = title_text.find('-', number_start)
-                    if number_end != -1:
-                        pokemon_data['number'] = title_text[number_start:number_end]
-            
-            # Get types - specifically target Table 2, Row 1, Cell 12 (the actual type column)
-            types = []
-            tables = soup.find_all('table', class_='dextable')
-            if len(tables) >= 2:  # Make sure we have at least 2 tables
-                main_table = tables[1]  # Table 2 (index 1)
-                rows = main_table.find_all('tr')
-                if len(rows) >= 2:  # Make sure we have at least 2 rows (header + data)
-                    data_row = rows[1]  # Row 1 (index 1) - the data row
-                    cells = data_row.find_all('td')
-                    if len(cells) >= 12:  # Make sure we have at least 12 cells
-                        type_cell = cells[11]  # 12th column (index 11) - the actual Type column
-                        type_images = type_cell.find_all('img', src=lambda x: x and '/pokedex-bw/type/' in x and x.endswith('.gif'))
-                        for type_img in type_images:
-                            src = type_img.get('src', '')
-                            type_name = src.split('/')[-1].replace('.gif', '').title()
-                            if type_name not in types:
-                                types.append(type_name)
-            pokemon_data['types'] = types
-            
-            # Get evolutionary chain - handle both previous and next evolutions
-            pevos = []  # Previous evolutions (what evolves into this Pokémon)
-            evos = []   # Next evolutions (what this Pokémon evolves into)
-            seen_pevos = set()
-            seen_evos = set()
-            
-            # Get the current Pokémon number for comparison
-            current_pokemon_number = pokemon_data.get('number', '001')
-            
-            for table in tables:
-                header = table.find('td', class_='fooevo')
-                if header and 'Evolutionary Chain' in header.get_text():
-                    # This is the evolution table
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        evochain_table = row.find('table', class_='evochain')
-                        if evochain_table:
-                            # Parse the evolution chain table
-                            evo_rows = evochain_table.find_all('tr')
+    def extract_stats(self, index, pokemon_data):
+        """Base stats and max stats from the Stats table"""
+        tables = index.dextables
+        
+        # Get base stats and max stats
+        base_stats = {}
+        max_stats_lv50 = {}
+        max_stats_lv100 = {}
+        
+        # Look for the stats table
+        for table in tables:
+            if 'Stats' in index.header_text(table):
+                # This is the stats table
+                rows = table.find_all('tr')
+                for i, row in enumerate(rows):
+                    cells = row.find_all('td')
+                    if len(cells) >= 5:
+                        # Look for the row with "Base Stats - Total:"
+                        first_cell = cells[0].get_text(strip=True)
+                        if 'Base Stats - Total:' in first_cell:
+                            # This is the base stats row (Row 3 in the structure)
+                            # Extract the BST value from "Base Stats - Total: 253"
+                            bst_match = re.search(r'Base Stats - Total:\s*(\d+)', first_cell)
+                            if bst_match:
+                                base_stats['bst'] = bst_match.group(1)
                             
-                            if len(evo_rows) >= 1:
-                                # Collect all Pokémon and their evolution methods
-                                pokemon_chain = []  # List of (pokemon_number, evolution_method, evolution_level)
-                                
-                                # First, collect all Pokémon sprites and evolution data from the main row
-                                main_row_cells = evo_rows[0].find_all('td')
-                                
-                                # Create a mapping of Pokémon to their evolution methods
-                                pokemon_evolution_map = {}
-                                
-                                # First pass: collect all Pokémon sprites and their positions
-                                for i, cell in enumerate(main_row_cells):
-                                    sprites = cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                    for sprite in sprites:
-                                        sprite_src = sprite.get('src', '')
-                                        mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                        if mon_match:
-                                            mon_number = mon_match.group(1)
-                                            pokemon_evolution_map[mon_number] = {'position': i, 'method': 'level', 'level': '--'}
-                                
-                                # Also add Pokémon from orphaned cells to the evolution map
-                                orphaned_cells = evochain_table.find_all('td', class_='pkmn')
-                                for i, cell in enumerate(orphaned_cells):
-                                    sprites = cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                    for sprite in sprites:
-                                        sprite_src = sprite.get('src', '')
-                                        mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                        if mon_match:
-                                            mon_number = mon_match.group(1)
-                                            if mon_number not in pokemon_evolution_map:
-                                                pokemon_evolution_map[mon_number] = {'position': -1, 'method': 'level', 'level': '--'}
-                                
-                                # Second pass: find evolution methods in cells with evolution icons
-                                for i, cell in enumerate(main_row_cells):
-                                    evo_icons = cell.find_all('img', src=lambda x: x and 'evoicon/' in x and x.endswith('.png'))
-                                    for icon in evo_icons:
-                                        src = icon.get('src', '')
-                                        method = 'level'
-                                        level = '--'
-                                        
-                                        if 'thunderstone' in src or 'eeveethunderstone' in src:
-                                            method = 'thunderstone'
-                                            level = '--'
-                                        elif 'waterstone' in src or 'eeveewaterstone' in src:
-                                            method = 'waterstone'
-                                            level = '--'
-                                        elif 'firestone' in src or 'eeveefirestone' in src:
-                                            method = 'firestone'
-                                            level = '--'
-                                        elif 'leafstone' in src or 'eeveeleafstone' in src:
-                                            method = 'leafstone'
-                                            level = '--'
-                                        elif 'moonstone' in src or 'eeveemoonstone' in src:
-                                            method = 'moonstone'
-                                            level = '--'
-                                        elif 'trade' in src:
-                                            method = 'trade'
-                                            level = '--'
-                                        else:
-                                            level_match = re.search(r'/l(\d+)\.png$', src)
-                                            if level_match:
-                                                method = 'level'
-                                                level = level_match.group(1)
-                                        
-                                        # Find the Pokémon this evolution method applies to
-                                        # The evolution icon in cell i applies to the evolution FROM cell i-1 TO cell i+1
-                                        if i > 0 and i + 1 < len(main_row_cells):
-                                            # Get the Pokémon that evolves (cell i-1)
-                                            prev_cell = main_row_cells[i - 1]
-                                            prev_sprites = prev_cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                            
-                                            # Get the Pokémon it evolves into (cell i+1)
-                                            next_cell = main_row_cells[i + 1]
-                                            next_sprites = next_cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                            
-                                            for prev_sprite in prev_sprites:
-                                                prev_sprite_src = prev_sprite.get('src', '')
-                                                prev_mon_match = re.search(r'/(\d+)\.png$', prev_sprite_src)
-                                                if prev_mon_match:
-                                                    prev_mon_number = prev_mon_match.group(1)
-                                                    
-                                                    for next_sprite in next_sprites:
-                                                        next_sprite_src = next_sprite.get('src', '')
-                                                        next_mon_match = re.search(r'/(\d+)\.png$', next_sprite_src)
-                                                        if next_mon_match:
-                                                            next_mon_number = next_mon_match.group(1)
-                                                            
-                                                            # Store evolution data for the Pokémon it evolves into
-                                                            # The evolution icon in cell i applies to the evolution TO the Pokémon in cell i+1
-                                                            if next_mon_number in pokemon_evolution_map:
-                                                                pokemon_evolution_map[next_mon_number]['method'] = method
-                                                                pokemon_evolution_map[next_mon_number]['level'] = level
-                                
-                                # Special handling for Eevee family - check additional rows for evolution icons
-                                if len(evo_rows) > 1:
-                                    # Check if this is Eevee or its evolutions
-                                    is_eevee_family = False
-                                    for cell in main_row_cells:
-                                        sprites = cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                        for sprite in sprites:
-                                            sprite_src = sprite.get('src', '')
-                                            mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                            if mon_match and mon_match.group(1) in ['133', '134', '135', '136']:
-                                                is_eevee_family = True
-                                                break
-                                        if is_eevee_family:
-                                            break
-                                    
-                                    if is_eevee_family:
-                                        # For Eevee family, check additional rows for evolution icons
-                                        # and map them to orphaned cells
-                                        for row_idx in range(1, len(evo_rows)):
-                                            additional_row_cells = evo_rows[row_idx].find_all('td')
-                                            for i, cell in enumerate(additional_row_cells):
-                                                evo_icons = cell.find_all('img', src=lambda x: x and 'evoicon/' in x and x.endswith('.png'))
-                                                for icon in evo_icons:
-                                                    src = icon.get('src', '')
-                                                    method = 'level'
-                                                    level = '--'
-                                                    
-                                                    if 'thunderstone' in src or 'eeveethunderstone' in src:
-                                                        method = 'thunderstone'
-                                                        level = '--'
-                                                    elif 'waterstone' in src or 'eeveewaterstone' in src:
-                                                        method = 'waterstone'
-                                                        level = '--'
-                                                    elif 'firestone' in src or 'eeveefirestone' in src:
-                                                        method = 'firestone'
-                                                        level = '--'
-                                                    elif 'leafstone' in src or 'eeveeleafstone' in src:
-                                                        method = 'leafstone'
-                                                        level = '--'
-                                                    elif 'moonstone' in src or 'eeveemoonstone' in src:
-                                                        method = 'moonstone'
-                                                        level = '--'
-                                                    elif 'trade' in src:
-                                                        method = 'trade'
-                                                        level = '--'
-                                                    
-                                                    # For Eevee, map evolution icons to orphaned cells
-                                                    # The evolution icons are in row 2, and the evolved Pokémon are in orphaned cells
-                                                    # Map by position: Cell 1 -> Orphaned Cell 2, Cell 2 -> Orphaned Cell 3, Cell 3 -> Orphaned Cell 4
-                                                    orphaned_cells = evochain_table.find_all('td', class_='pkmn')
-                                                    if i + 1 < len(orphaned_cells):  # i+1 because orphaned cell 0 is Eevee itself
-                                                        target_orphaned_cell = orphaned_cells[i + 1]
-                                                        target_sprites = target_orphaned_cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                                        for sprite in target_sprites:
-                                                            sprite_src = sprite.get('src', '')
-                                                            mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                                            if mon_match:
-                                                                mon_number = mon_match.group(1)
-                                                                if mon_number in pokemon_evolution_map:
-                                                                    pokemon_evolution_map[mon_number]['method'] = method
-                                                                    pokemon_evolution_map[mon_number]['level'] = level
-                                
-                                # Add all Pokémon to the chain
-                                for mon_number, data in pokemon_evolution_map.items():
-                                    pokemon_chain.append((mon_number, data['method'], data['level']))
-                                
-                                # Also check orphaned cells for additional Pokémon
-                                orphaned_cells = evochain_table.find_all('td', class_='pkmn')
-                                for cell in orphaned_cells:
-                                    sprites = cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                    for sprite in sprites:
-                                        sprite_src = sprite.get('src', '')
-                                        mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                        if mon_match:
-                                            mon_number = mon_match.group(1)
-                                            
-                                            # Look for evolution method in this orphaned cell
-                                            method = 'level'
-                                            level = '--'
-                                            
-                                            evo_icons = cell.find_all('img', src=lambda x: x and 'evoicon/' in x and x.endswith('.png'))
-                                            for icon in evo_icons:
-                                                src = icon.get('src', '')
-                                                if 'thunderstone' in src:
-                                                    method = 'thunderstone'
-                                                    level = '--'
-                                                elif 'waterstone' in src:
-                                                    method = 'waterstone'
-                                                    level = '--'
-                                                elif 'firestone' in src:
-                                                    method = 'firestone'
-                                                    level = '--'
-                                                elif 'leafstone' in src:
-                                                    method = 'leafstone'
-                                                    level = '--'
-                                                elif 'moonstone' in src:
-                                                    method = 'moonstone'
-                                                    level = '--'
-                                                elif 'trade' in src:
-                                                    method = 'trade'
-                                                    level = '--'
-                                                else:
-                                                    level_match = re.search(r'/l(\d+)\.png$', src)
-                                                    if level_match:
-                                                        method = 'level'
-                                                        level = level_match.group(1)
-                                            
-                                            pokemon_chain.append((mon_number, method, level))
-                                
-                                # Now determine relationships
-                                current_index = None
-                                for i, (mon_number, method, level) in enumerate(pokemon_chain):
-                                    if mon_number == current_pokemon_number:
-                                        current_index = i
-                                        break
-                                
-                                if current_index is not None:
-                                    # Find previous evolutions (Pokémon that appear before current in the chain)
-                                    # The pevos should show what evolves INTO the current Pokémon
-                                    for i, (mon_number, method, level) in enumerate(pokemon_chain):
-                                        if (mon_number != current_pokemon_number and 
-                                            int(mon_number) < int(current_pokemon_number) and
-                                            i < current_index):
-                                            pevo_key = f"pevo-{mon_number}"
-                                            if pevo_key not in seen_pevos:
-                                                seen_pevos.add(pevo_key)
-                                                
-                                                # For pevos, we need to find the evolution that leads TO the current Pokémon
-                                                # Use the stored evolution data from pokemon_evolution_map
-                                                pevo_method = method
-                                                pevo_level = level
-                                                
-                                                # The pevos should show the level at which the previous Pokémon evolves INTO the current one
-                                                # We need to find the evolution data that shows the previous Pokémon evolving into the current one
-                                                # Look for evolution data in the main row that shows the previous Pokémon evolving into current
-                                                found_pevo = False
-                                                for j, cell in enumerate(main_row_cells):
-                                                    # Look for the previous Pokémon in this cell
-                                                    prev_sprites = cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                                    for sprite in prev_sprites:
-                                                        sprite_src = sprite.get('src', '')
-                                                        mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                                        if mon_match and mon_match.group(1) == mon_number:
-                                                            # Found the previous Pokémon, check if there's an evolution icon after it
-                                                            if j + 2 < len(main_row_cells):
-                                                                evo_cell = main_row_cells[j + 1]
-                                                                next_cell = main_row_cells[j + 2]
-                                                                
-                                                                # Check for evolution icon
-                                                                evo_icons = evo_cell.find_all('img', src=lambda x: x and 'evoicon/' in x and x.endswith('.png'))
-                                                                if evo_icons:
-                                                                    # Check if the next cell has the current Pokémon
-                                                                    next_sprites = next_cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                                                    for next_sprite in next_sprites:
-                                                                        next_sprite_src = next_sprite.get('src', '')
-                                                                        next_mon_match = re.search(r'/(\d+)\.png$', next_sprite_src)
-                                                                        if next_mon_match and next_mon_match.group(1) == current_pokemon_number:
-                                                                            # This is the evolution that leads to current Pokémon
-                                                                            for icon in evo_icons:
-                                                                                icon_src = icon.get('src', '')
-                                                                                if 'thunderstone' in icon_src:
-                                                                                    pevo_method = 'thunderstone'
-                                                                                    pevo_level = '--'
-                                                                                elif 'waterstone' in icon_src:
-                                                                                    pevo_method = 'waterstone'
-                                                                                    pevo_level = '--'
-                                                                                elif 'firestone' in icon_src:
-                                                                                    pevo_method = 'firestone'
-                                                                                    pevo_level = '--'
-                                                                                elif 'leafstone' in icon_src:
-                                                                                    pevo_method = 'leafstone'
-                                                                                    pevo_level = '--'
-                                                                                elif 'moonstone' in icon_src:
-                                                                                    pevo_method = 'moonstone'
-                                                                                    pevo_level = '--'
-                                                                                elif 'trade' in icon_src:
-                                                                                    pevo_method = 'trade'
-                                                                                    pevo_level = '--'
-                                                                                else:
-                                                                                    level_match = re.search(r'/l(\d+)\.png$', icon_src)
-                                                                                    if level_match:
-                                                                                        pevo_method = 'level'
-                                                                                        pevo_level = level_match.group(1)
-                                                                            found_pevo = True
-                                                                            break
-                                                                    if found_pevo:
-                                                                        break
-                                                                break
-                                                            break
-                                                    if found_pevo:
-                                                        break
-                                                
-                                                # If we didn't find a direct evolution, look for indirect evolutions
-                                                # This handles cases like Venusaur where Bulbasaur doesn't directly evolve into it
-                                                if not found_pevo:
-                                                    # Look for the previous Pokémon in the evolution chain and find its evolution data
-                                                    for j, cell in enumerate(main_row_cells):
-                                                        prev_sprites = cell.find_all('img', src=lambda x: x and '/pokearth/sprites/' in x and x.endswith('.png'))
-                                                        for sprite in prev_sprites:
-                                                            sprite_src = sprite.get('src', '')
-                                                            mon_match = re.search(r'/(\d+)\.png$', sprite_src)
-                                                            if mon_match and mon_match.group(1) == mon_number:
-                                                                # Found the previous Pokémon, look for its evolution data
-                                                                if j + 2 < len(main_row_cells):
-                                                                    evo_cell = main_row_cells[j + 1]
-                                                                    evo_icons = evo_cell.find_all('img', src=lambda x: x and 'evoicon/' in x and x.endswith('.png'))
-                                                                    if evo_icons:
-                                                                        for icon in evo_icons:
-                                                                            icon_src = icon.get('src', '')
-                                                                            if 'thunderstone' in icon_src:
-                                                                                pevo_method = 'thunderstone'
-                                                                                pevo_level = '--'
-                                                                            elif 'waterstone' in icon_src:
-                                                                                pevo_method = 'waterstone'
-                                                                                pevo_level = '--'
-                                                                            elif 'firestone' in icon_src:
-                                                                                pevo_method = 'firestone'
-                                                                                pevo_level = '--'
-                                                                            elif 'leafstone' in icon_src:
-                                                                                pevo_method = 'leafstone'
-                                                                                pevo_level = '--'
-                                                                            elif 'moonstone' in icon_src:
-                                                                                pevo_method = 'moonstone'
-                                                                                pevo_level = '--'
-                                                                            elif 'trade' in icon_src:
-                                                                                pevo_method = 'trade'
-                                                                                pevo_level = '--'
-                                                                            else:
-                                                                                level_match = re.search(r'/l(\d+)\.png$', icon_src)
-                                                                                if level_match:
-                                                                                    pevo_method = 'level'
-                                                                                    pevo_level = level_match.group(1)
-                                                                        break
-                                                                break
-                                                
-                                                pevos.append({
-                                                    "level": pevo_level,
-                                                    "mon": mon_number,
-                                                    "method": pevo_method
-                                                })
-                                    
-                                    # Find next evolutions (Pokémon that appear after current in the chain)
-                                    for i, (mon_number, method, level) in enumerate(pokemon_chain):
-                                        if (mon_number != current_pokemon_number and 
-                                            int(mon_number) > int(current_pokemon_number) and
-                                            i > current_index):
-                                            evo_key = f"evo-{mon_number}"
-                                            if evo_key not in seen_evos:
-                                                seen_evos.add(evo_key)
-                                                evos.append({
-                                                    "level": level,
-                                                    "mon": mon_number,
-                                                    "method": method
-                                                })
-                    break
-            
-            pokemon_data['pevos'] = pevos
-            pokemon_data['evos'] = evos
-            
-            # Get other names in different languages
-            other_names = {}
-            other_name_cells = soup.find_all('td', class_='fooinfo')
-            for cell in other_name_cells:
-                text = cell.get_text(strip=True)
-                if 'Japan:' in text and 'French:' in text and 'German:' in text and 'Korean:' in text:
-                    # This cell contains all language names
-                    # Parse Japan first (split into romanized and Japanese)
-                    if 'Japan:' in text:
-                        japan_start = text.find('Japan:') + 6
-                        japan_end = text.find('French:')
-                        japan_text = text[japan_start:japan_end].strip()
+                            # The first cell contains "Base Stats - Total: 253", actual stats start from cell 1
+                            if len(cells) >= 6:  # Need 6 cells: [Base Stats text, HP, Attack, Defense, Special, Speed]
+                                for position, stat in enumerate(self.STATS, 1):
+                                    base_stats[stat] = cells[position].get_text(strip=True)
                         
-                        # Create nested Japan structure
-                        other_names["Japan"] = {}
+                        # Look for the row with "Max Stats" and "Lv. 50"
+                        elif 'Max Stats' in first_cell and len(cells) >= 5:
+                            # This is the Lv. 50 max stats row (Row 4 in the structure)
+                            for position, stat in enumerate(self.STATS, 2):
+                                max_stats_lv50[stat] = cells[position].get_text(strip=True)
                         
-                        # Find the transition from romanized to Japanese characters
-                        for i, char in enumerate(japan_text):
-                            if ord(char) > 127:  # Non-ASCII character (likely Japanese)
-                                romanized = japan_text[:i].strip()
-                                japanese = japan_text[i:].strip()
-                                other_names["Japan"]["0"] = romanized
-                                other_names["Japan"]["1"] = japanese
-                                break
-                        else:
-                            # If no Japanese characters found, just use the whole text
-                            other_names["Japan"]["0"] = japan_text
-                            other_names["Japan"]["1"] = ""
-                    
-                    # Parse French
-                    if 'French:' in text:
-                        french_start = text.find('French:') + 7
-                        french_end = text.find('German:')
-                        french_text = text[french_start:french_end].strip()
-                        other_names['French'] = french_text
-                    
-                    # Parse German
-                    if 'German:' in text:
-                        german_start = text.find('German:') + 7
-                        german_end = text.find('Korean:')
-                        german_text = text[german_start:german_end].strip()
-                        other_names['German'] = german_text
-                    
-                    # Parse Korean
-                    if 'Korean:' in text:
-                        korean_start = text.find('Korean:') + 7
-                        korean_text = text[korean_start:].strip()
-                        other_names['Korean'] = korean_text
-                    
-                    break  # Found the cell with all other names, stop looking
-            pokemon_data['other_names'] = other_names
-            
-            # Get classification
-            classification_cell = soup.find('td', class_='fooinfo', string=lambda text: text and 'Pokémon' in text)
-            if classification_cell:
-                pokemon_data['classification'] = classification_cell.get_text(strip=True)
-            
-            # Get height and weight - use regex to properly split the text
-            height_weight_cells = soup.find_all('td', class_='fooinfo')
-            height_imperial = ""
-            height_metric = ""
-            weight_imperial = ""
-            weight_metric = ""
-            
-            for cell in height_weight_cells:
-                text = cell.get_text(strip=True)
-                if "'" in text and '"' in text and 'm' in text:  # Combined height like "2'04"0.7m"
-                    # Use regex to find the imperial part (ends with ")
-                    imperial_match = re.search(r"(\d+'?\d*\"?)", text)
-                    if imperial_match:
-                        height_imperial = imperial_match.group(1)
-                        # Get the metric part (everything after the imperial part)
-                        metric_start = text.find(height_imperial) + len(height_imperial)
-                        height_metric = text[metric_start:].strip()
-                elif 'lbs' in text and 'kg' in text:  # Combined weight like "15.2lbs6.9kg"
-                    # Use regex to find the imperial part (ends with lbs)
-                    imperial_match = re.search(r"(\d+\.?\d*lbs)", text)
-                    if imperial_match:
-                        weight_imperial = imperial_match.group(1)
-                        # Get the metric part (everything after the imperial part)
-                        metric_start = text.find(weight_imperial) + len(weight_imperial)
-                        weight_metric = text[metric_start:].strip()
-            
-            pokemon_data['height'] = {
-                'imperial': height_imperial,
-                'metric': height_metric
-            }
-            pokemon_data['weight'] = {
-                'imperial': weight_imperial,
-                'metric': weight_metric
-            }
-            
-            # Get base stats and max stats
-            base_stats = {}
-            max_stats_lv50 = {}
-            max_stats_lv100 = {}
-            
-            # Look for the stats table
-            for table in tables:
-                header = table.find('td', class_='fooevo')
-                if header and 'Stats' in header.get_text():
-                    # This is the stats table
-                    rows = table.find_all('tr')
-                    for i, row in enumerate(rows):
-                        cells = row.find_all('td')
-                        if len(cells) >= 5:
-                            # Look for the row with "Base Stats - Total:"
-                            first_cell = cells[0].get_text(strip=True)
-                            if 'Base Stats - Total:' in first_cell:
-                                # This is the base stats row (Row 3 in the structure)
-                                # Extract the BST value from "Base Stats - Total: 253"
-                                bst_match = re.search(r'Base Stats - Total:\s*(\d+)', first_cell)
-                                if bst_match:
-                                    base_stats['bst'] = bst_match.group(1)
-                                
-                                # The first cell contains "Base Stats - Total: 253", actual stats start from cell 1
-                                if len(cells) >= 6:  # Need 6 cells: [Base Stats text, HP, Attack, Defense, Special, Speed]
-                                    base_stats['HP'] = cells[1].get_text(strip=True)
-                                    base_stats['Attack'] = cells[2].get_text(strip=True)
-                                    base_stats['Defense'] = cells[3].get_text(strip=True)
-                                    base_stats['Special'] = cells[4].get_text(strip=True)
-                                    base_stats['Speed'] = cells[5].get_text(strip=True)
-                            
-                            # Look for the row with "Max Stats" and "Lv. 50"
-                            elif 'Max Stats' in first_cell and len(cells) >= 5:
-                                # This is the Lv. 50 max stats row (Row 4 in the structure)
-                                max_stats_lv50['HP'] = cells[2].get_text(strip=True)
-                                max_stats_lv50['Attack'] = cells[3].get_text(strip=True)
-                                max_stats_lv50['Defense'] = cells[4].get_text(strip=True)
-                                max_stats_lv50['Special'] = cells[5].get_text(strip=True)
-                                max_stats_lv50['Speed'] = cells[6].get_text(strip=True)
-                            
-                            # Look for the row with "Lv. 100"
-                            elif 'Lv. 100' in first_cell and len(cells) >= 5:
-                                # This is the Lv. 100 max stats row (Row 5 in the structure)
-                                max_stats_lv100['HP'] = cells[1].get_text(strip=True)
-                                max_stats_lv100['Attack'] = cells[2].get_text(strip=True)
-                                max_stats_lv100['Defense'] = cells[3].get_text(strip=True)
-                                max_stats_lv100['Special'] = cells[4].get_text(strip=True)
-                                max_stats_lv100['Speed'] = cells[5].get_text(strip=True)
-                    
-                    break  # Found the stats table, stop looking
-            
-            # Create the larger stats object
-            stats = {
-                "base_stats": base_stats,
-                "max_stats": {
-                    "lv_50": max_stats_lv50,
-                    "lv_100": max_stats_lv100
-                }
+                        # Look for the row with "Lv. 100"
+                        elif 'Lv. 100' in first_cell and len(cells) >= 5:
+                            # This is the Lv. 100 max stats row (Row 5 in the structure)
+                            for position, stat in enumerate(self.STATS, 1):
+                                max_stats_lv100[stat] = cells[position].get_text(strip=True)
+                
+                break  # Found the stats table, stop looking
+        
+        # Create the larger stats object
+        stats = {
+            "base_stats": base_stats,
+            "max_stats": {
+                "lv_50": max_stats_lv50,
+                "lv_100": max_stats_lv100
             }
-            
-            pokemon_data['stats'] = stats
-            
-            # Get capture rate
-            capture_rate = ""
-            capture_cells = soup.find_all('td', class_='fooinfo')
-            for cell in capture_cells:
-                text = cell.get_text(strip=True)
-                if text.isdigit() and len(text) <= 3:  # Capture rate is usually 1-3 digits
-                    capture_rate = text
-                    break
-            pokemon_data['capture_rate'] = capture_rate
-            
-            # Get experience growth and effort values earned - search in page text
-            experience_growth = {}
-            effort_values = {}
-            
-            # Search the entire page text for these values
-            page_text = soup.get_text()
-            
-            # Look for experience growth - try different patterns
-            exp_patterns = [
-                r'([\d,]+)\s+Points\s+([A-Za-z\s]+)',  # "1,059,860 Points Medium Slow"
-                r'([\d,]+)\s+Points([A-Za-z\s]+)',     # "1,059,860 PointsMedium Slow"
-            ]
-            
-            for pattern in exp_patterns:
-                exp_match = re.search(pattern, page_text)
+        }
+        
+        pokemon_data['stats'] = stats
+
+    def extract_training(self, index, pokemon_data):
+        """Capture rate, experience growth and effort values"""
+        # Get capture rate
+        capture_rate = ""
+        for text in index.fooinfo_texts():
+            if text.isdigit() and len(text) <= 3:  # Capture rate is usually 1-3 digits
+                capture_rate = text
+                break
+        pokemon_data['capture_rate'] = capture_rate
+        
+        # Experience growth and effort values live in their own info cells,
+        # e.g. "1,059,860 PointsMedium Slow" and
+        # "45 Hit Points49 Attack49 Defense65 Special45 Speed"
+        experience_growth = {}
+        effort_values = {}
+        for text in index.fooinfo_texts():
+            if 'Points' not in text:
+                continue
+            if not experience_growth:
+                exp_match = EXP_CELL_PATTERN.match(text)
                 if exp_match:
                     experience_growth['points'] = exp_match.group(1)
                     experience_growth['rate'] = exp_match.group(2).strip()
-                    break
-            
-            # Look for effort values - try different patterns
-            ev_patterns = [
-                (r'(\d+)\s+Hit Points', 'HP'),
-                (r'(\d+)\s+Attack', 'Attack'),
-                (r'(\d+)\s+Defense', 'Defense'),
-                (r'(\d+)\s+Special', 'Special'),
-                (r'(\d+)\s+Speed', 'Speed')
-            ]
-            
-            for pattern, stat in ev_patterns:
-                ev_match = re.search(pattern, page_text)
+            if not effort_values:
+                ev_match = EV_CELL_PATTERN.match(text)
                 if ev_match:
-                    effort_values[stat] = ev_match.group(1)
-            
-            # If we still don't have experience growth, try a broader search
-            if not experience_growth:
-                # Look for any text containing "Points" and a growth rate
-                exp_broad = re.search(r'([\d,]+)\s*Points.*?(Medium Slow|Medium Fast|Fast|Slow)', page_text)
-                if exp_broad:
-                    experience_growth['points'] = exp_broad.group(1)
-                    experience_growth['rate'] = exp_broad.group(2)
-            
-            # Fix effort values parsing - look for the specific pattern in the text
-            # The text format is like "45 Hit Points49 Attack49 Defense 65 Special45 Speed"
-            ev_text_match = re.search(r'(\d+)\s+Hit Points(\d+)\s+Attack(\d+)\s+Defense\s+(\d+)\s+Special(\d+)\s+Speed', page_text)
-            if ev_text_match:
-                effort_values['HP'] = ev_text_match.group(1)
-                effort_values['Attack'] = ev_text_match.group(2)
-                effort_values['Defense'] = ev_text_match.group(3)
-                effort_values['Special'] = ev_text_match.group(4)
-                effort_values['Speed'] = ev_text_match.group(5)
-            
-            pokemon_data['experience_growth'] = experience_growth
-            pokemon_data['effort_values'] = effort_values
-            
-            # Get damage taken (type effectiveness)
-            damage_taken = {}
-            # Look for the damage table by searching for "Damage Taken" header
-            for table in tables:
-                header = table.find('td', class_='foo')
-                if header and 'Damage Taken' in header.get_text():
-                    # This is the damage table
-                    rows = table.find_all('tr')
-                    if len(rows) >= 3:  # Header + type row + effectiveness row
-                        # Row 1: Header (Damage Taken)
-                        # Row 2: Type images
-                        # Row 3: Effectiveness values
-                        
-                        type_row = rows[1]
-                        effectiveness_row = rows[2]
-                        
-                        # Get type names from images in the type row
-                        type_cells = type_row.find_all('td', class_='footype')
-                        effectiveness_cells = effectiveness_row.find_all('td', class_='footype')
-                        
-                        # Match types with their effectiveness values
-                        for i, type_cell in enumerate(type_cells):
-                            if i < len(effectiveness_cells):
-                                # Extract type name from image source
-                                type_img = type_cell.find('img')
-                                if type_img:
-                                    src = type_img.get('src', '')
-                                    # Extract type name from path like /games/type/grass2.gif
-                                    type_match = re.search(r'/games/type/(\w+)2\.gif', src)
-                                    if type_match:
-                                        type_name = type_match.group(1).title()
-                                        
-                                        # Get corresponding effectiveness value
-                                        effectiveness_cell = effectiveness_cells[i]
-                                        effectiveness_text = effectiveness_cell.get_text(strip=True)
-                                        
-                                        # Extract the multiplier (e.g., *1, *2, *0.5, *0.25)
-                                        if effectiveness_text.startswith('*'):
-                                            multiplier = effectiveness_text[1:]  # Remove the * symbol
-                                            damage_taken[type_name] = multiplier
-                    break
-            
-            pokemon_data['damage_taken'] = damage_taken
-            
-            # Get locations
-            locations = []
-            location_tables = soup.find_all('table', class_='dextable')
-            for table in location_tables:
-                header = table.find('td', class_='fooevo')
-                if header and 'Locations' in header.get_text():
-                    # This is the locations table
-                    rows = table.find_all('tr')
-                    for row in rows:
-                        cells = row.find_all('td')
-                        if len(cells) >= 2:
-                            # Handle different row structures
-                            if len(cells) == 2:
-                                # Standard 2-cell row: [game, place]
-                                game = cells[0].get_text(strip=True)
-                                place = cells[1].get_text(strip=True)
-                                if game and place and game != 'Game' and place != 'Location':
-                                    locations.append({
-                                        "game": game,
-                                        "place": place
-                                    })
-                            elif len(cells) == 3:
-                                # Special 3-cell row: [game1, game2, place]
-                                # This handles cases like "Green (Jp.)" + "Blue (Intl.)" = "Starter Pokémon"
-                                game1 = cells[0].get_text(strip=True)
-                                game2 = cells[1].get_text(strip=True)
-                                place = cells[2].get_text(strip=True)
-                                if game1 and game2 and place and place != 'Location':
-                                    # Combine the two games with "/"
-                                    combined_game = f"{game1}/{game2}"
-                                    locations.append({
-                                        "game": combined_game,
-                                        "place": place
-                                    })
-            
-            pokemon_data['locations'] = locations
-            
-            
-            # Get moves - separate into learnset and TM moves with detailed information
-            learnset_moves = []
-            tm_moves = []
-            
-            # Find all move tables
-            move_tables = soup.find_all('table', class_='dextable')
-            for table in move_tables:
-                # Check if this is a moves table by looking for the header
-                header = table.find('td', class_='fooevo')
-                if header:
-                    header_text = header.get_text(strip=True)
-                    if 'Generation I Level Up' in header_text:
-                        # This is the learnset table
-                        rows = table.find_all('tr')
-                        for row in rows:
-                            cells = row.find_all('td')
-                            if len(cells) >= 7:  # Need enough cells for all move details
-                                level = cells[0].get_text(strip=True)
-                                move_name = cells[1].get_text(strip=True)
-                                
-                                # Extract move type from image in the type cell
-                                move_type = ""
-                                type_cell = cells[2]
-                                type_img = type_cell.find('img', src=lambda x: x and '/pokedex-bw/type/' in x and x.endswith('.gif'))
-                                if type_img:
-                                    src = type_img.get('src', '')
-                                    move_type = src.split('/')[-1].replace('.gif', '').title()
-                                
-                                power = cells[3].get_text(strip=True)
-                                accuracy = cells[4].get_text(strip=True)
-                                pp = cells[5].get_text(strip=True)
-                                effect = cells[6].get_text(strip=True) if len(cells) > 6 else ""
-                                
-                                if level and move_name and level != 'Level' and move_name != 'Attack Name':
-                                    # Look for move description in the next row or nearby
-                                    description = ""
-                                    next_row = row.find_next_sibling('tr')
-                                    if next_row:
-                                        desc_cells = next_row.find_all('td')
-                                        if desc_cells and len(desc_cells) > 0:
-                                            description = desc_cells[0].get_text(strip=True)
+                    effort_values = dict(zip(EV_STATS, ev_match.groups()))
+            if experience_growth and effort_values:
+                break
+        
+        # Pages that lay these out differently fall back to one pass over the page text
+        if not experience_growth or not effort_values:
+            page_exp, page_evs = self.search_training_text(index.soup.get_text())
+            experience_growth = experience_growth or page_exp
+            effort_values = effort_values or page_evs
+        
+        pokemon_data['experience_growth'] = experience_growth
+        pokemon_data['effort_values'] = effort_values
+
+    def search_training_text(self, page_text):
+        """
+        Experience growth and effort values from the text of a whole page,
+        with the ordered searches of the original scraper (precompiled)
+        """
+        experience_growth = {}
+        for pattern in EXP_TEXT_PATTERNS:
+            exp_match = pattern.search(page_text)
+            if exp_match:
+                experience_growth = {'points': exp_match.group(1), 'rate': exp_match.group(2).strip()}
+                break
+        if not experience_growth:
+            exp_match = EXP_BROAD_PATTERN.search(page_text)
+            if exp_match:
+                experience_growth = {'points': exp_match.group(1), 'rate': exp_match.group(2)}
+        
+        effort_values = {}
+        for stat, pattern in EV_TEXT_PATTERNS:
+            ev_match = pattern.search(page_text)
+            if ev_match:
+                effort_values[stat] = ev_match.group(1)
+        ev_match = EV_TEXT_PATTERN.search(page_text)
+        if ev_match:
+            effort_values.update(zip(EV_STATS, ev_match.groups()))
+        return experience_growth, effort_values
+
+    def extract_damage(self, index, pokemon_data):
+        """Type effectiveness from the Damage Taken table"""
+        tables = index.dextables
+        
+        # Get damage taken (type effectiveness)
+        damage_taken = {}
+        # Look for the damage table by searching for "Damage Taken" header
+        for table in tables:
+            if 'Damage Taken' in index.header_text(table, 'foo'):
+                # This is the damage table
+                rows = table.find_all('tr')
+                if len(rows) >= 3:  # Header + type row + effectiveness row
+                    # Row 1: Header (Damage Taken)
+                    # Row 2: Type images
+                    # Row 3: Effectiveness values
+                    
+                    type_row = rows[1]
+                    effectiveness_row = rows[2]
+                    
+                    # Get type names from images in the type row
+                    type_cells = type_row.find_all('td', class_='footype')
+                    effectiveness_cells = effectiveness_row.find_all('td', class_='footype')
+                    
+                    # Match types with their effectiveness values
+                    for i, type_cell in enumerate(type_cells):
+                        if i < len(effectiveness_cells):
+                            # Extract type name from image source
+                            type_img = type_cell.find('img')
+                            if type_img:
+                                src = type_img.get('src', '')
+                                # Extract type name from path like /games/type/grass2.gif
+                                type_match = re.search(r'/games/type/(\w+)2\.gif', src)
+                                if type_match:
+                                    type_name = type_match.group(1).title()
                                     
-                                    learnset_moves.append({
-                                        'level': level,
-                                        'name': move_name,
-                                        'type': move_type,
-                                        'power': power,
-                                        'accuracy': accuracy,
-                                        'pp': pp,
-                                        'effect': effect,
-                                        'description': description
-                                    })
-                    elif 'TM & HM Attacks' in header_text:
-                        # This is the TM moves table
-                        rows = table.find_all('tr')
-                        for row in rows:
-                            cells = row.find_all('td')
-                            if len(cells) >= 7:  # Need enough cells for all move details
-                                tm_number = cells[0].get_text(strip=True)
-                                move_name = cells[1].get_text(strip=True)
-                                
-                                # Extract move type from image in the type cell
-                                move_type = ""
-                                type_cell = cells[2]
-                                type_img = type_cell.find('img', src=lambda x: x and '/pokedex-bw/type/' in x and x.endswith('.gif'))
-                                if type_img:
-                                    src = type_img.get('src', '')
-                                    move_type = src.split('/')[-1].replace('.gif', '').title()
-                                
-                                power = cells[3].get_text(strip=True)
-                                accuracy = cells[4].get_text(strip=True)
-                                pp = cells[5].get_text(strip=True)
-                                effect = cells[6].get_text(strip=True) if len(cells) > 6 else ""
-                                
-                                if tm_number and move_name and tm_number != 'TM/HM #' and move_name != 'Attack Name':
-                                    # Look for move description in the next row or nearby
-                                    description = ""
-                                    next_row = row.find_next_sibling('tr')
-                                    if next_row:
-                                        desc_cells = next_row.find_all('td')
-                                        if desc_cells and len(desc_cells) > 0:
-                                            description = desc_cells[0].get_text(strip=True)
+                                    # Get corresponding effectiveness value
+                                    effectiveness_cell = effectiveness_cells[i]
+                                    effectiveness_text = effectiveness_cell.get_text(strip=True)
                                     
-                                    tm_moves.append({
-                                        'tm_number': tm_number,
-                                        'name': move_name,
-                                        'type': move_type,
-                                        'power': power,
-                                        'accuracy': accuracy,
-                                        'pp': pp,
-                                        'effect': effect,
-                                        'description': description
-                                    })
-            
-            pokemon_data['moves'] = {
-                'learnset': learnset_moves,
-                'tm_moves': tm_moves
-            }
-            
-            # Download sprite images to local sprites folder
-            pokemon_number = pokemon_data.get('number', '001')
-            base_url = "https://www.serebii.net"
-            
-            # Create the proper folder structure: data/gen1/[pokemon_number]/sprites/
-            data_folder = "data/gen1"
-            pokemon_folder = os.path.join(data_folder, pokemon_number)
-            sprites_folder = os.path.join(pokemon_folder, "sprites")
-            os.makedirs(sprites_folder, exist_ok=True)
-            
-            # Download the 6 sprite images with proper naming
-            sprite_urls = [
-                ("/pokearth/sprites/green/" + pokemon_number + ".png", f"g{pokemon_number}.png"),
-                ("/pokearth/sprites/rb/" + pokemon_number + ".png", f"rb{pokemon_number}.png"),
-                ("/pokearth/sprites/yellow/" + pokemon_number + ".png", f"y{pokemon_number}.png"),
-                ("/pokearth/sprites/green/" + pokemon_number + "-g.png", f"g{pokemon_number}-g.png"),
-                ("/pokearth/sprites/rb/" + pokemon_number + "-g.png", f"rb{pokemon_number}-g.png"),
-                ("/pokearth/sprites/yellow/" + pokemon_number + "-g.png", f"y{pokemon_number}-g.png")
-            ]
-            
-            for sprite_url, filename in sprite_urls:
-                full_url = urljoin(base_url, sprite_url)
-                local_path = os.path.join(sprites_folder, filename)
-                try:
-                    self.download_image(full_url, local_path)
-                except Exception as e:
-                    print(f"Warning: Could not download {filename}: {e}")
-                    # Continue with other images even if one fails
-            
-            # Save individual Pokémon JSON
-            self.save_individual_pokemon(pokemon_data)
-            
-            return pokemon_data
-            
-        except Exception as e:
-            print(f"Error scraping {url}: {e}")
-            return None
+                                    # Extract the multiplier (e.g., *1, *2, *0.5, *0.25)
+                                    if effectiveness_text.startswith('*'):
+                                        multiplier = effectiveness_text[1:]  # Remove the * symbol
+                                        damage_taken[type_name] = multiplier
+                break
+        
+        pokemon_data['damage_taken'] = damage_taken
+
+    def extract_locations(self, index, pokemon_data):
+        """Locations from the Locations table"""
+        tables = index.dextables
+        
+        # Get locations
+        locations = []
+        for table in tables:
+            if 'Locations' in index.header_text(table):
+                # This is the locations table
+                rows = table.find_all('tr')
+                for row in rows:
+                    cells = row.find_all('td')
+                    if len(cells) >= 2:
+                        # Handle different row structures
+                        if len(cells) == 2:
+                            # Standard 2-cell row: [game, place]
+                            game = cells[0].get_text(strip=True)
+                            place = cells[1].get_text(strip=True)
+                            if game and place and game != 'Game' and place != 'Location':
+                                locations.append({
+                                    "game": game,
+                                    "place": place
+                                })
+                        elif len(cells) == 3:
+                            # Special 3-cell row: [game1, game2, place]
+                            # This handles cases like "Green (Jp.)" + "Blue (Intl.)" = "Starter Pokémon"
+                            game1 = cells[0].get_text(strip=True)
+                            game2 = cells[1].get_text(strip=True)
+                            place = cells[2].get_text(strip=True)
+                            if game1 and game2 and place and place != 'Location':
+                                # Combine the two games with "/"
+                                combined_game = f"{game1}/{game2}"
+                                locations.append({
+                                    "game": combined_game,
+                                    "place": place
+                                })
+        
+        pokemon_data['locations'] = locations
+
+    def extract_moves(self, index, pokemon_data):
+        """Level-up and TM/HM moves with their details"""
+        # Get moves - separate into learnset and TM moves with detailed information
+        learnset_moves = []
+        tm_moves = []
+        
+        # Find all move tables by their header
+        for table in index.dextables:
+            header_text = index.header_text(table, strip=True)
+            if self.LEVEL_UP_HEADING in header_text:
+                learnset_moves.extend(self.move_rows(table, 'level', 'Level'))
+            elif 'TM & HM Attacks' in header_text:
+                tm_moves.extend(self.move_rows(table, 'tm_number', 'TM/HM #'))
+        
+        pokemon_data['moves'] = {
+            'learnset': learnset_moves,
+            'tm_moves': tm_moves
+        }
+
+    def move_rows(self, table, key, heading):
+        """
+        The moves listed in a learnset or TM table, each with its level or TM
+        number under key and either its details or, when normalizing, a
+        reference into the move table
+        """
+        moves = []
+        for row in table.find_all('tr'):
+            cells = row.find_all('td')
+            if len(cells) < 7:  # Need enough cells for all move details
+                continue
+            learned = cells[0].get_text(strip=True)
+            move_name = cells[1].get_text(strip=True)
+            if not learned or not move_name or learned == heading or move_name == 'Attack Name':
+                continue
+            
+            if self.move_table is None:
+                moves.append({key: learned, **self.move_details(move_name, cells, row)})
+            else:
+                # Moves the table already has are not parsed again
+                reference = move_id(move_name)
+                self.move_table.intern(reference, lambda: self.move_details(move_name, cells, row))
+                moves.append({key: learned, 'move': reference})
+        return moves
+
+    def move_details(self, move_name, cells, row):
+        """Type, power, accuracy, PP, effect and description of a move row"""
+        # Extract move type from image in the type cell
+        move_type = ""
+        type_img = cells[2].find('img', src=lambda x: x and '/pokedex-bw/type/' in x and x.endswith('.gif'))
+        if type_img:
+            src = type_img.get('src', '')
+            move_type = src.split('/')[-1].replace('.gif', '').title()
+        
+        # The description is in the first cell of the next row
+        description = ""
+        next_row = row.find_next_sibling('tr')
+        if next_row:
+            desc_cells = next_row.find_all('td')
+            if desc_cells:
+                description = desc_cells[0].get_text(strip=True)
+        
+        return {
+            'name': move_name,
+            'type': move_type,
+            'power': cells[3].get_text(strip=True),
+            'accuracy': cells[4].get_text(strip=True),
+            'pp': cells[5].get_text(strip=True),
+            'effect': cells[6].get_text(strip=True),
+            'description': description
+        }
 
     def scrape_gen1_pokedex():
         """
@@ -0,0 +1,88 @@
+"""
+Registry of Pokémon generations and their scraper plugins
+
+Every generation has a national dex range and a Serebii Pokédex folder.
+A generation can only be scraped once a PokedexScraper subclass with its
+extractors is registered in SCRAPERS; from then on its range and folder
+are read from the plugin's class attributes.
+"""
+
+from collections import namedtuple
+
+from gen1_scraper import Gen1Scraper
+
+Generation = namedtuple('Generation', ('number', 'dex_path', 'first', 'last'))
+
+# Extractor plugins by generation number
+SCRAPERS = {scraper.GENERATION: scraper for scraper in (Gen1Scraper,)}
+
+# Generations without a plugin yet
+PLANNED_GENERATIONS = {
+    2: Generation(2, "pokedex-gs", 152, 251),
+    3: Generation(3, "pokedex-rs", 252, 386),
+    4: Generation(4, "pokedex-dp", 387, 493),
+    5: Generation(5, "pokedex-bw", 494, 649),
+    6: Generation(6, "pokedex-xy", 650, 721),
+    7: Generation(7, "pokedex-sm", 722, 809),
+    8: Generation(8, "pokedex-swsh", 810, 905),
+    9: Generation(9, "pokedex-sv", 906, 1025),
+}
+
+GENERATIONS = dict(sorted({
+    **PLANNED_GENERATIONS,
+    **{number: Generation(number, scraper.DEX_PATH, scraper.FIRST_NUMBER, scraper.LAST_NUMBER)
+       for number, scraper in SCRAPERS.items()}
+}.items()))
+
+
+def parse_numbers(text, maximum):
+    """
+    The numbers in a selection such as "1", "1-3", "1,4-5" or "all",
+    in ascending order
+    """
+    if text.strip().lower() == 'all':
+        return list(range(1, maximum + 1))
+    numbers = set()
+    for part in text.split(','):
+        first, separator, last = part.strip().partition('-')
+        first = int(first)
+        last = int(last) if separator else first
+        if first < 1 or last < first:
+            raise ValueError(f"invalid selection: {part.strip()}")
+        numbers.update(range(first, last + 1))
+    return sorted(numbers)
+
+
+def plan_run(generations=None, numbers=None):
+    """
+    The (generation, dex numbers) pairs of a run
+
+    generations is a list of generation numbers and numbers a list of
+    national dex numbers; either may be None. Each generation is scraped
+    from its own Pokédex, limited to the selected numbers it introduced.
+    Without generations, every generation that introduced one of the
+    numbers is included; without either, Generation 1 alone.
+    """
+    if generations is None:
+        if numbers is None:
+            generations = [1]
+        else:
+            generations = [generation.number for generation in GENERATIONS.values()
+                           if any(generation.first <= number <= generation.last for number in numbers)]
+    selected = set(numbers) if numbers is not None else None
+
+    plan = []
+    for number in generations:
+        if number not in GENERATIONS:
+            raise ValueError(f"there is no Generation {number}")
+        generation = GENERATIONS[number]
+        dex_numbers = [dex_number for dex_number in range(generation.first, generation.last + 1)
+                       if selected is None or dex_number in selected]
+        if dex_numbers:
+            plan.append((number, dex_numbers))
+    return plan
+
+
+def scraper_class(generation):
+    """The scraper plugin for a generation, or None if there is none yet"""
+    return SCRAPERS.get(generation)
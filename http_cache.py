@@ -0,0 +1,182 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class CacheMissError(Exception):
+    """Raised in offline mode when a URL has never been cached"""
+
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache
+
+    Bodies are stored once per content hash under bodies/, and every URL gets
+    a small metadata file under meta/ pointing at its body together with the
+    ETag / Last-Modified validators the server sent.
+    """
+
+    def __init__(self, directory="data/cache", ttl=7 * 24 * 3600, max_bytes=500 * 1024 * 1024, offline=False):
+        self.directory = directory
+        # Seconds a cached response is used without asking the server again
+        self.ttl = ttl
+        # Total size of stored bodies before the least recently used are evicted
+        self.max_bytes = max_bytes
+        # Never touch the network; only serve what is already cached
+        self.offline = offline
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'evicted': 0}
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._load()
+
+    def _load(self):
+        """Read every URL entry from the metadata directory"""
+        meta_dir = os.path.join(self.directory, "meta")
+        os.makedirs(meta_dir, exist_ok=True)
+        os.makedirs(os.path.join(self.directory, "bodies"), exist_ok=True)
+        for filename in os.listdir(meta_dir):
+            if not filename.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(meta_dir, filename), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                self._entries[entry['url']] = entry
+            except (OSError, ValueError, KeyError):
+                # A half-written or corrupt entry is simply fetched again
+                continue
+
+    def _meta_path(self, url):
+        url_hash = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, "meta", f"{url_hash}.json")
+
+    def _body_path(self, body_hash):
+        return os.path.join(self.directory, "bodies", body_hash[:2], body_hash)
+
+    def _write_atomic(self, path, data):
+        """Write to a temp file and rename it so readers never see partial files"""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _save_entry(self, entry):
+        data = json.dumps(entry, ensure_ascii=False).encode('utf-8')
+        self._write_atomic(self._meta_path(entry['url']), data)
+
+    def _read_body(self, entry):
+        try:
+            with open(self._body_path(entry['body']), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def entry(self, url):
+        """Return the cached metadata for url, or None, without any network access"""
+        with self._lock:
+            return self._entries.get(url)
+
+    def fetch(self, url, get):
+        """
+        Return the body for url, using the cache where possible
+
+        get(headers) must perform the actual request and return a
+        requests.Response; it is only called when the network is needed.
+        """
+        with self._lock:
+            entry = self._entries.get(url)
+        body = self._read_body(entry) if entry else None
+
+        if body is not None:
+            if self.offline or time.time() - entry['fetched_at'] < self.ttl:
+                self._touch(entry)
+                self._count('hits')
+                return body
+        elif self.offline:
+            raise CacheMissError(f"{url} is not in the cache")
+
+        # Ask the server whether our copy is still current
+        headers = {}
+        if body is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = get(headers)
+        if response.status_code == 304 and body is not None:
+            entry = dict(entry, fetched_at=time.time())
+            entry['etag'] = response.headers.get('ETag', entry.get('etag'))
+            entry['last_modified'] = response.headers.get('Last-Modified', entry.get('last_modified'))
+            self._touch(entry)
+            self._count('revalidated')
+            return body
+
+        response.raise_for_status()
+        self._count('misses')
+        self.store(url, response.content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return response.content
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Save a response body and its validators"""
+        body_hash = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(body_hash)
+        if not os.path.exists(body_path):
+            self._write_atomic(body_path, body)
+
+        now = time.time()
+        entry = {
+            'url': url,
+            'body': body_hash,
+            'size': len(body),
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': now,
+            'accessed_at': now
+        }
+        with self._lock:
+            self._entries[url] = entry
+            self._save_entry(entry)
+            self._evict()
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def _touch(self, entry):
+        """Record a use of an entry so eviction keeps recently used bodies"""
+        entry = dict(entry, accessed_at=time.time())
+        with self._lock:
+            self._entries[entry['url']] = entry
+            self._save_entry(entry)
+
+    def total_bytes(self):
+        """Size of all distinct bodies referenced by the cache"""
+        sizes = {entry['body']: entry['size'] for entry in self._entries.values()}
+        return sum(sizes.values())
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+
+        for entry in sorted(self._entries.values(), key=lambda e: e['accessed_at']):
+            if total <= self.max_bytes:
+                break
+            del self._entries[entry['url']]
+            try:
+                os.remove(self._meta_path(entry['url']))
+            except OSError:
+                pass
+            self.stats['evicted'] += 1
+
+            # Bodies are shared between URLs; only delete unreferenced ones
+            if not any(e['body'] == entry['body'] for e in self._entries.values()):
+                total -= entry['size']
+                try:
+                    os.remove(self._body_path(entry['body']))
+                except OSError:
+                    pass
@@ -0,0 +1,127 @@
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from output_sink import OutputSink
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageTimer:
+    """
+    Thread-safe collection of timing spans, grouped by stage name
+
+    Stages used by the scraper are fetch, parse (soup and index), one
+    extract.<section> per page section, sprite, and json_write.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+
+    @contextmanager
+    def span(self, stage):
+        """Time the body of a with-block as one sample of stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def record(self, stage, seconds):
+        with self._lock:
+            self.samples.setdefault(stage, []).append(seconds)
+
+    def summary(self):
+        """Count, total, mean, p50, p95 and max (in ms) of every stage"""
+        with self._lock:
+            samples = {stage: sorted(values) for stage, values in self.samples.items()}
+
+        summary = {}
+        for stage, values in samples.items():
+            total = sum(values)
+            summary[stage] = {
+                'count': len(values),
+                'total_ms': round(total * 1000, 3),
+                'mean_ms': round(total * 1000 / len(values), 3),
+                'p50_ms': round(percentile(values, 0.50) * 1000, 3),
+                'p95_ms': round(percentile(values, 0.95) * 1000, 3),
+                'max_ms': round(values[-1] * 1000, 3)
+            }
+        return summary
+
+    def save(self, path, sink=None):
+        """Write the summary as JSON through an OutputSink"""
+        (sink or OutputSink()).write_json(path, self.summary())
+        print(f"Timings saved to {path}")
+
+    def print_summary(self):
+        """Print p50/p95 of every stage, slowest total first"""
+        summary = self.summary()
+        if not summary:
+            return
+        print(f"\n{'Stage':<18} count     p50 ms     p95 ms   total ms")
+        for stage, stats in sorted(summary.items(), key=lambda item: -item[1]['total_ms']):
+            print(f"{stage:<18} {stats['count']:5d} {stats['p50_ms']:10.2f} {stats['p95_ms']:10.2f} "
+                  f"{stats['total_ms']:10.1f}")
+
+
+class PageProfiler:
+    """
+    Opt-in profiler that writes one profile per parsed page
+
+    kind is "cprofile" (writes <name>.prof, readable with pstats or snakeviz)
+    or "pyinstrument" (writes <name>.html; needs pip install pyinstrument).
+    Only one page is profiled at a time: Python 3.12+ refuses to run two
+    profilers at once, so with several workers the others wait their turn.
+    """
+
+    KINDS = ('cprofile', 'pyinstrument')
+
+    def __init__(self, kind, directory):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown profiler '{kind}' (choose from {', '.join(self.KINDS)})")
+        if kind == 'pyinstrument':
+            # Fail early rather than on the first page
+            import pyinstrument  # noqa: F401
+        self.kind = kind
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def profile(self, name):
+        """Profile the body of a with-block and save it as name"""
+        with self._lock:
+            with self._profile(name):
+                yield
+
+    @contextmanager
+    def _profile(self, name):
+        if self.kind == 'cprofile':
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                profiler.dump_stats(os.path.join(self.directory, f"{name}.prof"))
+        else:
+            from pyinstrument import Profiler
+            profiler = Profiler()
+            profiler.start()
+            try:
+                yield
+            finally:
+                profiler.stop()
+                with open(os.path.join(self.directory, f"{name}.html"), 'w', encoding='utf-8') as f:
+                    f.write(profiler.output_html())
@@ -0,0 +1,112 @@
+import json
+import re
+import threading
+
+from output_sink import OutputSink
+
+# Fields of a learnset or TM entry that describe the move itself
+MOVE_FIELDS = ('name', 'type', 'power', 'accuracy', 'pp', 'effect', 'description')
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]')
+
+
+def move_id(name):
+    """
+    The ID of a move, as Serebii's attackdex spells it
+    (e.g. "Double-Edge" -> "doubleedge")
+    """
+    return NON_ALPHANUMERIC.sub('', name.lower())
+
+
+class MoveTable:
+    """
+    Run-level table of move details, keyed by move ID
+
+    In normalized output the learnset and TM entries of each Pokémon only
+    hold their level or TM number and a move ID; the name, type, power,
+    accuracy, PP, effect and description are stored once here and saved as
+    moves.json next to the Pokédex.
+    """
+
+    def __init__(self):
+        self.moves = {}
+        self.stats = {'extracted': 0, 'reused': 0}
+        self._lock = threading.Lock()
+
+    def intern(self, move_id, extract):
+        """
+        Record a move the first time it is seen; extract() returns its
+        details and is not called for moves the table already has
+        """
+        with self._lock:
+            if move_id in self.moves:
+                self.stats['reused'] += 1
+                return
+        details = extract()
+        with self._lock:
+            if move_id not in self.moves:
+                self.moves[move_id] = details
+                self.stats['extracted'] += 1
+
+    def add(self, moves):
+        """Add moves extracted elsewhere, such as in a parse process"""
+        with self._lock:
+            for added_id, details in moves.items():
+                self.moves.setdefault(added_id, details)
+
+    def merge_stats(self, counts):
+        """Add the extracted and reused counts of another table"""
+        with self._lock:
+            for name, count in counts.items():
+                self.stats[name] += count
+
+    def normalize(self, pokemon_data):
+        """
+        Replace the move details in a Pokémon's learnset and TM entries with
+        move IDs, adding unknown moves to the table (entries that already
+        hold a move ID are left alone)
+        """
+        moves = pokemon_data.get('moves', {})
+        for key in ('learnset', 'tm_moves'):
+            entries = []
+            for entry in moves.get(key, []):
+                if 'move' not in entry:
+                    details = {field: entry.get(field, '') for field in MOVE_FIELDS}
+                    entry = {name: value for name, value in entry.items() if name not in MOVE_FIELDS}
+                    entry['move'] = move_id(details['name'])
+                    self.intern(entry['move'], lambda: details)
+                entries.append(entry)
+            if key in moves:
+                moves[key] = entries
+        return pokemon_data
+
+    def expand(self, pokemon_data):
+        """A copy of a normalized Pokémon with the move details filled back in"""
+        expanded = dict(pokemon_data)
+        moves = pokemon_data.get('moves', {})
+        expanded['moves'] = {}
+        for key, entries in moves.items():
+            expanded['moves'][key] = []
+            for entry in entries:
+                if 'move' in entry:
+                    details = self.moves.get(entry['move'], {})
+                    entry = {name: value for name, value in entry.items() if name != 'move'}
+                    entry.update(details)
+                expanded['moves'][key].append(entry)
+        return expanded
+
+    def load(self, path):
+        """Add the moves saved by an earlier run, if there is a moves file"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return
+        self.add(saved)
+
+    def save(self, path, sink=None):
+        """Write the table as JSON, sorted by move ID, through an OutputSink"""
+        with self._lock:
+            moves = dict(sorted(self.moves.items()))
+        (sink or OutputSink()).write_json(path, moves)
+        print(f"Move table saved to {path}")
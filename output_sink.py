@@ -0,0 +1,83 @@
+import hashlib
+import json
+import os
+import threading
+
+
+class OutputSink:
+    """
+    Writes every output file of a run exactly once and atomically
+
+    Content is written to a temp file and renamed into place, so readers
+    never see a half-written file. A file whose content hash matches what
+    is already on disk is left untouched, and directories are only created
+    the first time a file goes into them. With compact, JSON is written
+    without indentation or spaces.
+    """
+
+    def __init__(self, compact=False):
+        self.compact = compact
+        self.stats = {'written': 0, 'unchanged': 0}
+        self._lock = threading.Lock()
+        # Content hash of every file written or checked during this run
+        self._hashes = {}
+        self._directories = set()
+
+    def dumps(self, data):
+        """data as JSON text in the configured layout"""
+        if self.compact:
+            return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        return json.dumps(data, indent=2, ensure_ascii=False)
+
+    def write_json(self, path, data):
+        """Write data as JSON to path; returns the SHA-256 of the file"""
+        return self.write(path, self.dumps(data).encode('utf-8'))
+
+    def write(self, path, content):
+        """
+        Write bytes to path unless it already holds exactly them; returns
+        the SHA-256 of the content
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        if self._unchanged(path, content, content_hash):
+            self._count('unchanged')
+            return content_hash
+
+        self._make_directory(os.path.dirname(path))
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(content)
+        os.replace(temp_path, path)
+        with self._lock:
+            self._hashes[path] = content_hash
+        self._count('written')
+        return content_hash
+
+    def _unchanged(self, path, content, content_hash):
+        with self._lock:
+            known_hash = self._hashes.get(path)
+        if known_hash is not None:
+            return known_hash == content_hash and os.path.exists(path)
+        # First time this run: compare with what an earlier run left behind
+        try:
+            if os.path.getsize(path) != len(content):
+                return False
+            with open(path, 'rb') as f:
+                same = f.read() == content
+        except OSError:
+            return False
+        if same:
+            with self._lock:
+                self._hashes[path] = content_hash
+        return same
+
+    def _make_directory(self, directory):
+        if not directory or directory in self._directories:
+            return
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._directories.add(directory)
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
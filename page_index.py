@@ -0,0 +1,112 @@
+import re
+
+from bs4 import Tag
+
+# Start tag of a dextable in the raw page
+DEXTABLE_START = re.compile(rb'<table\b[^>]*?\bclass\s*=\s*["\']?[^"\'>]*\bdextable\b', re.IGNORECASE)
+
+
+class PageIndex:
+    """
+    Index of the parts of a Serebii page that the section extractors read
+
+    One walk over the parsed document collects the title, every dextable
+    (in page order), every fooinfo cell and the header cell of each dextable.
+    A dextable's header is its first descendant td with class fooevo (or
+    foo), the same cell table.find('td', class_=...) would return.
+    """
+
+    HEADER_CLASSES = ('fooevo', 'foo')
+
+    def __init__(self, soup):
+        self.title = None
+        self.dextables = []
+        self.fooinfo = []
+        self._headers = {}
+        self._header_texts = {}
+        self._fooinfo_texts = None
+        self.soup = soup
+        self._build(soup)
+
+    def _build(self, soup):
+        dextable_ids = set()
+        # Iterating descendants directly is much cheaper than find_all(),
+        # which runs its tag matcher on every element of the page
+        for tag in soup.descendants:
+            if tag.__class__ is not Tag or tag.name not in ('title', 'table', 'td'):
+                continue
+            if tag.name == 'title':
+                if self.title is None:
+                    self.title = tag
+                continue
+
+            classes = tag.get('class') or ()
+            if tag.name == 'table':
+                if 'dextable' in classes:
+                    self.dextables.append(tag)
+                    dextable_ids.add(id(tag))
+                    self._headers[id(tag)] = {}
+                continue
+
+            if 'fooinfo' in classes:
+                self.fooinfo.append(tag)
+
+            header_classes = [c for c in self.HEADER_CLASSES if c in classes]
+            if not header_classes:
+                continue
+            # Tables always come before their cells in document order, so the
+            # first header cell seen inside a dextable is its header
+            for parent in tag.parents:
+                if id(parent) in dextable_ids:
+                    headers = self._headers[id(parent)]
+                    for header_class in header_classes:
+                        headers.setdefault(header_class, tag)
+
+    def header(self, table, header_class='fooevo'):
+        """The header cell of a dextable, or None"""
+        return self._headers.get(id(table), {}).get(header_class)
+
+    def header_text(self, table, header_class='fooevo', strip=False):
+        """The text of a dextable's header cell, or '' if it has none"""
+        key = (id(table), header_class, strip)
+        if key not in self._header_texts:
+            header = self.header(table, header_class)
+            self._header_texts[key] = header.get_text(strip=strip) if header is not None else ''
+        return self._header_texts[key]
+
+    def fooinfo_texts(self):
+        """The stripped text of every fooinfo cell, in page order (computed once)"""
+        if self._fooinfo_texts is None:
+            self._fooinfo_texts = [cell.get_text(strip=True) for cell in self.fooinfo]
+        return self._fooinfo_texts
+
+    def table_with_header(self, text, header_class='fooevo'):
+        """The first dextable whose header contains text, or None"""
+        for table in self.dextables:
+            if text in self.header_text(table, header_class):
+                return table
+        return None
+
+    def dextable_sources(self, content):
+        """
+        The raw bytes of the page each dextable was parsed from, in page
+        order, or None if the page cannot be split up reliably
+
+        A table's bytes run from its start tag to the start of the next
+        dextable that is not nested in it, so they always hold the whole
+        table. Hashing these is much cheaper than serializing the tables.
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        starts = [match.start() for match in DEXTABLE_START.finditer(content)]
+        if len(starts) != len(self.dextables):
+            return None
+        positions = {id(table): i for i, table in enumerate(self.dextables)}
+        # Positions of the dextables each dextable is nested in
+        nested_in = [{positions[id(parent)] for parent in table.parents if id(parent) in positions}
+                     for table in self.dextables]
+        sources = []
+        for i, start in enumerate(starts):
+            end = next((starts[j] for j in range(i + 1, len(starts)) if i not in nested_in[j]), len(content))
+            sources.append(content[start:end])
+        return sources
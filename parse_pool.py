@@ -0,0 +1,98 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# The scraper each worker process parses with, created once per process
+_scraper = None
+
+
+def _start_worker(scraper_type, options):
+    global _scraper
+    _scraper = scraper_type(**options)
+
+
+def _stat_counts(scraper):
+    counts = {'evolution_graph': dict(scraper.evolution_graph.stats), 'changes': dict(scraper.changes.stats)}
+    if scraper.move_table is not None:
+        counts['move_table'] = dict(scraper.move_table.stats)
+    return counts
+
+
+def parse_page(content, reuse=None):
+    """
+    Parse one page in a worker process
+
+    Returns the Pokémon data and section hashes together with what the
+    parent needs to merge into its own run: the moves this process saw for
+    the first time, how many evolution chains, moves and sections it parsed
+    or reused, and its timings.
+    """
+    scraper = _scraper
+    scraper.timer.samples = {}
+    known_moves = len(scraper.move_table.moves) if scraper.move_table is not None else 0
+    before = _stat_counts(scraper)
+
+    pokemon_data, section_hashes = scraper.extract_page(content, reuse)
+
+    new_moves = {}
+    if scraper.move_table is not None:
+        # Moves are added in order, so the new ones come last
+        new_moves = dict(list(scraper.move_table.moves.items())[known_moves:])
+    stats = {name: {stat: count - before[name][stat] for stat, count in counts.items()}
+             for name, counts in _stat_counts(scraper).items()}
+    return pokemon_data, section_hashes, new_moves, stats, scraper.timer.samples
+
+
+class ParsePool:
+    """
+    Parses pages in worker processes so parsing uses every core
+
+    BeautifulSoup and the section extractors are pure Python, so threads
+    cannot parse more than one page at a time. The scraper's I/O threads
+    keep fetching and hand the raw HTML to this pool; every worker process
+    runs its own copy of the scraper's parser and the results are merged
+    back into the scraper (moves, evolution chain counts and timings).
+    """
+
+    def __init__(self, scraper, processes):
+        self.scraper = scraper
+        self.processes = max(1, processes)
+        options = {
+            'delay': 0,
+            'parser': scraper.parser,
+            'normalize_moves': scraper.move_table is not None,
+            'fields': scraper.fields,
+            'incremental': scraper.incremental,
+            'sprite_workers': 1
+        }
+        # Spawned, not forked: the scraper already runs threads when the
+        # first page arrives
+        self._executor = ProcessPoolExecutor(max_workers=self.processes,
+                                             mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_start_worker, initargs=(type(scraper), options))
+
+    def parse(self, content):
+        """Parse one page in a worker process and return its Pokémon data"""
+        return self.extract(content)[0]
+
+    def extract(self, content, reuse=None):
+        """Scraper.extract_page in a worker process"""
+        return self._merge(self._executor.submit(parse_page, content, reuse).result())
+
+    def map(self, contents):
+        """Parse many pages at once, yielding their Pokémon data in order"""
+        for result in self._executor.map(parse_page, contents):
+            yield self._merge(result)[0]
+
+    def _merge(self, result):
+        pokemon_data, section_hashes, new_moves, stats, samples = result
+        if new_moves:
+            self.scraper.move_table.add(new_moves)
+        for name, counts in stats.items():
+            getattr(self.scraper, name).merge_stats(counts)
+        for stage, seconds in samples.items():
+            for value in seconds:
+                self.scraper.timer.record(stage, value)
+        return pokemon_data, section_hashes
+
+    def shutdown(self):
+        self._executor.shutdown()
@@ -0,0 +1,31 @@
+from bs4 import BeautifulSoup
+from bs4.builder import builder_registry
+
+# BeautifulSoup tree builders in order of preference, fastest first.
+# lxml is optional; html.parser ships with Python and is always available.
+PARSER_BACKENDS = ('lxml', 'html.parser')
+
+
+def available_backends():
+    """The parser backends installed on this machine, fastest first"""
+    return [backend for backend in PARSER_BACKENDS if builder_registry.lookup(backend) is not None]
+
+
+def choose_backend(preferred=None):
+    """
+    Pick the HTML parser backend to use
+
+    With no preference the fastest installed backend is used.
+    """
+    available = available_backends()
+    if preferred is None:
+        return available[0]
+    if preferred not in available:
+        raise ValueError(f"HTML parser backend '{preferred}' is not installed "
+                         f"(available: {', '.join(available)})")
+    return preferred
+
+
+def make_soup(content, backend):
+    """Parse a page with the given backend"""
+    return BeautifulSoup(content, backend)
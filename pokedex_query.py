@@ -0,0 +1,217 @@
+"""
+Indexed, in-memory queries over the scraped Pokédex
+
+PokedexQuery loads gen1_pokedex.json (or .ndjson) once and builds
+secondary indexes by name, number, type, learnset move, TM, location,
+game and evolution family, so a query is a dict lookup instead of a scan
+over every Pokémon:
+
+    pokedex = PokedexQuery.load("data/gen1/gen1_pokedex.json")
+    pokedex.of_type("Water")
+    pokedex.learns_by_tm("Thunderbolt")
+    pokedex.at("Route 24")
+
+Results are the Pokémon records as the scraper wrote them, in Pokédex
+order. Normalized output, whose learnsets hold move IDs, works the same way.
+"""
+
+import json
+
+from move_table import move_id
+from pokedex_writer import read_pokedex
+
+
+def name_key(name):
+    return (name or '').strip().casefold()
+
+
+def dex_key(number):
+    """A Pokédex number such as 25, "25" or "025" as an int, or None"""
+    try:
+        return int(number)
+    except (TypeError, ValueError):
+        return None
+
+
+def tm_key(tm_number):
+    """A TM or HM such as 24, "24", "tm24" or "HM01" as "TM24"/"HM01" """
+    if isinstance(tm_number, int):
+        return f"TM{tm_number:02d}"
+    text = str(tm_number).strip().upper()
+    if text.isdigit():
+        return f"TM{int(text):02d}"
+    prefix, digits = text[:2], text[2:].strip()
+    return f"{prefix}{int(digits):02d}" if digits.isdigit() else text
+
+
+def in_dex_order(pokedex):
+    """The records of a Pokédex sorted by Pokédex number"""
+    return sorted(pokedex, key=lambda pokemon: dex_key(pokemon.get('number')) or 0)
+
+
+def load_pokedex(path="data/gen1/gen1_pokedex.json"):
+    """The records of a Pokédex written by the scraper, as a JSON array or NDJSON"""
+    if path.endswith('.ndjson'):
+        return list(read_pokedex(path))
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+class RowIndex:
+    """Row of each Pokémon of a list by name (any case) and Pokédex number"""
+
+    def __init__(self, pokedex):
+        self._rows = {}
+        for row, pokemon in enumerate(pokedex):
+            self._rows.setdefault(name_key(pokemon.get('name')), row)
+            self._rows.setdefault(dex_key(pokemon.get('number')) or 0, row)
+
+    def rows(self, pokemon):
+        """Row indexes of Pokémon given by name or Pokédex number"""
+        indexes = []
+        for name_or_number in pokemon:
+            number = dex_key(name_or_number)
+            key = number if number is not None else name_key(name_or_number)
+            if key not in self._rows:
+                raise KeyError(f"{name_or_number} is not in the Pokédex")
+            indexes.append(self._rows[key])
+        return indexes
+
+
+def places(place):
+    """The separate places in a location such as "Viridian Forest, Power Plant" """
+    return [part.strip() for part in (place or '').split(',') if part.strip()]
+
+
+class PokedexQuery:
+    """Secondary indexes over a list of Pokémon records"""
+
+    def __init__(self, pokedex):
+        # Every record, in Pokédex order
+        self.pokemon = in_dex_order(pokedex)
+        self._by_name = {}
+        self._by_number = {}
+        self._by_type = {}
+        self._by_level_move = {}
+        self._by_tm_move = {}
+        self._by_tm = {}
+        # Keyed by place, and by (game, place)
+        self._by_place = {}
+        self._by_game = {}
+        self._family = {}
+        for pokemon in self.pokemon:
+            self._add(pokemon)
+        self._link_families()
+
+    @classmethod
+    def load(cls, path="data/gen1/gen1_pokedex.json"):
+        """Load a Pokédex written by the scraper, as a JSON array or NDJSON"""
+        return cls(load_pokedex(path))
+
+    def _add(self, pokemon):
+        self._by_name.setdefault(name_key(pokemon.get('name')), pokemon)
+        number = dex_key(pokemon.get('number'))
+        if number is not None:
+            self._by_number.setdefault(number, pokemon)
+        for pokemon_type in pokemon.get('types', []):
+            self._by_type.setdefault(name_key(pokemon_type), []).append(pokemon)
+
+        moves = pokemon.get('moves', {})
+        for entry in moves.get('learnset', []):
+            self._index_once(self._by_level_move, self.entry_move_id(entry), pokemon)
+        for entry in moves.get('tm_moves', []):
+            self._index_once(self._by_tm_move, self.entry_move_id(entry), pokemon)
+            self._index_once(self._by_tm, tm_key(entry.get('tm_number', '')), pokemon)
+
+        for location in pokemon.get('locations', []):
+            self._index_once(self._by_game, name_key(location.get('game')), pokemon)
+            for place in places(location.get('place')):
+                self._index_once(self._by_place, name_key(place), pokemon)
+                self._index_once(self._by_place, (name_key(location.get('game')), name_key(place)), pokemon)
+
+    @staticmethod
+    def _index_once(index, key, pokemon):
+        """Add pokemon under key unless it was the last one added there"""
+        entries = index.setdefault(key, [])
+        if not entries or entries[-1] is not pokemon:
+            entries.append(pokemon)
+
+    @staticmethod
+    def entry_move_id(entry):
+        """The move ID of a learnset or TM entry, detailed or normalized"""
+        return entry['move'] if 'move' in entry else move_id(entry.get('name', ''))
+
+    def _link_families(self):
+        """
+        Group Pokémon connected by pevos/evos, in either direction, into
+        one shared family list
+        """
+        parent = {number: number for number in self._by_number}
+
+        def root(number):
+            while parent[number] != number:
+                parent[number] = parent[parent[number]]
+                number = parent[number]
+            return number
+
+        for number, pokemon in self._by_number.items():
+            for evo in pokemon.get('pevos', []) + pokemon.get('evos', []):
+                relative = dex_key(evo.get('mon'))
+                if relative in parent:
+                    parent[root(relative)] = root(number)
+
+        families = {}
+        for number in sorted(self._by_number):
+            family = families.setdefault(root(number), [])
+            family.append(self._by_number[number])
+            self._family[number] = family
+
+    def get(self, name_or_number):
+        """A Pokémon by name (any case) or Pokédex number, or None"""
+        number = dex_key(name_or_number)
+        if number is not None:
+            return self._by_number.get(number)
+        return self._by_name.get(name_key(name_or_number))
+
+    def by_name(self, name):
+        return self._by_name.get(name_key(name))
+
+    def by_number(self, number):
+        return self._by_number.get(dex_key(number))
+
+    def of_type(self, pokemon_type):
+        """Every Pokémon with pokemon_type as one of its types"""
+        return list(self._by_type.get(name_key(pokemon_type), ()))
+
+    def learns_by_level(self, move):
+        """Every Pokémon that learns move (name or ID) by leveling up"""
+        return list(self._by_level_move.get(move_id(move), ()))
+
+    def learns_by_tm(self, move):
+        """Every Pokémon that can be taught move (name or ID) by TM/HM"""
+        return list(self._by_tm_move.get(move_id(move), ()))
+
+    def learns(self, move):
+        """Every Pokémon that learns move either way"""
+        found = {id(pokemon): pokemon for pokemon in self.learns_by_level(move) + self.learns_by_tm(move)}
+        return in_dex_order(found.values())
+
+    def tm(self, tm_number):
+        """Every Pokémon compatible with a TM or HM such as 24, "TM24" or "HM01" """
+        return list(self._by_tm.get(tm_key(tm_number), ()))
+
+    def at(self, place, game=None):
+        """Every Pokémon found at place (e.g. "Route 24"), optionally in one game"""
+        key = name_key(place) if game is None else (name_key(game), name_key(place))
+        return list(self._by_place.get(key, ()))
+
+    def in_game(self, game):
+        """Every Pokémon with a location in game, e.g. "Red" or "Blue (Jp.)" """
+        return list(self._by_game.get(name_key(game), ()))
+
+    def family(self, name_or_number):
+        """Every Pokémon in the evolution family of a Pokémon"""
+        pokemon = self.get(name_or_number)
+        if pokemon is None:
+            return []
+        return list(self._family.get(dex_key(pokemon.get('number')), [pokemon]))
@@ -0,0 +1,732 @@
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from change_report import ChangeReport
+from dataset_export import export_sqlite
+from evolution_chain import EvolutionGraph
+from instrumentation import StageTimer
+from move_table import MoveTable
+from output_sink import OutputSink
+from page_index import PageIndex
+from parse_pool import ParsePool
+from parser_backend import choose_backend, make_soup
+from pokedex_writer import PokedexWriter, read_pokedex
+from rate_limiter import RETRY_STATUSES, THROTTLE_STATUSES, RateLimiter, backoff_delay, parse_retry_after
+from scrape_manifest import ScrapeManifest
+from sprite_pipeline import SpritePipeline
+
+
+class PokedexScraper:
+    """
+    Generation-agnostic scraping engine
+
+    Fetching, caching, rate limiting, scheduling and writing the Pokédex
+    live here. A generation plugin subclasses it, sets the class attributes
+    below and adds an extract_<section> method for each of its SECTIONS;
+    it may override page_url and sprite_jobs where its pages differ.
+    """
+
+    # Generation number, Serebii Pokédex folder and national dex range
+    GENERATION = None
+    DEX_PATH = "pokedex"
+    FIRST_NUMBER = 1
+    LAST_NUMBER = 151
+
+    # Page sections in the order their fields appear in the output
+    SECTIONS = ()
+    # Output field -> the section whose extractor fills it in, for fields=
+    FIELDS = {}
+    # Sections extracted whatever fields are asked for, e.g. the number
+    # every file is saved under
+    REQUIRED_SECTIONS = ()
+    # Section -> header texts of the only dextables its extractor reads; on
+    # incremental runs such a section is extracted again only when those
+    # tables change, any other section whenever the page changes
+    SECTION_TABLES = {}
+
+    def __init__(self, workers=1, delay=1.0, pool_size=10, cache=None, resume=False, max_age=None,
+                 sprite_workers=4, defer_sprites=False, parser=None, profiler=None,
+                 normalize_moves=False, stream=False, json_array=True, export_sqlite=False,
+                 burst=1, max_retries=3, retry_rounds=1, backoff_base=1.0, compact=False,
+                 numbers=None, pool_from=None, parse_processes=0, fields=None, incremental=False):
+        self.generation = str(self.GENERATION)
+        # National dex numbers to scrape; the whole generation by default
+        self.numbers = sorted(numbers) if numbers else list(range(self.FIRST_NUMBER, self.LAST_NUMBER + 1))
+        self.base_url = f"https://www.serebii.net/{self.DEX_PATH}"
+        self.data_dir = f"data/gen{self.generation}"
+        self.headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        }
+        self.pokemon_data = []
+        # Number of pages fetched and parsed at the same time
+        self.workers = max(1, workers)
+        # Token bucket shared by all workers so the total request rate stays
+        # polite; up to burst requests may go out back to back. Scrapers
+        # created with pool_from share its session and rate limiter, so a
+        # multi-generation run stays just as polite
+        self.rate_limiter = pool_from.rate_limiter if pool_from else RateLimiter(delay, burst)
+        # Failed requests are retried max_retries times, backing off from
+        # backoff_base seconds; Pokémon that still fail are scraped again in
+        # up to retry_rounds extra passes at the end of the run
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.retry_rounds = max(0, retry_rounds)
+        # One keep-alive session for every page and sprite request
+        self.session = pool_from.session if pool_from else self.create_session(pool_size)
+        # Optional ResponseCache; pages and sprites are fetched through it
+        self.cache = cache
+        # Per-Pokémon checkpoints so an interrupted run can pick up where it stopped
+        self.manifest = ScrapeManifest(os.path.join(self.data_dir, "manifest.json"))
+        # Skip Pokémon already saved by a previous run (younger than max_age seconds)
+        self.resume = resume
+        self.max_age = max_age
+        # Timing spans for every stage of the run, summarized at the end
+        self.timer = StageTimer()
+        # Writes every output file once, atomically, skipping unchanged ones;
+        # compact leaves out the indentation
+        self.compact = compact
+        self.output = OutputSink(compact)
+        # Evolution chains parsed so far, shared by every page of a family
+        self.evolution_graph = EvolutionGraph()
+        # Optional PageProfiler that profiles the parsing of every page
+        self.profiler = profiler
+        # Sprites download in the background so they never hold up page
+        # parsing; sprite requests that reach the server wait for the same
+        # rate limiter as pages
+        self.sprites = SpritePipeline(lambda url: self.fetch(url, throttle=True), cache=cache,
+                                      workers=sprite_workers, defer=defer_sprites, timer=self.timer,
+                                      sink=self.output)
+        # HTML parser backend; defaults to the fastest one installed
+        self.parser = choose_backend(parser)
+        # With parse_processes, pages are parsed in that many worker processes
+        # while the worker threads only fetch
+        self.parse_processes = max(0, parse_processes)
+        self.parse_pool = None
+        # Only the sections behind these fields are extracted, and sprites
+        # are only downloaded if "sprites" is one of them; None means all
+        self.fields = fields
+        self.sections = self.select_sections(fields)
+        self.want_sprites = fields is None or 'sprites' in fields
+        # Incremental runs hash every fetched page and page section: unchanged
+        # pages are not parsed, unchanged sections are copied from the saved
+        # record, and what changed is reported in gen<N>_changes.json
+        self.incremental = incremental
+        self.changes = ChangeReport()
+        # Page hashes and previous records of the pages scraped so far, by number
+        self.page_sources = {}
+        # The Pokédex is streamed to gen<N>_pokedex.ndjson (and, with
+        # json_array, gen<N>_pokedex.json) as it is scraped; with stream the
+        # records are not also kept in self.pokemon_data, so memory stays flat
+        self.stream = stream
+        self.json_array = json_array
+        # Also export typed tables to gen<N>_pokedex.sqlite at the end of a run
+        self.export_sqlite = export_sqlite
+        # With normalized moves, learnsets refer to one shared move table
+        # (moves.json) instead of repeating every move's details
+        self.move_table = MoveTable() if normalize_moves else None
+        if self.move_table is not None and (resume or incremental):
+            self.move_table.load(self.move_table_path())
+
+    def create_session(self, pool_size):
+        """
+        Create a pooled HTTP session that shares our default headers
+        """
+        session = requests.Session()
+        session.headers.update(self.headers)
+        
+        # Keep up to pool_size open connections per host; workers wait for a
+        # free connection instead of opening throwaway ones
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size, pool_block=True)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def connection_stats(self):
+        """
+        Count requests sent and connections opened by the session so far
+        """
+        stats = {'requests': 0, 'connections': 0}
+        for adapter in set(self.session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in pools.keys():
+                pool = pools[key]
+                stats['requests'] += pool.num_requests
+                stats['connections'] += pool.num_connections
+        stats['reused'] = max(0, stats['requests'] - stats['connections'])
+        return stats
+
+    def print_connection_stats(self):
+        """Print how well HTTP connections were reused during the run"""
+        stats = self.connection_stats()
+        print(f"HTTP requests: {stats['requests']}, connections opened: {stats['connections']}, "
+              f"reused: {stats['reused']}")
+        if self.cache:
+            cache_stats = self.cache.stats
+            print(f"Cache hits: {cache_stats['hits']}, revalidated: {cache_stats['revalidated']}, "
+                  f"downloaded: {cache_stats['misses']}, evicted: {cache_stats['evicted']}")
+
+    def fetch(self, url, throttle=False):
+        """
+        Return the body of url, from the cache when one is configured
+        
+        Page and sprite requests pass throttle=True so they wait for the
+        shared rate limiter, but only when they actually go to the network.
+        """
+        def get(headers=None):
+            return self.get_with_retries(url, headers, throttle)
+        
+        if self.cache:
+            return self.cache.fetch(url, get)
+        
+        response = get()
+        response.raise_for_status()
+        return response.content
+
+    def get_with_retries(self, url, headers=None, throttle=False):
+        """
+        GET url, retrying connection errors and 429/5xx responses with
+        exponential backoff and jitter
+        
+        A 429 or 503 means the server wants us to slow down: every worker
+        pauses for its Retry-After (or the backoff delay) and the shared rate
+        limiter halves its rate until requests succeed again. The last
+        response is returned as is, so callers still see the error status.
+        """
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+            if throttle:
+                self.rate_limiter.wait()
+            try:
+                response = self.session.get(url, headers=headers)
+            except requests.RequestException as e:
+                if last_attempt:
+                    raise
+                pause = backoff_delay(attempt, self.backoff_base)
+                print(f"Retrying {url} in {pause:.1f}s ({e})")
+                time.sleep(pause)
+                continue
+            
+            if response.status_code not in RETRY_STATUSES or last_attempt:
+                if response.status_code < 400 and throttle:
+                    self.rate_limiter.recover()
+                return response
+            
+            pause = backoff_delay(attempt, self.backoff_base)
+            if response.status_code in THROTTLE_STATUSES:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is not None:
+                    pause = retry_after
+                self.rate_limiter.back_off(pause)
+            print(f"Retrying {url} in {pause:.1f}s (HTTP {response.status_code})")
+            # Throttled requests already wait out the pause in the rate limiter
+            if not throttle or response.status_code not in THROTTLE_STATUSES:
+                time.sleep(pause)
+
+    def download_image(self, url, local_path):
+        """
+        Download an image from URL to local path, skipping it if the file
+        is already present and unchanged
+        """
+        return self.sprites.download(url, local_path)
+
+    def queue_sprites(self, pokemon_number):
+        """Queue a Pokémon's sprites for the background download stage, if wanted"""
+        if self.want_sprites:
+            self.sprites.submit_batch(self.sprite_jobs(pokemon_number))
+
+    def sprite_jobs(self, pokemon_number):
+        """
+        List the (url, local path) pairs of the sprites of a Pokémon; none
+        unless the generation plugin knows where its sprites are
+        """
+        return []
+
+    def scrape_all(self):
+        """Scrape every Pokémon in numbers"""
+        print(f"Pokémon Gen {self.generation} Pokédex Scraper")
+        print("=" * 40)
+        print(f"Starting to scrape Gen {self.generation} Pokédex ({len(self.numbers)} Pokémon)...")
+        
+        numbers = self.numbers
+        if self.resume:
+            failed = self.manifest.failed_numbers()
+            if failed:
+                print(f"Resuming; retrying {len(failed)} Pokémon that failed last time")
+        
+        # Enough fetching threads to keep every parse process busy
+        io_workers = max(self.workers, self.parse_processes)
+        with self.open_pokedex() as pokedex, self.parse_stage(), \
+                ThreadPoolExecutor(max_workers=io_workers) as executor:
+            futures = []
+            for pokemon_number in numbers:
+                if self.resume and self.is_fresh(pokemon_number):
+                    futures.append(None)
+                else:
+                    futures.append(executor.submit(self.scrape_pokemon, pokemon_number))
+            
+            # Collect results in Pokédex order, whichever page finishes first.
+            # Once a Pokémon has failed, later ones are held back until its
+            # retries are done, so a recovered one still lands in its place
+            failed = []
+            held = []
+            for pokemon_number, future in zip(numbers, futures):
+                number = f"{pokemon_number:03d}"
+                if future is None:
+                    # Saved by an earlier run and unchanged since, reuse it
+                    pokemon_data = self.load_individual_pokemon(number)
+                    if self.move_table is not None:
+                        self.move_table.normalize(pokemon_data)
+                    # Fills in any sprites that are missing on disk
+                    self.queue_sprites(number)
+                    print(f"- #{number} {pokemon_data['name']} is up to date, skipped")
+                else:
+                    pokemon_data = self.finish_pokemon(pokemon_number, future)
+                    if pokemon_data is None:
+                        failed.append(pokemon_number)
+                        continue
+                
+                if failed:
+                    held.append((pokemon_number, pokemon_data))
+                else:
+                    self.add_to_pokedex(pokedex, pokemon_data)
+            
+            # Give failed Pokémon another chance once the rest are done
+            for retry_round in range(1, self.retry_rounds + 1):
+                if not failed:
+                    break
+                print(f"Retrying {len(failed)} failed Pokémon (round {retry_round} of {self.retry_rounds})")
+                retries = [(pokemon_number, executor.submit(self.scrape_pokemon, pokemon_number))
+                           for pokemon_number in failed]
+                failed = []
+                for pokemon_number, future in retries:
+                    pokemon_data = self.finish_pokemon(pokemon_number, future)
+                    if pokemon_data is None:
+                        failed.append(pokemon_number)
+                    else:
+                        held.append((pokemon_number, pokemon_data))
+            if failed:
+                print(f"Gave up on {len(failed)} Pokémon: "
+                      f"{', '.join(f'#{pokemon_number:03d}' for pokemon_number in failed)}")
+            
+            for pokemon_number, pokemon_data in sorted(held, key=lambda item: item[0]):
+                self.add_to_pokedex(pokedex, pokemon_data)
+        
+        self.report_pokedex(pokedex)
+        self.save_change_report()
+        self.save_evolution_graph()
+        self.save_move_table()
+        self.save_sqlite_export()
+        
+        sprite_stats = self.sprites.finish()
+        print(f"Files written: {self.output.stats['written']}, unchanged: {self.output.stats['unchanged']}")
+        print(f"Sprites downloaded: {sprite_stats['downloaded']}, already present: {sprite_stats['skipped']}, "
+              f"failed: {sprite_stats['failed']}")
+        print(f"\nSuccessfully scraped {pokedex.count} Pokémon!")
+        print(f"Evolution chains parsed: {self.evolution_graph.stats['parsed']}, "
+              f"reused: {self.evolution_graph.stats['reused']}")
+        if self.move_table is not None:
+            print(f"Moves parsed: {self.move_table.stats['extracted']}, reused: {self.move_table.stats['reused']}")
+        self.print_connection_stats()
+        self.timer.print_summary()
+        self.timer.save(os.path.join(self.data_dir, "timings.json"), self.output)
+        return self.pokemon_data
+
+    def finish_pokemon(self, pokemon_number, future):
+        """
+        Save the result of a scrape_pokemon future and record it in the
+        manifest; returns the record to add to the Pokédex, or None if the
+        Pokémon failed
+        """
+        number = f"{pokemon_number:03d}"
+        try:
+            pokemon_data = future.result()
+            if pokemon_data:
+                source, previous = self.page_sources.pop(number, (None, None))
+                if self.incremental:
+                    self.changes.add(number, pokemon_data, previous)
+                sections = None
+                if self.fields is not None:
+                    pokemon_data, sections, source = self.merge_saved(number, pokemon_data, source)
+                content_hash = self.save_individual_pokemon(pokemon_data)
+                self.manifest.mark_done(number, content_hash, sections, source)
+                print(f"✓ {pokemon_data['name']}")
+                return pokemon_data
+            self.manifest.mark_failed(number, "no data extracted")
+            print(f"✗ Failed to scrape #{number}")
+            
+        except Exception as e:
+            self.manifest.mark_failed(number, e)
+            print(f"✗ Error scraping #{number}: {e}")
+        return None
+
+    def merge_saved(self, number, pokemon_data, source=None):
+        """
+        Lay the fields of a fields run over the record an earlier run saved,
+        so the fields that were not asked for are kept
+        
+        Returns the record to save, the sections it holds (None for all of
+        them) and, on incremental runs, its source: the new section hashes
+        plus the saved hashes of the sections that were kept.
+        """
+        try:
+            saved = self.load_individual_pokemon(number)
+        except (OSError, ValueError):
+            return pokemon_data, self.sections, source
+        
+        kept = {field: value for field, value in saved.items() if self.FIELDS.get(field) not in self.sections}
+        # Fields keep the order a full scrape gives them
+        order = list(self.FIELDS) + [field for field in (*saved, *pokemon_data) if field not in self.FIELDS]
+        merged = {}
+        for field in order:
+            if field in pokemon_data:
+                merged[field] = pokemon_data[field]
+            elif field in kept:
+                merged[field] = kept[field]
+        
+        held = {self.FIELDS[field] for field in kept if field in self.FIELDS} | set(self.sections)
+        sections = None if held >= set(self.SECTIONS) else tuple(section for section in self.SECTIONS if section in held)
+        
+        if source is not None:
+            saved_source = self.manifest.saved_source(number, self.individual_json_path(number)) or {}
+            section_hashes = {section: section_hash
+                              for section, section_hash in saved_source.get('sections', {}).items()
+                              if section in held and section not in self.sections}
+            section_hashes.update(source['sections'])
+            # The kept sections only come from this page if the saved record did
+            same_page = saved_source.get('page') == source['page']
+            source = {'page': source['page'] if same_page else None, 'sections': section_hashes}
+        return merged, sections, source
+
+    def scrape_pokemon(self, pokemon_number):
+        """Scrape individual Pokémon data"""
+        print(f"Scraping #{pokemon_number:03d}...")
+        # Errors reach finish_pokemon, which records them in the manifest
+        return self.scrape_page(self.page_url(pokemon_number), f"{pokemon_number:03d}")
+
+    def page_url(self, pokemon_number):
+        """URL of a Pokémon's page in this generation's Pokédex"""
+        return f"{self.base_url}/{pokemon_number:03d}.shtml"
+
+    def individual_json_path(self, pokemon_number):
+        """Path of the JSON file for one Pokémon, e.g. data/gen1/001/001.json"""
+        return os.path.join(self.data_dir, pokemon_number, f"{pokemon_number}.json")
+
+    def is_fresh(self, pokemon_number):
+        """Check whether a previous run already saved this Pokémon"""
+        number = f"{pokemon_number:03d}"
+        return self.manifest.is_fresh(number, self.individual_json_path(number), self.max_age, self.sections)
+
+    def load_individual_pokemon(self, pokemon_number):
+        """Load one Pokémon saved by a previous run"""
+        with open(self.individual_json_path(pokemon_number), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save_individual_pokemon(self, pokemon_data):
+        """
+        Save individual Pokémon data to file, unless it is unchanged, and
+        return the hash of its content
+        """
+        json_file = self.individual_json_path(pokemon_data['number'])
+        with self.timer.span('json_write'):
+            content_hash = self.output.write_json(json_file, pokemon_data)
+        
+        print(f"Data saved to {json_file}")
+        return content_hash
+
+    def rebuild_pokedex(self):
+        """
+        Rebuild the combined Pokédex from the per-Pokémon JSON files
+        without fetching anything
+        """
+        self.pokemon_data = []
+        missing = []
+        if self.move_table is not None:
+            self.move_table.load(self.move_table_path())
+        with self.open_pokedex() as pokedex:
+            for pokemon_number in self.numbers:
+                number = f"{pokemon_number:03d}"
+                try:
+                    pokemon_data = self.load_individual_pokemon(number)
+                except (OSError, ValueError):
+                    missing.append(number)
+                    continue
+                if self.move_table is not None:
+                    self.move_table.normalize(pokemon_data)
+                self.add_to_pokedex(pokedex, pokemon_data)
+        
+        if missing:
+            print(f"Missing or unreadable: {', '.join('#' + n for n in missing)}")
+        self.report_pokedex(pokedex)
+        self.save_evolution_graph()
+        self.save_move_table()
+        self.save_sqlite_export()
+        print(f"\nRebuilt Pokédex with {pokedex.count} Pokémon")
+        return self.pokemon_data
+
+    def pokedex_path(self, extension="json"):
+        return os.path.join(self.data_dir, f"gen{self.generation}_pokedex.{extension}")
+
+    def open_pokedex(self):
+        """Start streaming the combined Pokédex to disk"""
+        array_path = self.pokedex_path() if self.json_array else None
+        return PokedexWriter(self.pokedex_path("ndjson"), array_path=array_path, compact=self.compact)
+
+    def add_to_pokedex(self, pokedex, pokemon_data):
+        """Write one Pokémon to the combined Pokédex as soon as it is ready"""
+        with self.timer.span('json_write'):
+            pokedex.write(pokemon_data)
+        if not self.stream:
+            self.pokemon_data.append(pokemon_data)
+
+    def report_pokedex(self, pokedex):
+        print(f"Data saved to {pokedex.path}" + (f" and {pokedex.array_path}" if pokedex.array_path else ""))
+        
+        # Show sample data
+        if pokedex.sample:
+            print(f"\nSample data for first Pokémon:")
+            print(pokedex.sample[:1000] + "...")
+
+    def pokedex_records(self):
+        """Every Pokémon of the Pokédex, read back from disk when streaming"""
+        if self.stream:
+            return read_pokedex(self.pokedex_path("ndjson"))
+        return self.pokemon_data
+
+    def save_pokedex(self):
+        """Save complete Pokédex to file"""
+        with self.open_pokedex() as pokedex:
+            for pokemon_data in self.pokemon_data:
+                with self.timer.span('json_write'):
+                    pokedex.write(pokemon_data)
+        self.report_pokedex(pokedex)
+
+    def save_change_report(self):
+        """Save what changed since the last run next to the Pokédex (incremental runs only)"""
+        if not self.incremental:
+            return
+        print(self.changes.summary())
+        with self.timer.span('json_write'):
+            self.changes.save(os.path.join(self.data_dir, f"gen{self.generation}_changes.json"), self.output)
+
+    def save_evolution_graph(self):
+        """Save every evolution of the Pokédex, in both directions, next to it"""
+        if self.fields is not None and self.FIELDS.get('evos') not in self.sections:
+            # The records may not hold their evolutions
+            return
+        with self.timer.span('json_write'):
+            self.evolution_graph.save(os.path.join(self.data_dir, "evolution_graph.json"), self.pokedex_records(),
+                                      self.output)
+
+    def move_table_path(self):
+        return os.path.join(self.data_dir, "moves.json")
+
+    def save_move_table(self):
+        """Save the shared move table next to the Pokédex (normalized moves only)"""
+        if self.move_table is None:
+            return
+        with self.timer.span('json_write'):
+            self.move_table.save(self.move_table_path(), self.output)
+
+    def save_sqlite_export(self):
+        """Export the Pokédex as typed SQLite tables next to it, if asked to"""
+        if not self.export_sqlite or self.fields is not None:
+            # Pokémon first saved by a fields run only hold some of the tables
+            return
+        moves = self.move_table.moves if self.move_table is not None else None
+        with self.timer.span('export'):
+            export_sqlite(self.pokedex_records(), self.pokedex_path("sqlite"), moves)
+
+    def scrape_pokemon_page(self, url, pokemon_number=None):
+        """
+        Scrape a single Pokémon page from Serebii.net, or return None if it fails
+        
+        On incremental runs pokemon_number identifies the record saved by the
+        last run: if the page is unchanged that record is returned without
+        parsing the page, otherwise only the changed sections are extracted.
+        """
+        try:
+            return self.scrape_page(url, pokemon_number)
+        except Exception as e:
+            print(f"Error scraping {url}: {e}")
+            return None
+
+    def scrape_page(self, url, pokemon_number=None):
+        """Like scrape_pokemon_page, but errors are raised to the caller"""
+        # Get the page from the cache, or from the server once it is our turn
+        with self.timer.span('fetch'):
+            content = self.fetch(url, throttle=True)
+        
+        source, previous = None, None
+        if self.incremental and pokemon_number:
+            source, previous = self.saved_page(pokemon_number)
+        page_hash = self.page_hash(content) if self.incremental else None
+        
+        if source and source['page'] == page_hash and set(self.sections) <= set(source['sections']):
+            # Same page as last time, so the same data
+            pokemon_data = self.selected_fields(previous)
+            section_hashes = {section: source['sections'][section] for section in self.sections}
+            self.changes.count('pages_unchanged')
+        else:
+            # Sections can only be copied over when FIELDS says which fields they fill in
+            reuse = (source['sections'], previous) if source and self.FIELDS else None
+            if self.parse_pool is not None:
+                # Parsed on another core; the profiler only covers in-process parsing
+                pokemon_data, section_hashes = self.parse_pool.extract(content, reuse)
+            elif self.profiler:
+                page_name = url.rsplit('/', 1)[-1].split('.')[0]
+                with self.profiler.profile(page_name):
+                    pokemon_data, section_hashes = self.extract_page(content, reuse)
+            else:
+                pokemon_data, section_hashes = self.extract_page(content, reuse)
+        
+        if self.incremental and pokemon_number:
+            # Saved with the record, and compared with the old one, once it is accepted
+            self.page_sources[pokemon_number] = ({'page': page_hash, 'sections': section_hashes},
+                                                 previous and self.selected_fields(previous))
+        
+        # Queue the sprite images for the background download stage;
+        # the caller saves the JSON once the Pokémon is accepted
+        pokemon_number = pokemon_data.get('number', '001')
+        self.queue_sprites(pokemon_number)
+        
+        return pokemon_data
+
+    def saved_page(self, pokemon_number):
+        """
+        The (source hashes, record) an earlier run saved for a Pokémon;
+        source is None if the record was saved without them, and both are
+        None if there is no intact record
+        """
+        try:
+            previous = self.load_individual_pokemon(pokemon_number)
+        except (OSError, ValueError):
+            return None, None
+        return self.manifest.saved_source(pokemon_number, self.individual_json_path(pokemon_number)), previous
+
+    def extraction_key(self):
+        """
+        What besides the page decides the extracted data; hashes taken with
+        another key never match
+        """
+        return f"{type(self).__name__}:{self.parser}:normalize_moves={self.move_table is not None}"
+
+    def page_hash(self, content):
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return hashlib.sha256(self.extraction_key().encode() + content).hexdigest()
+
+    def section_hashes(self, index, content):
+        """
+        A hash of the part of the page each selected section is extracted
+        from: the dextables SECTION_TABLES lists for it, or else the whole page
+        """
+        page_hash = self.page_hash(content)
+        sources = index.dextable_sources(content) if self.SECTION_TABLES else None
+        if sources is None:
+            return {section: page_hash for section in self.sections}
+        
+        digests = {section: hashlib.sha256(self.extraction_key().encode())
+                   for section in self.sections if section in self.SECTION_TABLES}
+        for table, table_source in zip(index.dextables, sources):
+            headers = '\n'.join((index.header_text(table), index.header_text(table, 'foo'),
+                                 index.header_text(table, strip=True)))
+            for section, digest in digests.items():
+                if any(text in headers for text in self.SECTION_TABLES[section]):
+                    digest.update(table_source)
+        return {section: digests[section].hexdigest() if section in digests else page_hash
+                for section in self.sections}
+
+    @contextmanager
+    def parse_stage(self):
+        """
+        Parse pages in parse_processes worker processes for the duration of
+        a with-block (or in the fetching threads when there are none)
+        """
+        if not self.parse_processes:
+            yield None
+            return
+        self.parse_pool = ParsePool(self, self.parse_processes)
+        try:
+            yield self.parse_pool
+        finally:
+            self.parse_pool.shutdown()
+            self.parse_pool = None
+
+    def parse_pokemon_page(self, content):
+        """
+        Parse the HTML of a Pokémon page into a Pokémon data dict
+        """
+        return self.extract_page(content)[0]
+
+    def extract_page(self, content, reuse=None):
+        """
+        Parse a page into a Pokémon data dict and the hashes of its sections
+        (incremental runs only)
+        
+        reuse is the (section hashes, record) saved for the page by an
+        earlier run; sections whose hash is unchanged are copied from that
+        record instead of being extracted again.
+        """
+        with self.timer.span('parse'):
+            # Parse the HTML
+            soup = make_soup(content, self.parser)
+            
+            # Walk the page once to find the tables and cells the extractors need
+            index = PageIndex(soup)
+        
+        section_hashes = self.section_hashes(index, content) if self.incremental else {}
+        saved_hashes, saved = reuse or ({}, {})
+        
+        # Extract Pokémon information one page section at a time; sections
+        # that were not asked for are never touched
+        pokemon_data = {}
+        for section in self.sections:
+            if section in saved_hashes and saved_hashes[section] == section_hashes.get(section):
+                # Unchanged since the last run; fields keep their saved order
+                pokemon_data.update((field, value) for field, value in saved.items()
+                                    if self.FIELDS.get(field) == section)
+                self.changes.count('sections_reused')
+                continue
+            with self.timer.span(f"extract.{section}"):
+                self.section_extractor(section)(index, pokemon_data)
+            if self.incremental:
+                self.changes.count('sections_extracted')
+        return pokemon_data, section_hashes
+
+    def select_sections(self, fields):
+        """
+        The SECTIONS needed for a list of output fields or section names
+        (plus "sprites"), in page order; all of them when fields is None
+        """
+        if fields is None:
+            return tuple(self.SECTIONS)
+        wanted = set(self.REQUIRED_SECTIONS)
+        for field in fields:
+            if field in self.SECTIONS:
+                wanted.add(field)
+            elif field in self.FIELDS:
+                wanted.add(self.FIELDS[field])
+            elif field != 'sprites':
+                raise ValueError(f"Unknown field {field!r}; choose from {', '.join(self.field_names())}")
+        return tuple(section for section in self.SECTIONS if section in wanted)
+
+    def field_names(self):
+        """Everything fields= accepts"""
+        return sorted(set(self.FIELDS) | set(self.SECTIONS) | {'sprites'})
+
+    def selected_fields(self, pokemon_data):
+        """A saved record cut down to the fields of the selected sections"""
+        if self.fields is None:
+            return pokemon_data
+        return {field: value for field, value in pokemon_data.items() if self.FIELDS.get(field) in self.sections}
+
+    def section_extractor(self, section):
+        """The extract_<section> method for one of SECTIONS"""
+        return getattr(self, f"extract_{section}")
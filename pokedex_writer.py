@@ -0,0 +1,106 @@
+import json
+import os
+
+from output_sink import OutputSink
+
+
+class PokedexWriter:
+    """
+    Streams Pokémon records to disk as they are scraped
+
+    Every record is appended as one line of NDJSON and, with array_path,
+    as the next element of a JSON array formatted exactly like
+    json.dump(records, f, indent=2). Both are written to <path>.partial,
+    flushed and fsynced after every record, so an interrupted run leaves
+    every finished record readable. close() moves them into place. With
+    compact, the array holds one record per line, in OutputSink's compact
+    layout like every other compact output file.
+    """
+
+    def __init__(self, path, array_path=None, fsync=True, compact=False):
+        self.path = path
+        self.array_path = array_path
+        self.fsync = fsync
+        self.compact = compact
+        self._dumps = OutputSink(compact=True).dumps if compact else lambda data: json.dumps(data, ensure_ascii=False)
+        self.count = 0
+        # Indented text of the first record, for printing a sample
+        self.sample = None
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._ndjson = open(f"{path}.partial", 'w', encoding='utf-8')
+        self._array = None
+        if array_path:
+            os.makedirs(os.path.dirname(array_path) or '.', exist_ok=True)
+            self._array = open(f"{array_path}.partial", 'w', encoding='utf-8')
+            self._array.write('[')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            # Keep the .partial files for inspection; never replace a good Pokédex
+            self._close_files()
+
+    def write(self, pokemon_data):
+        """Append one Pokémon"""
+        line = self._dumps(pokemon_data)
+        self._ndjson.write(line + '\n')
+        self._sync(self._ndjson)
+
+        if self.compact:
+            if self.sample is None:
+                self.sample = line
+            if self._array is not None:
+                self._array.write((',\n' if self.count else '\n') + line)
+                self._sync(self._array)
+        elif self._array is not None or self.sample is None:
+            text = json.dumps(pokemon_data, indent=2, ensure_ascii=False)
+            if self.sample is None:
+                self.sample = text
+            if self._array is not None:
+                # Strings never contain raw newlines, so indenting every line is safe
+                self._array.write((',\n  ' if self.count else '\n  ') + text.replace('\n', '\n  '))
+                self._sync(self._array)
+        self.count += 1
+
+    def _sync(self, f):
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+
+    def _close_files(self):
+        self._ndjson.close()
+        if self._array is not None:
+            self._array.close()
+
+    def close(self):
+        """Finish the files and move them into place"""
+        if self._array is not None:
+            self._array.write('\n]' if self.count else ']')
+            self._sync(self._array)
+        self._close_files()
+        os.replace(f"{self.path}.partial", self.path)
+        if self._array is not None:
+            os.replace(f"{self.array_path}.partial", self.array_path)
+
+
+def read_pokedex(path):
+    """
+    Yield the Pokémon in an NDJSON file one at a time
+
+    A cut-off last line, as left in a .partial file by an interrupted run,
+    is skipped.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                if line.endswith('\n'):
+                    raise
+                return
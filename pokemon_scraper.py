@@ -4,17 +4,134 @@ Pokemon Scraper - Main runner script
 Imports and runs the appropriate generation scraper
 """
 
-from gen1_scraper import Gen1Scraper
+import argparse
+import os
+import sys
+from generations import GENERATIONS, SCRAPERS, parse_numbers, plan_run, scraper_class
+from http_cache import ResponseCache
+from instrumentation import PageProfiler
+from parser_backend import PARSER_BACKENDS
 
 def main():
     """Main function to run the Pokémon scraper"""
+    parser = argparse.ArgumentParser(description="Scrape Pokémon data from Serebii.net")
+    parser.add_argument('--generation', default=None,
+                        help="generations to scrape, e.g. 1, 1-3 or all (default: 1, or those covering --range)")
+    parser.add_argument('--range', dest='numbers', default=None,
+                        help="national dex numbers to scrape, e.g. 1-151 or 25,133-136 (default: all)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="number of pages to fetch and parse concurrently (default: 1)")
+    parser.add_argument('--delay', type=float, default=1.0,
+                        help="average seconds between page requests across all workers (default: 1.0)")
+    parser.add_argument('--burst', type=int, default=1,
+                        help="page requests that may go out back to back before --delay applies (default: 1)")
+    parser.add_argument('--max-retries', type=int, default=3,
+                        help="retries of a request after a connection error, 429 or 5xx (default: 3)")
+    parser.add_argument('--retry-rounds', type=int, default=1,
+                        help="passes over failed Pokémon at the end of the run (default: 1)")
+    parser.add_argument('--parse-processes', type=int, default=0,
+                        help="parse pages in this many processes to use several cores (default: 0, parse in --workers)")
+    parser.add_argument('--pool-size', type=int, default=10,
+                        help="maximum number of keep-alive connections to the server (default: 10)")
+    parser.add_argument('--cache-dir', default="data/cache",
+                        help="directory for cached pages and sprites (default: data/cache)")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="always download everything again")
+    parser.add_argument('--offline', action='store_true',
+                        help="only use cached responses and never touch the network")
+    parser.add_argument('--cache-ttl', type=float, default=168,
+                        help="hours before a cached response is revalidated with the server (default: 168)")
+    parser.add_argument('--cache-size', type=int, default=500,
+                        help="maximum cache size in MB before old entries are evicted (default: 500)")
+    parser.add_argument('--resume', action='store_true',
+                        help="skip Pokémon saved by a previous run and retry the ones that failed")
+    parser.add_argument('--max-age', type=float, default=None,
+                        help="with --resume, hours after which a saved Pokémon is scraped again")
+    parser.add_argument('--sprite-workers', type=int, default=4,
+                        help="number of sprites downloaded concurrently in the background (default: 4)")
+    parser.add_argument('--defer-sprites', action='store_true',
+                        help="download all sprites after the data pass instead of alongside it")
+    parser.add_argument('--parser', choices=PARSER_BACKENDS, default=None,
+                        help="HTML parser backend (default: fastest installed)")
+    parser.add_argument('--profile', choices=PageProfiler.KINDS, default=None,
+                        help="write a profile of every parsed page to --profile-dir")
+    parser.add_argument('--profile-dir', default=None,
+                        help="directory for per-page profiles (default: data/gen<N>/profiles)")
+    parser.add_argument('--normalize-moves', action='store_true',
+                        help="store move details once in moves.json and only move IDs in each learnset")
+    parser.add_argument('--stream', action='store_true',
+                        help="keep memory flat by not holding the whole Pokédex in memory")
+    parser.add_argument('--no-json-array', action='store_true',
+                        help="only write gen<N>_pokedex.ndjson, not gen<N>_pokedex.json")
+    parser.add_argument('--compact', action='store_true',
+                        help="write JSON files without indentation, for smaller production output")
+    parser.add_argument('--export-sqlite', action='store_true',
+                        help="also export typed tables to data/gen<N>/gen<N>_pokedex.sqlite")
+    parser.add_argument('--fields', default=None,
+                        help="only extract these fields and page sections, e.g. types,stats,evos; "
+                             "add sprites to also download sprites (default: everything)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="only parse pages and sections that changed since the last run, "
+                             "and report what changed in gen<N>_changes.json")
+    parser.add_argument('--rebuild', action='store_true',
+                        help="only rebuild gen<N>_pokedex.json from the per-Pokémon files")
+    args = parser.parse_args()
+    
+    cache = None
+    if not args.no_cache:
+        cache = ResponseCache(args.cache_dir, ttl=args.cache_ttl * 3600,
+                              max_bytes=args.cache_size * 1024 * 1024, offline=args.offline)
+    
+    try:
+        generations = parse_numbers(args.generation, max(GENERATIONS)) if args.generation else None
+        numbers = parse_numbers(args.numbers, GENERATIONS[max(GENERATIONS)].last) if args.numbers else None
+        plan = plan_run(generations, numbers)
+        fields = [field.strip() for field in args.fields.split(',') if field.strip()] if args.fields else None
+    except ValueError as e:
+        parser.error(str(e))
+    
     print("Pokémon Scraper")
     print("=" * 20)
-    print("Running Generation 1 scraper...")
-    print()
     
-    scraper = Gen1Scraper()
-    scraper.scrape_all()
+    max_age = args.max_age * 3600 if args.max_age is not None else None
+    # Every generation shares the first scraper's connections and rate limit
+    pool = None
+    scraped = 0
+    for generation, dex_numbers in plan:
+        scraper_type = scraper_class(generation)
+        if scraper_type is None:
+            print(f"No extractors for Generation {generation} yet, skipping {len(dex_numbers)} Pokémon")
+            continue
+        print(f"Running Generation {generation} scraper...")
+        print()
+        try:
+            scraper = scraper_type(workers=args.workers, delay=args.delay, pool_size=args.pool_size, cache=cache,
+                                   resume=args.resume, max_age=max_age,
+                                   sprite_workers=args.sprite_workers, defer_sprites=args.defer_sprites,
+                                   parser=args.parser, normalize_moves=args.normalize_moves,
+                                   stream=args.stream, json_array=not args.no_json_array,
+                                   export_sqlite=args.export_sqlite, burst=args.burst,
+                                   max_retries=args.max_retries, retry_rounds=args.retry_rounds,
+                                   compact=args.compact, numbers=dex_numbers, pool_from=pool,
+                                   parse_processes=args.parse_processes, fields=fields,
+                                   incremental=args.incremental)
+        except ValueError as e:
+            parser.error(str(e))
+        if args.profile:
+            # Each generation's profiles go next to its own output
+            scraper.profiler = PageProfiler(args.profile,
+                                            args.profile_dir or os.path.join(scraper.data_dir, "profiles"))
+        pool = pool or scraper
+        if args.rebuild:
+            scraper.rebuild_pokedex()
+        else:
+            scraper.scrape_all()
+        scraped += 1
+    if not scraped:
+        print(f"Nothing was scraped: only Generation {', '.join(str(number) for number in sorted(SCRAPERS))} "
+              f"has extractors so far")
+        return 1
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
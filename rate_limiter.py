@@ -0,0 +1,109 @@
+import email.utils
+import random
+import threading
+import time
+
+# Responses worth retrying; 429 and 503 also slow every worker down
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value):
+    """
+    Seconds to wait according to a Retry-After header, which is either a
+    number of seconds or an HTTP date; None if missing or unreadable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """
+    Exponential backoff with full jitter: a random wait between 0 and
+    base * 2**attempt seconds, capped at cap
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class RateLimiter:
+    """
+    Token bucket shared by every worker thread
+
+    Tokens refill at one per delay seconds, up to burst, and every request
+    takes one. When the server pushes back (429/503), back_off() pauses all
+    requests and doubles the spacing; each successful request then wins a
+    little of the rate back, until it is back at one per delay seconds.
+    """
+
+    # Spacing used after a push-back when no delay was configured
+    MIN_BACKOFF_INTERVAL = 0.5
+    MAX_INTERVAL = 60.0
+
+    def __init__(self, delay=1.0, burst=1):
+        # Polite average spacing between two requests to the server
+        self.delay = delay
+        self.burst = max(1, burst)
+        self.interval = delay
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        # Bumped by every back_off() so waiting workers know to queue again
+        self._pauses = 0
+
+    def _refill(self, now):
+        if now <= self._updated:
+            return
+        if self.interval > 0:
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) / self.interval)
+        else:
+            self._tokens = float(self.burst)
+        self._updated = now
+
+    def wait(self):
+        """
+        Block until the caller is allowed to send its next request
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                self._tokens -= 1
+                # A negative balance is a reservation for a later slot
+                ready = max(now, self._updated) + max(0.0, -self._tokens) * self.interval
+                pauses = self._pauses
+            # Sleep outside the lock so other workers can reserve later slots
+            if ready > now:
+                time.sleep(ready - now)
+            with self._lock:
+                if self._pauses == pauses:
+                    return
+
+    def back_off(self, seconds):
+        """
+        Pause every request for seconds and halve the request rate
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._paused_until = max(self._paused_until, now + seconds)
+            self.interval = min(self.MAX_INTERVAL, max(self.interval * 2, self.MIN_BACKOFF_INTERVAL))
+            # Waiting workers queue again, so earlier reservations are dropped
+            self._tokens = 1.0
+            self._updated = self._paused_until
+            self._pauses += 1
+
+    def recover(self):
+        """
+        Win back some of the rate after a successful request
+        """
+        with self._lock:
+            if self.interval > self.delay:
+                self.interval = max(self.delay, self.interval * 0.9)
@@ -0,0 +1,295 @@
+"""
+Typed, compact records for parsed Pokémon
+
+The scraper's JSON keeps every value as text ("45", "0.5", "2'04\"").
+Pokemon.from_json() turns a record into named tuples and a slotted class
+holding ints and floats, and to_json() gives back exactly the JSON it was
+built from. Values that are not written the way the number would be
+written (say "045" or "1.50") are kept as text so nothing is lost.
+"""
+
+import re
+from collections import namedtuple
+
+STAT_KEYS = ('bst', 'HP', 'Attack', 'Defense', 'Special', 'Speed')
+IMPERIAL_HEIGHT_PATTERN = re.compile(r"(\d+)'(\d{2})\"")
+
+
+def to_number(text, missing=None):
+    """
+    text as an int or float, None if it is the missing-value marker, or
+    text unchanged when converting it back would not give the same text
+    """
+    if text == missing:
+        return None
+    if not isinstance(text, str):
+        return text
+    if text.isdigit() and str(int(text)) == text:
+        return int(text)
+    try:
+        value = float(text)
+    except ValueError:
+        return text
+    return value if str(value) == text else text
+
+
+def to_text(value, missing=None):
+    """The JSON text of a value read with to_number"""
+    if value is None:
+        return missing
+    if isinstance(value, (int, float)):
+        return str(value)
+    return value
+
+
+def to_dex_number(text):
+    """A zero-padded Pokédex number such as "025" as an int"""
+    if isinstance(text, str) and text.isdigit() and f"{int(text):03d}" == text:
+        return int(text)
+    return text
+
+
+def dex_text(value):
+    return f"{value:03d}" if isinstance(value, int) else value
+
+
+def to_measure(text, unit):
+    """A measure such as "0.7m" or "15.2lbs" as a number in unit"""
+    if isinstance(text, str) and text.endswith(unit):
+        value = to_number(text[:-len(unit)])
+        if isinstance(value, (int, float)):
+            return value
+    return text
+
+
+def measure_text(value, unit):
+    return f"{value}{unit}" if isinstance(value, (int, float)) else value
+
+
+def to_inches(text):
+    """An imperial height such as 2'04" in inches"""
+    match = IMPERIAL_HEIGHT_PATTERN.fullmatch(text) if isinstance(text, str) else None
+    if match and int(match.group(2)) < 12:
+        return int(match.group(1)) * 12 + int(match.group(2))
+    return text
+
+
+def inches_text(value):
+    if isinstance(value, int):
+        return f"{value // 12}'{value % 12:02d}\""
+    return value
+
+
+class StatBlock(namedtuple('StatBlock', ('bst', 'hp', 'attack', 'defense', 'special', 'speed'))):
+    """One value per stat (bst only for base stats); None where the page had none"""
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, data, convert=to_number):
+        return cls(*(convert(data[key]) if key in data else None for key in STAT_KEYS))
+
+    def to_json(self, convert=to_text):
+        return {key: convert(value) for key, value in zip(STAT_KEYS, self) if value is not None}
+
+
+class StatRange(namedtuple('StatRange', ('low', 'high'))):
+    """A max stat range such as "105 - 151" """
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, text):
+        low, separator, high = text.partition(' - ')
+        if separator and low.isdigit() and high.isdigit() and f"{int(low)} - {int(high)}" == text:
+            return cls(int(low), int(high))
+        return text
+
+    @staticmethod
+    def text(value):
+        return f"{value.low} - {value.high}" if isinstance(value, StatRange) else value
+
+
+class Evolution(namedtuple('Evolution', ('mon', 'method', 'level'))):
+    """One pevos/evos entry; level is None when the page shows "--" """
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(to_dex_number(data['mon']), data['method'], to_number(data['level'], '--'))
+
+    def to_json(self):
+        return {"level": to_text(self.level, '--'), "mon": dex_text(self.mon), "method": self.method}
+
+
+class Move(namedtuple('Move', ('name', 'type', 'power', 'accuracy', 'pp', 'effect', 'description'))):
+    """Details of a move; power, accuracy and effect are None when the page shows "--" """
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, data):
+        return cls(data['name'], data['type'], to_number(data['power'], '--'), to_number(data['accuracy'], '--'),
+                   to_number(data['pp'], '--'), to_number(data['effect'], '--'), data['description'])
+
+    def to_json(self):
+        return {
+            'name': self.name,
+            'type': self.type,
+            'power': to_text(self.power, '--'),
+            'accuracy': to_text(self.accuracy, '--'),
+            'pp': to_text(self.pp, '--'),
+            'effect': to_text(self.effect, '--'),
+            'description': self.description
+        }
+
+
+class LearnedMove(namedtuple('LearnedMove', ('learned', 'move'))):
+    """
+    A learnset or TM entry: its level (None for "—", known from the start)
+    or TM number, and a Move or, in normalized output, a move ID
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_json(cls, data, key, moves):
+        learned = to_number(data[key], '—') if key == 'level' else data[key]
+        if 'move' in data:
+            return cls(learned, data['move'])
+        details = {field: data[field] for field in Move._fields}
+        # Identical moves share one Move across the whole Pokédex
+        cache_key = tuple(details.values())
+        if cache_key not in moves:
+            moves[cache_key] = Move.from_json(details)
+        return cls(learned, moves[cache_key])
+
+    def to_json(self, key):
+        learned = to_text(self.learned, '—') if key == 'level' else self.learned
+        if isinstance(self.move, Move):
+            return {key: learned, **self.move.to_json()}
+        return {key: learned, 'move': self.move}
+
+
+Location = namedtuple('Location', ('game', 'place'))
+
+
+class Pokemon:
+    """
+    One parsed Pokémon
+
+    number, capture_rate and experience points are ints, stats are
+    StatBlocks, damage_taken maps each attacking type to a number and
+    learnset/tm_moves hold LearnedMoves. Fields that a page did not have
+    (such as classification) are None and left out of to_json(), and so are
+    the keys of a record saved with only some fields (missing).
+    """
+
+    __slots__ = ('name', 'number', 'types', 'pevos', 'evos', 'other_names', 'classification',
+                 'height', 'weight', 'base_stats', 'max_stats_lv50', 'max_stats_lv100', 'capture_rate',
+                 'experience_points', 'experience_rate', 'effort_values', 'damage_taken', 'locations',
+                 'learnset', 'tm_moves', 'extra', 'missing')
+
+    @classmethod
+    def from_json(cls, data, moves=None):
+        """
+        Build a Pokemon from one record of gen1_pokedex.json; pass the same
+        moves dict for every record to share identical moves between them
+        """
+        moves = {} if moves is None else moves
+        pokemon = cls()
+        pokemon.name = data.get('name')
+        pokemon.number = to_dex_number(data.get('number'))
+        pokemon.types = tuple(data.get('types', ()))
+        pokemon.pevos = tuple(Evolution.from_json(evo) for evo in data.get('pevos', ()))
+        pokemon.evos = tuple(Evolution.from_json(evo) for evo in data.get('evos', ()))
+        pokemon.other_names = data.get('other_names')
+        pokemon.classification = data.get('classification')
+
+        height = data.get('height')
+        pokemon.height = None if height is None else (to_inches(height['imperial']),
+                                                      to_measure(height['metric'], 'm'))
+        weight = data.get('weight')
+        pokemon.weight = None if weight is None else (to_measure(weight['imperial'], 'lbs'),
+                                                      to_measure(weight['metric'], 'kg'))
+
+        stats = data.get('stats', {})
+        max_stats = stats.get('max_stats', {})
+        pokemon.base_stats = StatBlock.from_json(stats.get('base_stats', {}))
+        pokemon.max_stats_lv50 = StatBlock.from_json(max_stats.get('lv_50', {}), StatRange.parse)
+        pokemon.max_stats_lv100 = StatBlock.from_json(max_stats.get('lv_100', {}), StatRange.parse)
+
+        pokemon.capture_rate = to_number(data.get('capture_rate'))
+        experience = data.get('experience_growth', {})
+        points = experience.get('points')
+        if isinstance(points, str) and points.replace(',', '').isdigit() and f"{int(points.replace(',', '')):,}" == points:
+            points = int(points.replace(',', ''))
+        pokemon.experience_points = points
+        pokemon.experience_rate = experience.get('rate')
+        pokemon.effort_values = StatBlock.from_json(data.get('effort_values', {}))
+        pokemon.damage_taken = {attacking_type: to_number(multiplier)
+                                for attacking_type, multiplier in data.get('damage_taken', {}).items()}
+        pokemon.locations = tuple(Location(location['game'], location['place'])
+                                  for location in data.get('locations', ()))
+
+        data_moves = data.get('moves', {})
+        pokemon.learnset = tuple(LearnedMove.from_json(entry, 'level', moves)
+                                 for entry in data_moves.get('learnset', ()))
+        pokemon.tm_moves = tuple(LearnedMove.from_json(entry, 'tm_number', moves)
+                                 for entry in data_moves.get('tm_moves', ()))
+        pokemon.extra = {key: value for key, value in data.items() if key not in POKEMON_KEYS} or None
+        pokemon.missing = frozenset(key for key in POKEMON_KEYS if key not in data) or None
+        return pokemon
+
+    def to_json(self):
+        """The record in the scraper's JSON schema, exactly as it was read"""
+        data = {'name': self.name}
+        if self.number is not None:
+            data['number'] = dex_text(self.number)
+        data['types'] = list(self.types)
+        data['pevos'] = [evo.to_json() for evo in self.pevos]
+        data['evos'] = [evo.to_json() for evo in self.evos]
+        data['other_names'] = self.other_names
+        if self.classification is not None:
+            data['classification'] = self.classification
+        if self.height is not None:
+            data['height'] = {'imperial': inches_text(self.height[0]), 'metric': measure_text(self.height[1], 'm')}
+        if self.weight is not None:
+            data['weight'] = {'imperial': measure_text(self.weight[0], 'lbs'),
+                              'metric': measure_text(self.weight[1], 'kg')}
+        data['stats'] = {
+            'base_stats': self.base_stats.to_json(),
+            'max_stats': {
+                'lv_50': self.max_stats_lv50.to_json(StatRange.text),
+                'lv_100': self.max_stats_lv100.to_json(StatRange.text)
+            }
+        }
+        data['capture_rate'] = to_text(self.capture_rate)
+        experience = {}
+        if self.experience_points is not None:
+            experience['points'] = (f"{self.experience_points:,}" if isinstance(self.experience_points, int)
+                                    else self.experience_points)
+        if self.experience_rate is not None:
+            experience['rate'] = self.experience_rate
+        data['experience_growth'] = experience
+        data['effort_values'] = self.effort_values.to_json()
+        data['damage_taken'] = {attacking_type: to_text(multiplier)
+                                for attacking_type, multiplier in self.damage_taken.items()}
+        data['locations'] = [{'game': location.game, 'place': location.place} for location in self.locations]
+        data['moves'] = {
+            'learnset': [entry.to_json('level') for entry in self.learnset],
+            'tm_moves': [entry.to_json('tm_number') for entry in self.tm_moves]
+        }
+        if self.missing:
+            data = {key: value for key, value in data.items() if key not in self.missing}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+# Top-level keys Pokemon knows about; anything else is kept in Pokemon.extra
+POKEMON_KEYS = ('name', 'number', 'types', 'pevos', 'evos', 'other_names', 'classification', 'height',
+                'weight', 'stats', 'capture_rate', 'experience_growth', 'effort_values', 'damage_taken',
+                'locations', 'moves')
+
+
+def load_records(pokedex):
+    """Pokemon records for a list (or any iterable) of JSON records, sharing identical moves"""
+    moves = {}
+    return [Pokemon.from_json(data, moves) for data in pokedex]
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class ScrapeManifest:
+    """
+    Checkpoint file recording the scrape status of every Pokémon
+
+    Each entry is keyed by the zero-padded Pokédex number and holds the
+    status ("ok" or "failed"), the SHA-256 of the saved JSON file, the time
+    it was recorded and, for failures, the error message. Records saved
+    with only some page sections also list those sections, and incremental
+    runs add the hashes of the page and its sections ("source").
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """Read the manifest from disk if a previous run left one behind"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        """Write the manifest atomically so a crash never leaves it half-written"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with self._lock:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def mark_done(self, number, content_hash, sections=None, source=None):
+        """Record a successfully saved Pokémon and checkpoint the manifest"""
+        with self._lock:
+            self.entries[number] = {
+                'status': 'ok',
+                'hash': content_hash,
+                'timestamp': time.time()
+            }
+            if sections is not None:
+                self.entries[number]['sections'] = list(sections)
+            if source is not None:
+                self.entries[number]['source'] = source
+        self.save()
+
+    def mark_failed(self, number, error):
+        """Record a failed Pokémon so the next run retries it"""
+        with self._lock:
+            self.entries[number] = {
+                'status': 'failed',
+                'error': str(error),
+                'timestamp': time.time()
+            }
+        self.save()
+
+    def failed_numbers(self):
+        """Pokédex numbers whose last attempt failed"""
+        return sorted(n for n, entry in self.entries.items() if entry.get('status') == 'failed')
+
+    def is_fresh(self, number, json_file, max_age=None, sections=None):
+        """
+        Check that a Pokémon was scraped successfully, that its JSON file is
+        unchanged since then and, if max_age is given, not older than max_age
+        seconds; with sections, the saved record must also hold all of them
+        """
+        entry = self.entries.get(number)
+        if not entry or entry.get('status') != 'ok':
+            return False
+        if sections is not None and 'sections' in entry and not set(sections) <= set(entry['sections']):
+            return False
+        if max_age is not None and time.time() - entry['timestamp'] > max_age:
+            return False
+        try:
+            return file_hash(json_file) == entry['hash']
+        except OSError:
+            return False
+
+
+    def saved_source(self, number, json_file):
+        """
+        The page and section hashes recorded for a Pokémon whose JSON file
+        is still the one saved with them, or None
+        """
+        entry = self.entries.get(number)
+        if not entry or entry.get('status') != 'ok' or 'source' not in entry:
+            return None
+        try:
+            return entry['source'] if file_hash(json_file) == entry['hash'] else None
+        except OSError:
+            return None
+
+
+def file_hash(path):
+    """SHA-256 of a file's contents"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from output_sink import OutputSink
+
+
+class SpritePipeline:
+    """
+    Background stage that downloads sprite images
+
+    Sprites are submitted in per-Pokémon batches and downloaded by a pool of
+    their own, so page parsing never waits for images. With defer=True the
+    batches are only queued and downloaded when finish() is called, after the
+    data pass.
+    """
+
+    def __init__(self, fetch, cache=None, workers=4, defer=False, timer=None, sink=None):
+        # fetch(url) returns the body of url (the scraper's cached fetch)
+        self.fetch = fetch
+        # Optional ResponseCache, used to tell whether a local file is current
+        self.cache = cache
+        self.workers = max(1, workers)
+        self.defer = defer
+        # Optional StageTimer that records a 'sprite' span per download
+        self.timer = timer
+        # OutputSink that writes the images atomically, shared with the scraper
+        self.sink = sink or OutputSink()
+        self.stats = {'downloaded': 0, 'skipped': 0, 'failed': 0}
+        self._lock = threading.Lock()
+        self._executor = None
+        self._futures = []
+        self._deferred = []
+
+    def submit_batch(self, jobs):
+        """
+        Schedule a batch of (url, local_path) downloads
+        """
+        jobs = list(jobs)
+        if self.defer:
+            with self._lock:
+                self._deferred.extend(jobs)
+            return
+        self._schedule(jobs)
+
+    def _schedule(self, jobs):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers)
+            for url, local_path in jobs:
+                self._futures.append(self._executor.submit(self.download, url, local_path))
+
+    def finish(self):
+        """
+        Download anything deferred, wait for all pending sprites and
+        return the download statistics
+        """
+        with self._lock:
+            deferred, self._deferred = self._deferred, []
+        if deferred:
+            print(f"Downloading {len(deferred)} deferred sprites...")
+            self._schedule(deferred)
+
+        with self._lock:
+            executor, futures = self._executor, self._futures
+            self._executor, self._futures = None, []
+        if executor is not None:
+            wait(futures)
+            executor.shutdown()
+        return dict(self.stats)
+
+    def is_current(self, url, local_path):
+        """
+        Check whether local_path already holds the image for url
+
+        When the cache knows the url, the file must match the cached size and
+        hash; otherwise any non-empty file counts as present.
+        """
+        try:
+            size = os.path.getsize(local_path)
+        except OSError:
+            return False
+        if size == 0:
+            return False
+
+        entry = self.cache.entry(url) if self.cache else None
+        if entry is None:
+            return True
+        if entry['size'] != size:
+            return False
+        with open(local_path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest() == entry['body']
+
+    def download(self, url, local_path):
+        """
+        Download one image to local_path unless it is already there
+        """
+        if self.is_current(url, local_path):
+            self._count('skipped')
+            return True
+
+        try:
+            start = time.perf_counter()
+            content = self.fetch(url)
+
+            # Written atomically, so a crash never leaves a truncated image
+            self.sink.write(local_path, content)
+            if self.timer:
+                self.timer.record('sprite', time.perf_counter() - start)
+            self._count('downloaded')
+            return True
+        except Exception as e:
+            print(f"Error downloading {url}: {e}")
+            self._count('failed')
+        return False
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
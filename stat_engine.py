@@ -0,0 +1,142 @@
+"""
+Gen 1 stat calculator over the whole Pokédex at once (needs NumPy)
+
+StatEngine loads every Pokémon's base stats into one int array and computes
+HP, Attack, Defense, Special and Speed with the Red/Blue/Yellow formula for
+any level, DV spread and Stat Exp, broadcasting over grids of them:
+
+    engine = StatEngine.load("data/gen1/gen1_pokedex.json")
+    engine.calculate(level=50)                           # 151 x 5, max DVs
+    engine.calculate(level=np.arange(1, 101))            # 151 x 100 x 5
+    engine.check()                                       # against max_stats
+
+NumPy is optional for the scraper itself: pip install numpy to use this.
+"""
+
+import numpy as np
+
+from pokedex_query import RowIndex, dex_key, in_dex_order, load_pokedex
+
+# Stats in the order the Gen 1 Stats table lists them (Gen1Scraper.STATS)
+STATS = ('HP', 'Attack', 'Defense', 'Special', 'Speed')
+MAX_DV = 15
+MAX_STAT_EXP = 65535
+
+
+def stat_exp_bonus(stat_exp):
+    """
+    Points a stat gains from Stat Exp: the square root rounded up, capped
+    at 255 as the game does, divided by 4
+    """
+    stat_exp = np.asarray(stat_exp, dtype=np.int64)
+    return np.minimum(np.ceil(np.sqrt(stat_exp)).astype(np.int64), 255) // 4
+
+
+def dv_spread(attack, defense, special, speed):
+    """
+    DVs as an array whose last axis follows STATS, with the HP DV made from
+    the lowest bit of the Attack, Defense, Speed and Special DVs
+    """
+    attack, defense, special, speed = np.broadcast_arrays(attack, defense, special, speed)
+    hp = (attack & 1) << 3 | (defense & 1) << 2 | (speed & 1) << 1 | (special & 1)
+    return np.stack([hp, attack, defense, special, speed], axis=-1).astype(np.int64)
+
+
+def to_int(text):
+    """A scraped value such as "45" as an int; 0 if missing or unreadable"""
+    try:
+        return int(text)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_range(text):
+    """A max-stat cell such as "95 - 141" as (95, 141), or None"""
+    low, _, high = str(text).partition('-')
+    try:
+        return int(low), int(high)
+    except ValueError:
+        return None
+
+
+class StatEngine:
+    """
+    Base stats of every Pokémon as an int array, base[i, j] being Pokémon
+    i's base value for STATS[j]
+    """
+
+    def __init__(self, pokedex):
+        self.pokedex = in_dex_order(pokedex)
+        self.names = [pokemon.get('name') for pokemon in self.pokedex]
+        self.numbers = np.array([dex_key(pokemon.get('number')) or 0 for pokemon in self.pokedex])
+        self.base = np.array([[to_int(pokemon.get('stats', {}).get('base_stats', {}).get(stat))
+                               for stat in STATS] for pokemon in self.pokedex],
+                             dtype=np.int64).reshape(len(self.pokedex), len(STATS))
+        self.index = RowIndex(self.pokedex)
+
+    @classmethod
+    def load(cls, path="data/gen1/gen1_pokedex.json"):
+        """Build the engine from a Pokédex written by the scraper"""
+        return cls(load_pokedex(path))
+
+    def rows(self, pokemon):
+        """Row indexes of Pokémon given by name or Pokédex number"""
+        return np.array(self.index.rows(pokemon), dtype=int)
+
+    def calculate(self, level=100, dvs=MAX_DV, stat_exp=0, pokemon=None):
+        """
+        Stats of every Pokémon (or only pokemon, by name or number)
+
+        level is a number or an array. dvs is one DV used for Attack,
+        Defense, Special and Speed, or an array from dv_spread whose last
+        axis follows STATS. stat_exp is one value for every stat or an array
+        whose last axis follows STATS. Their other axes broadcast together
+        into a grid of configurations, so the result has the shape
+        (Pokémon, *grid, 5).
+        """
+        base = self.base if pokemon is None else self.base[self.rows(pokemon)]
+        level = np.asarray(level, dtype=np.int64)[..., None]
+        dvs = np.asarray(dvs, dtype=np.int64)
+        if dvs.ndim == 0:
+            dvs = dv_spread(dvs, dvs, dvs, dvs)
+        bonus = stat_exp_bonus(stat_exp)
+        if bonus.ndim == 0:
+            bonus = np.broadcast_to(bonus, len(STATS))
+
+        grid = np.broadcast_shapes(level.shape[:-1], dvs.shape[:-1], bonus.shape[:-1])
+        # One leading axis for the Pokémon, one trailing axis for the stats
+        base = base.reshape((len(base),) + (1,) * len(grid) + (len(STATS),))
+        stats = ((base + dvs) * 2 + bonus) * level // 100 + 5
+        # HP also gets the level and 5 more on top
+        stats[..., 0] += level[..., 0] + 5
+        return stats
+
+    def stat_ranges(self, level):
+        """
+        Lowest and highest possible stats at level, as the Pokédex pages
+        show them: no DVs or Stat Exp, against all 15 DVs and full Stat Exp
+        """
+        low = self.calculate(level, dvs=0, stat_exp=0)
+        high = self.calculate(level, dvs=MAX_DV, stat_exp=MAX_STAT_EXP)
+        return low, high
+
+    def check(self):
+        """
+        Compare the calculated ranges with the scraped max_stats rows
+
+        Returns (name, level key, stat, scraped, calculated) for every
+        cell that disagrees; Pokémon without max_stats are skipped.
+        """
+        mismatches = []
+        for level_key, level in (('lv_50', 50), ('lv_100', 100)):
+            low, high = self.stat_ranges(level)
+            for row, pokemon in enumerate(self.pokedex):
+                scraped = pokemon.get('stats', {}).get('max_stats', {}).get(level_key, {})
+                for column, stat in enumerate(STATS):
+                    if stat not in scraped:
+                        continue
+                    calculated = (int(low[row, column]), int(high[row, column]))
+                    if parse_range(scraped[stat]) != calculated:
+                        mismatches.append((self.names[row], level_key, stat, scraped[stat],
+                                           f"{calculated[0]} - {calculated[1]}"))
+        return mismatches
@@ -1,26 +1,641 @@
-from pokemon_scraper import scrape_pokemon_page, save_to_json
+from concurrent.futures import ThreadPoolExecutor
+from gen1_scraper import Gen1Scraper
 import json
+import os
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def read_page(number):
+    """A saved Serebii page from fixtures/serebii, as bytes"""
+    with open(os.path.join(FIXTURE_DIR, "serebii", f"{number}.shtml"), 'rb') as f:
+        return f.read()
+
+
+def read_pages(*numbers):
+    return {number: read_page(number) for number in numbers}
+
+
+def parse_fixture(number, parser=None):
+    """
+    Parse a saved Serebii page from fixtures/serebii without touching the network
+    """
+    return Gen1Scraper(parser=parser).parse_pokemon_page(read_page(number))
+
+
+def load_expected(number):
+    with open(os.path.join(FIXTURE_DIR, "expected", f"{number}.json"), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def fixture_fetch(pages, fetched=None, broken=()):
+    """
+    A stand-in for Gen1Scraper.fetch serving pages (number -> page, looked
+    up on every call) and b'PNG' for sprites; the numbers of fetched pages
+    are appended to fetched, and pages in broken raise ConnectionError
+    """
+    def fetch(url, throttle=False):
+        if not url.endswith('.shtml'):
+            return b'PNG'
+        number = url[-9:-6]
+        if fetched is not None:
+            fetched.append(number)
+        if number in broken:
+            raise ConnectionError(f"connection reset on {number}")
+        return pages[number]
+    return fetch
+
+
+def make_response(status, content=b"page", headers=None):
+    """A requests.Response with a status, body and headers, for stub sessions"""
+    import requests
+    
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = content
+    return response
+
 
 def test_single_pokemon():
     """
-    Test the scraper on a single Pokémon page
+    Test the parser on the saved Bulbasaur page
+    """
+    pokemon_data = parse_fixture("001")
+    
+    assert pokemon_data['name'] == "Bulbasaur"
+    assert pokemon_data['types'] == ["Grass", "Poison"]
+    assert pokemon_data['stats']['base_stats']['HP'] == "45"
+    assert pokemon_data == load_expected("001")
+
+
+def test_all_fixtures():
+    """
+    Every saved page parses to exactly its expected JSON, with every parser backend
+    """
+    from parser_backend import available_backends
+    
+    for filename in sorted(os.listdir(os.path.join(FIXTURE_DIR, "serebii"))):
+        number = filename.replace('.shtml', '')
+        expected = json.dumps(load_expected(number), indent=2, ensure_ascii=False)
+        for parser in available_backends():
+            pokemon_data = parse_fixture(number, parser)
+            assert json.dumps(pokemon_data, indent=2, ensure_ascii=False) == expected, (number, parser)
+
+
+def test_evolution_graph():
+    """
+    A family's chain is parsed once and the graph links both directions
+    """
+    scraper = Gen1Scraper()
+    pokedex = []
+    for number in ("133", "134", "135", "136"):
+        pokedex.append(scraper.parse_pokemon_page(read_page(number)))
+    
+    assert scraper.evolution_graph.stats == {'parsed': 1, 'reused': 3}
+    graph = scraper.evolution_graph.build(pokedex)
+    for evo in graph["133"]['evolves_into']:
+        assert any(pevo['mon'] == "133" for pevo in graph[evo['mon']]['evolves_from'])
+
+
+def test_normalized_moves():
+    """
+    Normalized learnsets only refer to moves, and expand back to the full output
+    """
+    scraper = Gen1Scraper(normalize_moves=True)
+    for number in ("001", "002"):
+        pokemon_data = scraper.parse_pokemon_page(read_page(number))
+        
+        assert pokemon_data['moves']['tm_moves'][0] == {'tm_number': 'TM03', 'move': 'swordsdance'}
+        assert scraper.move_table.expand(pokemon_data) == load_expected(number)
+    assert scraper.move_table.stats['reused'] > 0
+
+
+def test_profiler_workers(tmp_path):
+    """
+    Pages parsed by several workers at once are each profiled, one at a time
+    """
+    from instrumentation import PageProfiler
+    
+    profiler = PageProfiler('cprofile', str(tmp_path))
+    scraper = Gen1Scraper(workers=4, delay=0, profiler=profiler)
+    pages = read_pages("001", "002", "003", "025")
+    scraper.fetch = fixture_fetch(pages)
+    scraper.queue_sprites = lambda pokemon_number: None
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda number: scraper.scrape_pokemon_page(
+            scraper.page_url(int(number)), number), pages))
+    assert results == [load_expected(number) for number in pages]
+    assert sorted(os.listdir(tmp_path)) == [f"{number}.prof" for number in pages]
+
+
+def test_response_cache(tmp_path, monkeypatch):
+    """
+    Conditional revalidation, offline hits and misses, and LRU eviction of shared bodies
+    """
+    import hashlib
+    import itertools
+    import pytest
+    import http_cache
+    from http_cache import CacheMissError, ResponseCache
+    
+    clock = itertools.count(1000)
+    monkeypatch.setattr(http_cache.time, 'time', lambda: next(clock))
+    
+    requests_sent = []
+    def get(headers):
+        requests_sent.append(headers)
+        return responses.pop(0)
+    
+    directory = str(tmp_path / "cache")
+    cache = ResponseCache(directory, ttl=3600)
+    responses = [make_response(200, b"page", {'ETag': '"v1"', 'Last-Modified': 'Mon, 01 Jan 2024 00:00:00 GMT'})]
+    assert cache.fetch("https://example.com/001.shtml", get) == b"page"
+    assert cache.fetch("https://example.com/001.shtml", get) == b"page"
+    assert requests_sent == [{}]
+    
+    cache.ttl = 0
+    responses = [make_response(304, b"", {'ETag': '"v2"'})]
+    assert cache.fetch("https://example.com/001.shtml", get) == b"page"
+    assert requests_sent[-1] == {'If-None-Match': '"v1"', 'If-Modified-Since': 'Mon, 01 Jan 2024 00:00:00 GMT'}
+    assert cache.entry("https://example.com/001.shtml")['etag'] == '"v2"'
+    assert cache.stats == {'hits': 1, 'revalidated': 1, 'misses': 1, 'evicted': 0}
+    
+    offline = ResponseCache(directory, ttl=0, offline=True)
+    assert offline.fetch("https://example.com/001.shtml", get) == b"page"
+    with pytest.raises(CacheMissError):
+        offline.fetch("https://example.com/002.shtml", get)
+    assert len(requests_sent) == 2
+    
+    # Two URLs share one body; it is only deleted with the last of them
+    small = ResponseCache(str(tmp_path / "small"), max_bytes=10)
+    small.store("https://example.com/a.png", b"12345")
+    small.store("https://example.com/b.png", b"12345")
+    small.store("https://example.com/c.png", b"abcdefgh")
+    assert small.entry("https://example.com/a.png") is None
+    assert small.entry("https://example.com/b.png") is None
+    assert small.entry("https://example.com/c.png") is not None
+    assert small.stats['evicted'] == 2 and small.total_bytes() == 8
+    assert not os.path.exists(small._body_path(hashlib.sha256(b"12345").hexdigest()))
+    assert os.path.exists(small._body_path(hashlib.sha256(b"abcdefgh").hexdigest()))
+
+
+def test_sprite_pipeline(tmp_path):
+    """
+    Deferred sprites wait for finish(); present files are skipped unless they
+    differ from the cached copy, and failed downloads are counted
+    """
+    from http_cache import ResponseCache
+    from sprite_pipeline import SpritePipeline
+    
+    cache = ResponseCache(str(tmp_path / "cache"))
+    cache.store("https://example.com/stale.png", b"new image")
+    fetched = []
+    
+    def fetch(url):
+        fetched.append(url)
+        if url.endswith("broken.png"):
+            raise ConnectionError("connection reset")
+        return b"new image" if url.endswith("stale.png") else url.encode()
+    
+    sprites = tmp_path / "sprites"
+    sprites.mkdir()
+    (sprites / "present.png").write_bytes(b"old image")
+    (sprites / "stale.png").write_bytes(b"old image")
+    
+    pipeline = SpritePipeline(fetch, cache=cache, workers=2, defer=True)
+    pipeline.submit_batch((f"https://example.com/{name}", str(sprites / name))
+                          for name in ("present.png", "stale.png", "new.png", "broken.png"))
+    assert fetched == []
+    
+    assert pipeline.finish() == {'downloaded': 2, 'skipped': 1, 'failed': 1}
+    assert sorted(fetched) == [f"https://example.com/{name}" for name in ("broken.png", "new.png", "stale.png")]
+    assert (sprites / "present.png").read_bytes() == b"old image"
+    assert (sprites / "stale.png").read_bytes() == b"new image"
+    assert (sprites / "new.png").read_bytes() == b"https://example.com/new.png"
+    assert not (sprites / "broken.png").exists()
+
+
+def test_pokedex_writer(tmp_path):
+    """
+    The streamed Pokédex reads back record by record and its JSON array
+    matches json.dump; a cut-off partial file yields its complete records
+    """
+    from pokedex_writer import PokedexWriter, read_pokedex
+    
+    pokedex = [load_expected("001"), load_expected("025")]
+    ndjson_path = str(tmp_path / "gen1_pokedex.ndjson")
+    array_path = str(tmp_path / "gen1_pokedex.json")
+    with PokedexWriter(ndjson_path, array_path=array_path) as writer:
+        for pokemon_data in pokedex:
+            writer.write(pokemon_data)
+    
+    assert list(read_pokedex(ndjson_path)) == pokedex
+    with open(array_path, 'r', encoding='utf-8') as f:
+        assert f.read() == json.dumps(pokedex, indent=2, ensure_ascii=False)
+    
+    with open(ndjson_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    partial_path = tmp_path / "cut.ndjson"
+    partial_path.write_text(text[:-40], encoding='utf-8')
+    assert list(read_pokedex(str(partial_path))) == pokedex[:1]
+    
+    # --compact uses the OutputSink layout for the array and the NDJSON lines alike
+    from output_sink import OutputSink
+    with PokedexWriter(ndjson_path, array_path=array_path, compact=True) as writer:
+        writer.write(pokedex[0])
+    compact = OutputSink(compact=True).dumps(pokedex[0])
+    with open(array_path, 'r', encoding='utf-8') as f:
+        assert f.read() == f"[\n{compact}\n]"
+    with open(ndjson_path, 'r', encoding='utf-8') as f:
+        assert f.read() == compact + '\n'
+
+
+def test_sqlite_export(tmp_path):
+    """
+    The SQLite export stores stats and type multipliers as numbers
+    """
+    import sqlite3
+    from dataset_export import export_sqlite
+    
+    path = str(tmp_path / "gen1_pokedex.sqlite")
+    export_sqlite([load_expected("001"), load_expected("002")], path)
+    connection = sqlite3.connect(path)
+    
+    assert connection.execute("SELECT base FROM stats WHERE number = 1 AND stat = 'HP'").fetchone() == (45,)
+    assert connection.execute("SELECT height_in, weight_lbs FROM pokemon WHERE number = 1").fetchone() == (28, 15.2)
+    assert connection.execute("SELECT multiplier FROM type_effectiveness "
+                              "WHERE number = 1 AND attacking_type = 'Bug'").fetchone() == (4.0,)
+    assert connection.execute("SELECT to_number, level FROM evolutions WHERE from_number = 1 "
+                              "ORDER BY to_number").fetchall() == [(2, 16), (3, 32)]
+    connection.close()
+
+
+def test_records_round_trip():
+    """
+    Typed records hold numbers and give back exactly the JSON they were read from
+    """
+    from records import Pokemon, load_records
+    
+    pokedex = [load_expected(filename.replace('.json', ''))
+               for filename in sorted(os.listdir(os.path.join(FIXTURE_DIR, "expected")))]
+    records = load_records(pokedex)
+    
+    bulbasaur = records[0]
+    assert bulbasaur.number == 1
+    assert bulbasaur.base_stats.hp == 45
+    assert bulbasaur.damage_taken['Grass'] == 0.25
+    assert bulbasaur.learnset[0].learned is None
+    for pokemon, record in zip(pokedex, records):
+        assert json.dumps(record.to_json(), ensure_ascii=False) == json.dumps(pokemon, ensure_ascii=False)
+    
+    # Records saved by a --fields run only give back their own keys
+    partial = {field: pokedex[-4][field] for field in ('name', 'number', 'types', 'pevos', 'evos', 'stats')}
+    assert json.dumps(Pokemon.from_json(partial).to_json()) == json.dumps(partial)
+
+
+def test_training_text_fallback():
+    """
+    Pages without separate training cells are still read from the page text
+    """
+    scraper = Gen1Scraper()
+    page_text = "1,059,860 Points\nMedium Slow\n45 Hit Points49 Attack49 Defense 65 Special45 Speed"
+    experience_growth, effort_values = scraper.search_training_text(page_text)
+    
+    assert experience_growth == {'points': '1,059,860', 'rate': 'Medium Slow'}
+    assert effort_values == {'HP': '45', 'Attack': '49', 'Defense': '49', 'Special': '65', 'Speed': '45'}
+    
+    # A broad growth match does not hide a later single-stat effort value
+    assert scraper.search_training_text("0Points1 Speed1,059,860PointsMedium Slow") == (
+        {'points': '0', 'rate': 'Medium Slow'}, {'Speed': '1'})
+    # "Points <rate>" anywhere wins over an earlier "Points<rate>"
+    assert scraper.search_training_text("1 PointsFast\n2 Points Slow")[0] == {'points': '2', 'rate': 'Slow'}
+    assert scraper.search_training_text("12 Attack") == ({}, {'Attack': '12'})
+
+
+def test_retry_after_throttling():
+    """
+    A 429 pauses the rate limiter for its Retry-After and the request is retried
+    """
+    import requests
+    
+    class FakeSession:
+        def __init__(self):
+            self.responses = [make_response(429, headers={'Retry-After': '0'}), make_response(503),
+                              make_response(200)]
+        
+        def get(self, url, headers=None):
+            return self.responses.pop(0)
+    
+    scraper = Gen1Scraper(delay=0, backoff_base=0.01)
+    scraper.session = FakeSession()
+    assert scraper.fetch("https://example.com/001.shtml", throttle=True) == b"page"
+    assert scraper.rate_limiter.interval > 0
+    
+    scraper.session.responses = [make_response(503)] * 2
+    scraper.max_retries = 1
+    try:
+        scraper.fetch("https://example.com/002.shtml", throttle=True)
+        assert False, "the last 503 should be raised"
+    except requests.HTTPError:
+        pass
+
+
+def test_sprites_share_rate_limit(tmp_path):
+    """
+    Sprite downloads that reach the server wait for the page rate limiter; cached ones do not
+    """
+    from http_cache import ResponseCache
+    
+    class FakeSession:
+        def get(self, url, headers=None):
+            return make_response(200, b"PNG")
+    
+    scraper = Gen1Scraper(delay=0, cache=ResponseCache(str(tmp_path / "cache")))
+    scraper.session = FakeSession()
+    waits = []
+    scraper.rate_limiter.wait = lambda: waits.append(True)
+    
+    path = str(tmp_path / "sprites" / "rb001.png")
+    assert scraper.download_image("https://www.serebii.net/pokearth/sprites/rb/001.png", path)
+    os.remove(path)
+    assert scraper.download_image("https://www.serebii.net/pokearth/sprites/rb/001.png", path)
+    assert len(waits) == 1
+
+
+def test_output_sink(tmp_path):
+    """
+    Files are only rewritten when their content changes
+    """
+    from output_sink import OutputSink
+    
+    path = str(tmp_path / "001" / "001.json")
+    sink = OutputSink()
+    first_hash = sink.write_json(path, {'name': 'Bulbasaur'})
+    assert sink.write_json(path, {'name': 'Bulbasaur'}) == first_hash
+    assert OutputSink().write_json(path, {'name': 'Bulbasaur'}) == first_hash
+    assert sink.stats == {'written': 1, 'unchanged': 1}
+    
+    compact = OutputSink(compact=True)
+    compact.write_json(path, {'name': 'Bulbasaur'})
+    with open(path, 'r', encoding='utf-8') as f:
+        assert f.read() == '{"name":"Bulbasaur"}'
+    assert os.listdir(tmp_path / "001") == ["001.json"]
+
+
+def test_generation_plan():
+    """
+    A dex range is split by the generation that introduced each Pokémon
+    """
+    from generations import GENERATIONS, parse_numbers, plan_run, scraper_class
+    
+    numbers = parse_numbers("25,150-153", 1025)
+    assert plan_run(None, numbers) == [(1, [25, 150, 151]), (2, [152, 153])]
+    assert plan_run([1]) == [(1, list(range(1, 152)))]
+    assert scraper_class(1) is Gen1Scraper
+    assert GENERATIONS[1][1:] == (Gen1Scraper.DEX_PATH, Gen1Scraper.FIRST_NUMBER, Gen1Scraper.LAST_NUMBER)
+    assert Gen1Scraper(numbers=[25]).page_url(25) == "https://www.serebii.net/pokedex/025.shtml"
+
+
+def test_parse_processes():
+    """
+    Pages parsed in worker processes give the same output
+    """
+    scraper = Gen1Scraper(parse_processes=1)
+    with scraper.parse_stage() as pool:
+        pokemon_data = pool.parse(read_page("001"))
+    
+    assert pokemon_data == load_expected("001")
+    assert scraper.parse_pool is None
+    assert scraper.timer.summary()['parse']['count'] == 1
+
+
+def test_selected_fields():
+    """
+    With fields, only the sections behind them are extracted
+    """
+    import pytest
+
+    scraper = Gen1Scraper(fields=['types', 'stats', 'evos'])
+    pokemon_data = scraper.parse_pokemon_page(read_page("133"))
+
+    expected = load_expected("133")
+    assert list(pokemon_data) == ['name', 'number', 'types', 'pevos', 'evos', 'stats']
+    assert pokemon_data == {field: expected[field] for field in pokemon_data}
+    assert 'extract.moves' not in scraper.timer.summary()
+    assert not scraper.want_sprites
+    assert scraper.sections == ('name', 'types', 'evos', 'stats')
+
+    scraper = Gen1Scraper(fields=['damage_taken', 'sprites'])
+    assert scraper.sections == ('name', 'damage') and scraper.want_sprites
+    with pytest.raises(ValueError):
+        Gen1Scraper(fields=['shininess'])
+
+
+def test_selected_fields_keep_saved_records(tmp_path, monkeypatch):
+    """
+    A fields run after a full one updates its fields and loses nothing else
+    """
+    monkeypatch.chdir(tmp_path)
+    pages = read_pages("001", "002", "003")
+
+    def run(**options):
+        scraper = Gen1Scraper(delay=0, numbers=[1, 2, 3], export_sqlite=True, **options)
+        scraper.fetch = fixture_fetch(pages)
+        return scraper.scrape_all()
+
+    def read(*path):
+        with open(os.path.join("data", "gen1", *path), 'rb') as f:
+            return f.read()
+
+    expected = [load_expected(number) for number in pages]
+    assert run() == expected
+    graph, sqlite = read("evolution_graph.json"), read("gen1_pokedex.sqlite")
+
+    pages['002'] = pages['002'].replace(b'/pokedex-bw/type/poison.gif', b'/pokedex-bw/type/fire.gif')
+    expected[1]['types'] = ["Grass", "Fire"]
+    assert run(fields=['types']) == expected
+    assert [json.loads(read(number, f"{number}.json")) for number in pages] == expected
+    assert json.loads(read("gen1_pokedex.json")) == expected
+    assert read("evolution_graph.json") == graph
+    assert read("gen1_pokedex.sqlite") == sqlite
+    manifest = json.loads(read("manifest.json"))
+    assert not any('sections' in entry for entry in manifest.values())
+
+
+def test_resume(tmp_path, monkeypatch):
+    """
+    A resumed run retries the Pokémon that failed, skips the fresh ones, and
+    the Pokédex can be rebuilt without fetching anything
+    """
+    monkeypatch.chdir(tmp_path)
+    pages = read_pages("001", "002", "003")
+    fetched, broken = [], {'002'}
+    fetch = fixture_fetch(pages, fetched, broken)
+
+    def run(resume):
+        scraper = Gen1Scraper(delay=0, numbers=[1, 2, 3], resume=resume, retry_rounds=0)
+        scraper.fetch = fetch
+        return scraper, scraper.scrape_all()
+
+    scraper, pokedex = run(resume=False)
+    assert [pokemon_data['number'] for pokemon_data in pokedex] == ['001', '003']
+    assert scraper.manifest.failed_numbers() == ['002']
+    assert scraper.manifest.entries['002']['error'] == "connection reset on 002"
+
+    broken.clear()
+    fetched.clear()
+    scraper, pokedex = run(resume=True)
+    expected = [load_expected(number) for number in pages]
+    assert fetched == ['002']
+    assert pokedex == expected
+    assert scraper.manifest.failed_numbers() == []
+
+    broken.update(pages)
+    scraper = Gen1Scraper(numbers=[1, 2, 3])
+    scraper.fetch = fetch
+    assert scraper.rebuild_pokedex() == expected
+    assert fetched == ['002']
+
+
+def test_retry_order(tmp_path, monkeypatch):
+    """
+    A Pokémon recovered in an end-of-run retry pass keeps its Pokédex place
+    """
+    monkeypatch.chdir(tmp_path)
+    pages = read_pages("001", "002", "003")
+    broken = {'002'}
+    fetch = fixture_fetch(pages, broken=broken)
+
+    def flaky_fetch(url, throttle=False):
+        try:
+            return fetch(url, throttle)
+        finally:
+            # Only the first attempt at #002 fails
+            if url.endswith('/002.shtml'):
+                broken.clear()
+
+    scraper = Gen1Scraper(delay=0, numbers=[1, 2, 3])
+    scraper.fetch = flaky_fetch
+    expected = [load_expected(number) for number in pages]
+    assert scraper.scrape_all() == expected
+    with open(os.path.join("data", "gen1", "gen1_pokedex.json"), 'r', encoding='utf-8') as f:
+        assert json.load(f) == expected
+
+
+def test_incremental(tmp_path, monkeypatch):
+    """
+    Reruns skip unchanged pages, re-extract only changed sections and report the changes
+    """
+    monkeypatch.chdir(tmp_path)
+    pages = read_pages("001")
+
+    def rerun():
+        scraper = Gen1Scraper(delay=0, incremental=True, numbers=[1])
+        scraper.fetch = fixture_fetch(pages)
+        scraper.scrape_all()
+        return scraper.changes
+
+    assert rerun().new == ['001']
+    assert rerun().stats == {'pages_unchanged': 1, 'sections_reused': 0, 'sections_extracted': 0}
+
+    pages['001'] = pages['001'].replace(b'Base Stats - Total: 253', b'Base Stats - Total: 254')
+    changes = rerun()
+    assert changes.changed == {'001': {'name': 'Bulbasaur', 'fields': ['stats.base_stats.bst']}}
+    # evos, damage, locations and moves come from untouched tables
+    assert changes.stats == {'pages_unchanged': 0, 'sections_reused': 4, 'sections_extracted': 5}
+    with open(os.path.join("data", "gen1", "gen1_changes.json"), 'r', encoding='utf-8') as f:
+        assert json.load(f)['changed'] == changes.changed
+
+    expected = load_expected("001")
+    expected['stats']['base_stats']['bst'] = "254"
+    with open(os.path.join("data", "gen1", "001", "001.json"), 'r', encoding='utf-8') as f:
+        assert json.load(f) == expected
+
+
+def test_pokedex_query():
+    """
+    Indexed lookups by name, type, move, TM, place and family
+    """
+    from pokedex_query import PokedexQuery
+    
+    query = PokedexQuery([load_expected(filename.replace('.json', ''))
+                          for filename in os.listdir(os.path.join(FIXTURE_DIR, "expected"))])
+    names = lambda pokedex: [pokemon['name'] for pokemon in pokedex]
+    
+    assert query.get('PIKACHU')['number'] == "025"
+    assert query.get(25)['name'] == "Pikachu"
+    assert names(query.of_type('electric')) == ['Pikachu', 'Raichu', 'Jolteon']
+    assert names(query.learns('Thunder Shock')) == ['Pikachu', 'Raichu', 'Jolteon']
+    assert len(query.tm(6)) == 9
+    assert names(query.at('Power Plant')) == ['Pikachu']
+    assert query.at('Power Plant', game='Blue (Jp.)') == []
+    assert names(query.family('Jolteon')) == ['Eevee', 'Vaporeon', 'Jolteon', 'Flareon']
+
+
+def test_type_matrix():
+    """
+    Batch matchups from the compiled type-effectiveness matrix
+    """
+    import pytest
+    pytest.importorskip("numpy")
+    from type_matrix import TypeMatrix
+    
+    matrix = TypeMatrix([load_expected(filename.replace('.json', ''))
+                         for filename in os.listdir(os.path.join(FIXTURE_DIR, "expected"))])
+    assert matrix.multipliers.shape == (9, 15)
+    assert matrix.multipliers[matrix.rows(['Bulbasaur'])[0], matrix.column('Bug')] == 4.0
+    assert matrix.best_attacking_types(['Bulbasaur', 'Pikachu'], 1) == [('Bug', 2.5)]
+    
+    scores = matrix.stab_matchups(attackers=['Pikachu'], defenders=['Vaporeon', 'Bulbasaur'])
+    assert scores.tolist() == [[2.0, 0.5]]
+    assert matrix.team_coverage(['Pikachu', 'Flareon'])['Venusaur'] == 2.0
+
+
+def test_stat_engine():
+    """
+    Calculated Gen 1 stats against the scraped max-stat ranges
+    """
+    import pytest
+    np = pytest.importorskip("numpy")
+    from stat_engine import STATS, StatEngine, dv_spread
+    
+    assert STATS == Gen1Scraper.STATS
+
+    engine = StatEngine([load_expected(filename.replace('.json', ''))
+                         for filename in os.listdir(os.path.join(FIXTURE_DIR, "expected"))])
+    # Serebii lists Jolteon's and Flareon's Lv. 100 HP as if their base HP were 70
+    assert sorted((name, level_key, stat) for name, level_key, stat, _, _ in engine.check()) == [
+        ('Flareon', 'lv_100', 'HP'), ('Jolteon', 'lv_100', 'HP')]
+
+    assert engine.calculate(50, pokemon=['Pikachu']).tolist() == [[110, 75, 50, 70, 110]]
+    assert dv_spread(9, 8, 8, 8).tolist() == [8, 9, 8, 8, 8]
+    assert engine.calculate(level=np.arange(1, 101), pokemon=[25, 133]).shape == (2, 100, 5)
+
+
+def scrape_live_bulbasaur():
+    """
+    Test the scraper on the live Bulbasaur page
     """
     print("Testing scraper on Bulbasaur page...")
     
     # Test with Bulbasaur
-    url = "https://www.serebii.net/pokedex/001.shtml"
-    pokemon_data = scrape_pokemon_page(url)
+    scraper = Gen1Scraper()
+    url = f"{scraper.base_url}/001.shtml"
+    pokemon_data = scraper.scrape_pokemon_page(url)
     
     if pokemon_data:
         print("✓ Successfully scraped Pokémon data!")
         print("\nExtracted data:")
         print(json.dumps(pokemon_data, indent=2, ensure_ascii=False))
         
-        # Save test data using the proper folder structure
-        save_to_json(pokemon_data, 'test_bulbasaur.json')
+        # Save test data next to this script
+        with open('test_bulbasaur.json', 'w', encoding='utf-8') as f:
+            json.dump(pokemon_data, f, indent=2, ensure_ascii=False)
         
     else:
         print("✗ Failed to scrape Pokémon data")
 
 if __name__ == "__main__":
-    test_single_pokemon()
+    scrape_live_bulbasaur()
@@ -0,0 +1,113 @@
+"""
+Type-effectiveness matrix for batch matchup queries (needs NumPy)
+
+TypeMatrix compiles the damage_taken multipliers of a scraped Pokédex into
+one dense float matrix, one row per Pokémon and one column per attacking
+type, parsed once. Matchups for a team or the whole Pokédex are then
+vectorized NumPy operations instead of string parsing in Python loops:
+
+    matrix = TypeMatrix.load("data/gen1/gen1_pokedex.json")
+    matrix.best_attacking_types(["Gyarados", "Onix", "Gengar"])
+    matrix.stab_matchups()            # 151 x 151 scores
+
+NumPy is optional for the scraper itself: pip install numpy to use this.
+"""
+
+import numpy as np
+
+from pokedex_query import RowIndex, dex_key, in_dex_order, load_pokedex
+
+
+def to_multiplier(text):
+    """A damage_taken value such as "0.5" (or "*0.5") as a float; NaN if unreadable"""
+    try:
+        return float(str(text).lstrip('*'))
+    except ValueError:
+        return float('nan')
+
+
+class TypeMatrix:
+    """
+    Dense damage multipliers of every Pokémon against every attacking type
+
+    multipliers[i, j] is the damage Pokémon i takes from attacking type j
+    (NaN where the page had no value). stab[i, j] is True when attacking
+    type j is one of Pokémon i's own types, i.e. its attacks of that type
+    get the same-type bonus.
+    """
+
+    def __init__(self, pokedex):
+        pokedex = in_dex_order(pokedex)
+        self.names = [pokemon.get('name') for pokemon in pokedex]
+        self.numbers = np.array([dex_key(pokemon.get('number')) or 0 for pokemon in pokedex])
+        # Attacking types in the order the pages list them
+        types = {}
+        for pokemon in pokedex:
+            for attacking_type in pokemon.get('damage_taken', {}):
+                types.setdefault(attacking_type, len(types))
+        self.types = list(types)
+
+        self.multipliers = np.full((len(pokedex), len(self.types)), np.nan)
+        self.stab = np.zeros((len(pokedex), len(self.types)), dtype=bool)
+        for row, pokemon in enumerate(pokedex):
+            for attacking_type, multiplier in pokemon.get('damage_taken', {}).items():
+                self.multipliers[row, types[attacking_type]] = to_multiplier(multiplier)
+            for own_type in pokemon.get('types', []):
+                if own_type in types:
+                    self.stab[row, types[own_type]] = True
+
+        self.index = RowIndex(pokedex)
+
+    @classmethod
+    def load(cls, path="data/gen1/gen1_pokedex.json"):
+        """Build the matrix from a Pokédex written by the scraper"""
+        return cls(load_pokedex(path))
+
+    def rows(self, pokemon):
+        """Row indexes of Pokémon given by name or Pokédex number"""
+        return np.array(self.index.rows(pokemon), dtype=int)
+
+    def column(self, attacking_type):
+        return self.types.index(attacking_type)
+
+    def attack_scores(self, defenders):
+        """
+        Mean multiplier of every attacking type against a set of defenders,
+        as a {type: score} dict
+        """
+        scores = np.nanmean(self.multipliers[self.rows(defenders)], axis=0)
+        return dict(zip(self.types, scores.tolist()))
+
+    def best_attacking_types(self, defenders, count=3):
+        """
+        The count attacking types that do the most damage on average
+        against defenders, best first, as (type, mean multiplier) pairs
+        """
+        scores = np.nanmean(self.multipliers[self.rows(defenders)], axis=0)
+        # Stable, so ties keep the page's type order
+        order = np.argsort(-scores, kind='stable')[:count]
+        return [(self.types[column], float(scores[column])) for column in order]
+
+    def stab_matchups(self, attackers=None, defenders=None):
+        """
+        Matchup scores of attackers against defenders (all Pokémon by
+        default): score[a, d] is the best multiplier any of attacker a's
+        own types gets against defender d
+        """
+        attacker_rows = self.rows(attackers) if attackers is not None else slice(None)
+        defender_rows = self.rows(defenders) if defenders is not None else slice(None)
+        stab = self.stab[attacker_rows]
+        multipliers = self.multipliers[defender_rows]
+        # attackers x defenders x types, keeping only each attacker's own types
+        scores = np.where(stab[:, None, :], multipliers[None, :, :], -np.inf)
+        scores = scores.max(axis=2)
+        scores[np.isneginf(scores)] = np.nan
+        return scores
+
+    def team_coverage(self, team):
+        """
+        For every Pokémon, the best STAB multiplier any team member gets
+        against it, as a {name: multiplier} dict
+        """
+        best = np.nanmax(self.stab_matchups(attackers=team), axis=0)
+        return dict(zip(self.names, best.tolist()))